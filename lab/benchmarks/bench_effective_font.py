@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# bench_effective_font.py
+#
+# Times resolving the effective font of every run in a deck.
+#
+
+"""
+Times reading ``run.effective_font`` for each run of a deck of 300 slides,
+each having a title and a two-level bulleted body placeholder. The first
+case clears the cached layout and master styles before each run, so every
+lookup walks the inheritance chain; the second lets the cache work. Each
+figure is the best of three runs.
+
+Usage: python bench_effective_font.py [slides]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx import Presentation
+
+
+def main(argv):
+    slide_count = int(argv[1]) if len(argv) > 1 else 300
+
+    prs = Presentation()
+    layout = prs.slide_layouts[1]
+    for slide_idx in range(slide_count):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.textframe.text = 'Slide %d' % slide_idx
+        slide.placeholders[1].textframe.set_paragraphs(
+            ['Point %d' % n if n % 2 else ('Detail %d' % n, 1)
+             for n in range(6)]
+        )
+    runs = [
+        run for prs_slide in prs.slides for shape in prs_slide.shapes
+        for paragraph in shape.textframe.paragraphs
+        for run in paragraph.runs
+    ]
+    text_styles = prs._package.text_styles
+
+    def uncached():
+        for run in runs:
+            text_styles.clear()
+            run.effective_font
+
+    def cached():
+        for run in runs:
+            run.effective_font
+
+    print('%-22s %12s' % ('%d runs' % len(runs), 'msec'))
+    for label, func in (('walk each run', uncached),
+                        ('cached styles', cached)):
+        msec = min(timeit.repeat(func, number=1, repeat=3)) * 1e3
+        print('%-22s %12.1f' % (label, msec))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# bench_find_replace.py
+#
+# Times repeated replacements across a 300-slide deck.
+#
+
+"""
+Times ten successive ``prs.replace()`` calls on a deck of 300 slides, each
+having six text boxes, where each call changes the text on a single slide.
+It's compared with the same replacements made by visiting every run through
+the shape, paragraph and run proxies. Each figure is the best of three
+runs.
+
+Usage: python bench_find_replace.py [repetitions]
+"""
+
+from __future__ import print_function
+
+import re
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.util import Inches
+
+
+def main(argv):
+    number = int(argv[1]) if len(argv) > 1 else 3
+
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+    for slide_idx in range(300):
+        slide = prs.slides.add_slide(layout)
+        for shape_idx in range(6):
+            textbox = slide.shapes.add_textbox(0, 0, Inches(4), Inches(1))
+            textbox.textframe.set_paragraphs([
+                'Slide %d shape %d' % (slide_idx, shape_idx),
+                'Quarterly results for region R%d' % slide_idx,
+            ])
+
+    def replace():
+        for idx in range(10):
+            prs.replace('region R%d$' % (idx * 30), 'region R%d' % (idx * 30))
+
+    def visit_runs():
+        for idx in range(10):
+            regex = re.compile('region R%d$' % (idx * 30))
+            for slide in prs.slides:
+                for shape in slide.shapes:
+                    for paragraph in shape.textframe.paragraphs:
+                        for run in paragraph.runs:
+                            text = run.text
+                            if regex.search(text):
+                                run.text = regex.sub(
+                                    'region R%d' % (idx * 30), text
+                                )
+
+    prs.find('warm up the index')
+    print('%-22s %12s' % ('10 replacements', 'msec'))
+    for label, func in (('visit runs', visit_runs),
+                        ('prs.replace()', replace)):
+        msec = min(timeit.repeat(func, number=number, repeat=3))
+        print('%-22s %12.1f' % (label, msec / number * 1e3))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# bench_fit_text.py
+#
+# Times shrinking the text of every shape in a deck to fit its shape.
+#
+
+"""
+Times ``textframe.fit_text()`` on each of 1,000 text boxes, ten on each of
+100 slides, every one holding a heading and two wrapped sentences. The
+figure is the best of three runs, each on a freshly built deck.
+
+Usage: python bench_fit_text.py [slides]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.util import Inches, Pt
+
+
+def build_textframes(slide_count):
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+    textframes = []
+    for slide_idx in range(slide_count):
+        slide = prs.slides.add_slide(layout)
+        for shape_idx in range(10):
+            textbox = slide.shapes.add_textbox(
+                Inches(shape_idx % 2 * 5), Inches(shape_idx // 2 * 1.5),
+                Inches(4.5), Inches(1.4)
+            )
+            textframe = textbox.textframe
+            textframe.word_wrap = True
+            textframe.set_paragraphs([
+                ('Region %d-%d' % (slide_idx, shape_idx), 0, {'bold': True}),
+                'Quarterly revenue grew in every product line we track, '
+                'led by services.',
+                'Costs were flat against the prior quarter.',
+            ])
+            textframes.append(textframe)
+    return textframes
+
+
+def main(argv):
+    slide_count = int(argv[1]) if len(argv) > 1 else 100
+
+    def fit_all(textframes):
+        for textframe in textframes:
+            textframe.fit_text(Pt(28))
+
+    timings = []
+    for _ in range(3):
+        textframes = build_textframes(slide_count)
+        timings.append(timeit.timeit(lambda: fit_all(textframes), number=1))
+    print('%-22s %12s' % ('%d shapes' % (slide_count * 10), 'msec'))
+    print('%-22s %12.1f' % ('fit_text()', min(timings) * 1e3))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# bench_import.py
+#
+
+"""
+Times ``import pptx`` in fresh interpreters, reporting the best of several
+runs, and exits with status 1 when that exceeds the cold-start budget, so it
+can guard the budget in a CI job.
+
+Usage: python bench_import.py [budget_ms] [runs]
+"""
+
+from __future__ import print_function
+
+import os
+import subprocess
+import sys
+
+
+SCRIPT = (
+    'import time; start = time.time(); import pptx; '
+    'print((time.time() - start) * 1e3)'
+)
+
+repo_dir = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..')
+)
+
+
+def import_msec():
+    env = dict(os.environ, PYTHONPATH=repo_dir)
+    process = subprocess.Popen(
+        [sys.executable, '-c', SCRIPT], cwd=repo_dir, env=env,
+        stdout=subprocess.PIPE
+    )
+    output = process.communicate()[0]
+    return float(output)
+
+
+def main(argv):
+    budget_ms = float(argv[1]) if len(argv) > 1 else 120.0
+    runs = int(argv[2]) if len(argv) > 2 else 10
+
+    import_msec()  # warm the OS file cache and write any .pyc files
+    best_ms = min(import_msec() for idx in range(runs))
+    print('import pptx %8.1f ms (budget %.1f ms)' % (best_ms, budget_ms))
+    return 1 if best_ms > budget_ms else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
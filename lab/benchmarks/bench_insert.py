@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# bench_insert.py
+#
+# Times adding a child element in schema sequence to a custom element.
+#
+
+"""
+Times adding a child element in its schema position, the operation behind
+``get_or_add_xfrm()``, ``get_or_change_to_solidFill()`` and adding a shape
+to a shape tree. Each case starts from a fresh parent so the child is
+really inserted. Each figure is the best of five runs.
+
+Usage: python bench_insert.py [repetitions]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx.oxml.ns import nsdecls
+from pptx.oxml import parse_xml_bytes
+
+
+spPr_xml = (
+    '<p:spPr %s><a:prstGeom prst="rect"/><a:ln/><a:effectLst/></p:spPr>'
+    % nsdecls('a', 'p')
+)
+rPr_xml = (
+    '<a:rPr %s><a:ln/><a:latin typeface="Arial"/><a:hlinkClick r:id="rId1"/>'
+    '</a:rPr>' % nsdecls('a', 'r')
+)
+spTree_xml = (
+    '<p:spTree %s><p:nvGrpSpPr/><p:grpSpPr/>%s<p:extLst/></p:spTree>'
+    % (nsdecls('a', 'p'), '<p:sp/>' * 200)
+)
+
+
+def main(argv):
+    number = int(argv[1]) if len(argv) > 1 else 5000
+
+    spPr_tmpl = parse_xml_bytes(spPr_xml)
+    rPr_tmpl = parse_xml_bytes(rPr_xml)
+    spTree_tmpl = parse_xml_bytes(spTree_xml)
+
+    def add_xfrm():
+        spPr = spPr_tmpl.__copy__()
+        spPr.get_or_add_xfrm()
+
+    def add_solidFill():
+        spPr = spPr_tmpl.__copy__()
+        spPr.get_or_change_to_solidFill()
+
+    def add_rPr_solidFill():
+        rPr = rPr_tmpl.__copy__()
+        rPr.get_or_change_to_solidFill()
+
+    def add_textbox():
+        spTree = spTree_tmpl.__copy__()
+        spTree.add_textbox(201, 'TextBox 200', 0, 0, 914400, 914400)
+
+    cases = (
+        ('spPr xfrm', add_xfrm, lambda: spPr_tmpl.__copy__()),
+        ('spPr solidFill', add_solidFill, lambda: spPr_tmpl.__copy__()),
+        ('rPr solidFill', add_rPr_solidFill, lambda: rPr_tmpl.__copy__()),
+        ('spTree textbox (200)', add_textbox,
+         lambda: spTree_tmpl.__copy__()),
+    )
+
+    def usec(func):
+        return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+    print('%-22s %12s' % ('insert', 'usec'))
+    for label, func, copy in cases:
+        print('%-22s %12.2f' % (label, usec(func) - usec(copy)))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
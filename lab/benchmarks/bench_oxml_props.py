@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# bench_oxml_props.py
+#
+
+"""
+Times the per-access cost of common proxy properties backed by custom
+element class properties, like ``shape.left`` and ``font.bold``. Run it on
+two revisions to compare element class implementations; the API it uses is
+the same on both. Each figure is the best of five runs.
+
+Usage: python bench_oxml_props.py [repetitions]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.util import Inches, Pt
+
+
+def main(argv):
+    number = int(argv[1]) if len(argv) > 1 else 20000
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    textbox = slide.shapes.add_textbox(0, 0, Inches(2), Inches(1))
+    textframe = textbox.textframe
+    textframe.text = 'foobar'
+    font = textframe.paragraphs[0].runs[0].font
+    font.bold = True
+    table = slide.shapes.add_table(2, 2, 0, 0, Inches(4), Inches(2))
+    cell = table.cell(0, 0)
+    core_props = prs.core_properties
+    xfrm = textbox._element.spPr.xfrm
+
+    def set_left():
+        textbox.left = Inches(1)
+
+    def set_bold():
+        font.bold = False
+
+    def set_size():
+        font.size = Pt(12)
+
+    def set_first_row():
+        table.first_row = True
+
+    def set_margin_left():
+        cell.margin_left = Inches(0.1)
+
+    def set_auto_size():
+        textframe.auto_size = None
+
+    def set_title():
+        core_props.title = 'foobar'
+
+    def set_xfrm_x():
+        xfrm.x = 914400
+
+    cases = (
+        ('shape.left', lambda: textbox.left, set_left),
+        ('font.bold', lambda: font.bold, set_bold),
+        ('font.size', lambda: font.size, set_size),
+        ('table.first_row', lambda: table.first_row, set_first_row),
+        ('cell.margin_left', lambda: cell.margin_left, set_margin_left),
+        ('textframe.auto_size', lambda: textframe.auto_size, set_auto_size),
+        ('core_props.title', lambda: core_props.title, set_title),
+        ('<a:xfrm> x', lambda: xfrm.x, set_xfrm_x),
+    )
+
+    def usec(func):
+        return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+    print('%-22s %12s %12s' % ('property', 'get (usec)', 'set (usec)'))
+    for label, get, set_ in cases:
+        print('%-22s %12.2f %12.2f' % (label, usec(get), usec(set_)))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
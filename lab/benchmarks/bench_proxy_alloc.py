@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# bench_proxy_alloc.py
+#
+# Measures proxy objects allocated by repeated navigation of the API.
+#
+
+"""
+Measures the objects allocated by repeatedly navigating to the same text
+and table proxies, like ``textframe.paragraphs`` and ``table.rows[0]``.
+Each navigation is repeated *repetitions* times with every result kept
+alive. Memory is reported with tracemalloc where it's available (Python
+3.4+). Otherwise it is estimated as the objects the cycle collector tracks
+afterward, with the sys.getsizeof() of each, including any instance
+``__dict__``. Time per navigation is the best of five runs.
+
+Usage: python bench_proxy_alloc.py [repetitions]
+"""
+
+from __future__ import print_function
+
+import gc
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.util import Inches
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+
+def main(argv):
+    number = int(argv[1]) if len(argv) > 1 else 1000
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    textbox = slide.shapes.add_textbox(0, 0, Inches(2), Inches(1))
+    textframe = textbox.textframe
+    textframe.text = 'foobar'
+    for idx in range(4):
+        textframe.add_paragraph().text = 'paragraph %d' % idx
+    run = textframe.paragraphs[0].runs[0]
+    table = slide.shapes.add_table(4, 4, 0, 0, Inches(4), Inches(2))
+    cell = table.cell(0, 0)
+
+    cases = (
+        ('shape.textframe', lambda: textbox.textframe),
+        ('textframe.paragraphs', lambda: textframe.paragraphs),
+        ('run.font', lambda: run.font),
+        ('cell.textframe', lambda: cell.textframe),
+        ('table.rows[0]', lambda: table.rows[0]),
+    )
+
+    print('%-22s %12s %12s %12s' % ('navigation', 'usec', 'objects',
+                                    'bytes'))
+    for label, navigate in cases:
+        usec = min(timeit.repeat(navigate, number=number, repeat=5))
+        objects, nbytes = allocated(navigate, number)
+        print('%-22s %12.2f %12d %12d' % (
+            label, usec / number * 1e6, objects, nbytes
+        ))
+
+
+def allocated(navigate, number):
+    """
+    Return (objects, bytes) allocated by *number* calls of *navigate* with
+    the results kept alive, objects being -1 under tracemalloc.
+    """
+    gc.collect()
+    if tracemalloc is not None:
+        tracemalloc.start()
+        results = [navigate() for _ in range(number)]
+        nbytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del results
+        return -1, nbytes
+    before = set(id(obj) for obj in gc.get_objects())
+    results = [navigate() for _ in range(number)]
+    new_objects = [
+        obj for obj in gc.get_objects()
+        if id(obj) not in before and obj is not results and obj is not before
+    ]
+    nbytes = sum(_sizeof(obj) for obj in new_objects)
+    count = len(new_objects)
+    del results, new_objects
+    return count, nbytes
+
+
+def _sizeof(obj):
+    size = sys.getsizeof(obj)
+    instance_dict = getattr(obj, '__dict__', None)
+    if type(instance_dict) is dict:
+        size += sys.getsizeof(instance_dict)
+    return size
+
+
+if __name__ == '__main__':
+    main(sys.argv)
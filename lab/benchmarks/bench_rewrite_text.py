@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# bench_rewrite_text.py
+#
+# Compares redacting the text of a deck through Presentation with
+# pptx.transform.rewrite_text().
+#
+
+"""
+Times replacing every run of text in a deck of *slides* slides with
+asterisks. The first case opens the deck as a |Presentation|, sets the text
+of each run and saves it. The second case uses ``rewrite_text()``. Each
+figure is the best of three runs.
+
+Usage: python bench_rewrite_text.py [slides]
+"""
+
+from __future__ import print_function
+
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+from pptx import Presentation
+from pptx.transform import rewrite_text
+from pptx.util import Inches
+
+
+def redact(text):
+    return u'*' * len(text)
+
+
+def main(argv):
+    slide_count = int(argv[1]) if len(argv) > 1 else 100
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        src = os.path.join(tmpdir, 'src.pptx')
+        dst = os.path.join(tmpdir, 'dst.pptx')
+        prs = Presentation()
+        for slide_idx in range(slide_count):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            for shape_idx in range(6):
+                textbox = slide.shapes.add_textbox(
+                    0, 0, Inches(4), Inches(1)
+                )
+                textbox.textframe.set_paragraphs([
+                    'Account %d-%d' % (slide_idx, shape_idx),
+                    'Confidential figures for client %d' % slide_idx,
+                ])
+        prs.save(src)
+
+        def through_presentation():
+            prs = Presentation(src)
+            for slide in prs.slides:
+                for shape in slide.shapes:
+                    for paragraph in shape.textframe.paragraphs:
+                        for run in paragraph.runs:
+                            run.text = redact(run.text)
+            prs.save(dst)
+
+        def streaming():
+            rewrite_text(src, redact, dst)
+
+        print('%-22s %12s' % ('%d slides' % slide_count, 'msec'))
+        for label, func in (('Presentation', through_presentation),
+                            ('rewrite_text()', streaming)):
+            msec = min(timeit.repeat(func, number=1, repeat=3)) * 1e3
+            print('%-22s %12.1f' % (label, msec))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
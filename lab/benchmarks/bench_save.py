@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# bench_save.py
+#
+
+"""
+Times saving a presentation of many slides twice in a row, the second save
+reusing the rels and content types items composed for the first, and
+reports the time spent composing those items from scratch for comparison.
+
+Usage: python bench_save.py [slide_count]
+"""
+
+from __future__ import print_function
+
+import sys
+import time
+
+from StringIO import StringIO
+
+from pptx import Presentation
+from pptx.opc.pkgwriter import _ContentTypesItem
+from pptx.oxml.shared import serialize_part_xml
+
+
+def msec(func):
+    start = time.time()
+    func()
+    return (time.time() - start) * 1e3
+
+
+def main(argv):
+    slide_count = int(argv[1]) if len(argv) > 1 else 1000
+
+    prs = Presentation()
+    for idx in range(slide_count):
+        prs.slides.add_slide(prs.slide_layouts[6])
+    parts = prs._package.parts
+
+    def compose_all():
+        serialize_part_xml(_ContentTypesItem.xml_for(parts))
+        for part in parts:
+            part._rels._xml_cache = None
+            part._rels.xml
+
+    print('%d parts' % len(parts))
+    print('first save       %8.1f ms' % msec(lambda: prs.save(StringIO())))
+    print('second save      %8.1f ms' % msec(lambda: prs.save(StringIO())))
+    print('compose all xml  %8.1f ms' % msec(compose_all))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
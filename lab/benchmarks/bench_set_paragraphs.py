@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# bench_set_paragraphs.py
+#
+# Compares filling a text frame with a bulleted list one call at a time
+# against TextFrame.set_paragraphs().
+#
+
+"""
+Times writing a 20-item, two-level bulleted list with bold headings into a
+text frame, first with ``add_paragraph()``, ``level``, ``text`` and
+``font.bold`` per item, then with a single ``set_paragraphs()`` call. Each
+figure is the best of five runs.
+
+Usage: python bench_set_paragraphs.py [repetitions]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.util import Inches
+
+
+def main(argv):
+    number = int(argv[1]) if len(argv) > 1 else 200
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    textframe = slide.shapes.add_textbox(
+        0, 0, Inches(4), Inches(4)
+    ).textframe
+
+    items = [
+        ('Heading %d' % idx, 0, {'bold': True}) if idx % 5 == 0 else
+        ('Item %d' % idx, 1)
+        for idx in range(20)
+    ]
+
+    def one_call_at_a_time():
+        textframe.clear()
+        for idx, item in enumerate(items):
+            paragraph = (
+                textframe.paragraphs[0] if idx == 0 else
+                textframe.add_paragraph()
+            )
+            paragraph.level = item[1]
+            run = paragraph.add_run()
+            run.text = item[0]
+            if len(item) > 2:
+                run.font.bold = True
+
+    def set_paragraphs():
+        textframe.set_paragraphs(items)
+
+    print('%-22s %12s' % ('20 paragraphs', 'usec'))
+    for label, func in (('one call at a time', one_call_at_a_time),
+                        ('set_paragraphs()', set_paragraphs)):
+        usec = min(timeit.repeat(func, number=number, repeat=5))
+        print('%-22s %12.1f' % (label, usec / number * 1e6))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# bench_template.py
+#
+# Times rendering a compiled Template against templates of growing size.
+#
+
+"""
+Times filling in a one-slide template having five tokens plus a growing
+number of text boxes without tokens. ``Template.render()`` is compared with
+opening the template and replacing the tokens by scanning every run of every
+shape through the API. Each figure is the best of three runs.
+
+Usage: python bench_template.py [repetitions]
+"""
+
+from __future__ import print_function
+
+import re
+import sys
+import timeit
+
+from io import BytesIO
+
+from pptx import Presentation
+from pptx.template import Template
+from pptx.util import Inches
+
+
+context = dict(('field%d' % idx, 'value %d' % idx) for idx in range(5))
+token_re = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+
+def main(argv):
+    number = int(argv[1]) if len(argv) > 1 else 20
+
+    print('%-22s %12s %12s' % ('static shapes', 'render usec', 'scan usec'))
+    for shape_count in (10, 100, 400):
+        blob = template_blob(shape_count)
+        template = Template(BytesIO(blob))
+
+        def render():
+            template.render(context)
+
+        def scan():
+            prs = Presentation(BytesIO(blob))
+            for slide in prs.slides:
+                for shape in slide.shapes:
+                    if not shape.has_textframe:
+                        continue
+                    for paragraph in shape.textframe.paragraphs:
+                        for run in paragraph.runs:
+                            text = run.text
+                            if '{{' in text:
+                                run.text = token_re.sub(
+                                    lambda m: context[m.group(1)], text
+                                )
+
+        render_usec, scan_usec = (
+            min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+            for func in (render, scan)
+        )
+        print('%-22d %12.0f %12.0f' % (shape_count, render_usec, scan_usec))
+
+
+def template_blob(shape_count):
+    """
+    Return the blob of a one-slide presentation having a text box for each
+    token in *context* and *shape_count* text boxes without tokens.
+    """
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    for name in sorted(context):
+        textbox = slide.shapes.add_textbox(0, 0, Inches(4), Inches(1))
+        textbox.textframe.text = 'Label: {{%s}}' % name
+    for idx in range(shape_count):
+        textbox = slide.shapes.add_textbox(0, 0, Inches(4), Inches(1))
+        textbox.textframe.set_paragraphs(
+            ['Static text %d' % idx, 'More static text']
+        )
+    stream = BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# bench_xpath.py
+#
+
+"""
+Microbenchmarks for the call sites that evaluate an XPath expression or
+compute a Clark name, timing the lookup each one now makes against the
+version it replaced, which compiled its expression on every call.
+
+Usage: python bench_xpath.py [repetitions]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.oxml.ns import _nsmap, compiled_xpath, NamespacePrefixedTag, qn
+from pptx.oxml.shared import child
+
+
+def old_qn(nsptag_str):
+    return NamespacePrefixedTag(nsptag_str).clark_name
+
+
+def old_child(element, child_tag_str):
+    nsptag = NamespacePrefixedTag(child_tag_str)
+    matching_children = element.xpath(
+        './%s' % child_tag_str, namespaces=nsptag.nsmap
+    )
+    return matching_children[0] if len(matching_children) else None
+
+
+def main(argv):
+    number = int(argv[1]) if len(argv) > 1 else 20000
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    for idx in range(20):
+        slide.shapes.add_textbox(0, 0, 100, 100).textframe.text = 'foo'
+    sld = slide._element
+    spTree = slide.spTree
+    txBody = slide.shapes[2].textframe._txBody
+
+    cases = (
+        ('qn()',
+         lambda: old_qn('p:spTree'),
+         lambda: qn('p:spTree')),
+        ('BaseSlide.spTree',
+         lambda: sld.xpath('./p:cSld/p:spTree', namespaces=_nsmap)[0],
+         lambda: compiled_xpath('./p:cSld/p:spTree')(sld)[0]),
+        ('oxml.shared.child()',
+         lambda: old_child(sld, 'p:cSld'),
+         lambda: child(sld, 'p:cSld')),
+        ('TextFrame.clear()',
+         lambda: txBody.xpath('./a:p', namespaces=_nsmap),
+         lambda: txBody.findall(qn('a:p'))),
+        ('Part._rel_ref_count()',
+         lambda: sld.xpath('//@r:id', namespaces=_nsmap),
+         lambda: compiled_xpath('//@r:id')(sld)),
+        ('_next_ph_name()',
+         lambda: spTree.xpath('//p:cNvPr/@name', namespaces=_nsmap),
+         lambda: compiled_xpath('//p:cNvPr/@name')(spTree)),
+    )
+
+    print('%-24s %14s %14s' % ('call site', 'before (usec)', 'now (usec)'))
+    for label, before, now in cases:
+        before_usec = timeit.timeit(before, number=number) / number * 1e6
+        now_usec = timeit.timeit(now, number=number) / number * 1e6
+        print('%-24s %14.2f %14.2f' % (label, before_usec, now_usec))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# bench_parsers.py
+#
+
+"""
+Experimental code to measure what parsing with plain ``etree.ElementBase``
+custom element classes, having explicit ``find()``-based child accessors,
+would gain over the objectify-based oxml classes python-pptx uses now.
+
+Times parsing every slide in a presentation with each parser, then walking
+the shapes, paragraphs and runs of each slide to read their text. The walk
+is timed using objectify attribute access alone, using the same ``find()``
+calls on the objectify and the plain etree trees, and using the accessors
+of the etree element classes, so the cost of attribute access and of the
+element classes can be told apart.
+
+Usage: python bench_parsers.py [path/to/presentation.pptx] [repetitions]
+
+The results, and what a selectable plain etree parser would take, are
+recorded in ``docs/dev/analysis/experiments/etree-element-classes.rst``.
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+import zipfile
+
+from lxml import etree
+
+from pptx.oxml import parse_xml_bytes
+from pptx.oxml.ns import NamespacePrefixedTag, qn
+
+
+# ============================================================================
+# plain etree custom element classes
+# ============================================================================
+
+class EtreeElement(etree.ElementBase):
+    """
+    Base class providing explicit child accessors in place of objectify's
+    attribute access.
+    """
+    def child(self, tag):
+        return self.find(qn(tag))
+
+    def children(self, tag):
+        return self.findall(qn(tag))
+
+
+class CT_Slide(EtreeElement):
+    @property
+    def spTree(self):
+        return self.child('p:cSld').child('p:spTree')
+
+
+class CT_GroupShape(EtreeElement):
+    @property
+    def shapes(self):
+        return self.children('p:sp')
+
+
+class CT_Shape(EtreeElement):
+    @property
+    def txBody(self):
+        return self.child('p:txBody')
+
+
+class CT_TextBody(EtreeElement):
+    @property
+    def paragraphs(self):
+        return self.children('a:p')
+
+
+class CT_TextParagraph(EtreeElement):
+    @property
+    def runs(self):
+        return self.children('a:r')
+
+
+class CT_RegularTextRun(EtreeElement):
+    @property
+    def text(self):
+        t = self.child('a:t')
+        return '' if t is None else t.text
+
+
+_etree_lookup = etree.ElementNamespaceClassLookup()
+etree_parser = etree.XMLParser(remove_blank_text=True)
+etree_parser.set_element_class_lookup(_etree_lookup)
+
+for nsptag, cls in (
+        ('p:sld',    CT_Slide),
+        ('p:cSld',   EtreeElement),
+        ('p:spTree', CT_GroupShape),
+        ('p:sp',     CT_Shape),
+        ('p:txBody', CT_TextBody),
+        ('a:p',      CT_TextParagraph),
+        ('a:r',      CT_RegularTextRun)):
+    nsptag = NamespacePrefixedTag(nsptag)
+    namespace = _etree_lookup.get_namespace(nsptag.nsuri)
+    namespace[nsptag.local_part] = cls
+
+
+# ============================================================================
+# workloads
+# ============================================================================
+
+def objectify_text(sld):
+    """
+    Walk the text of *sld* using only objectify attribute access, as the
+    oxml classes do, e.g. ``sp.txBody``. Iterating ``spTree.sp`` visits the
+    ``<p:sp>`` siblings, like ``findall()``. A child in another namespace
+    than its parent is looked up by its Clark name, e.g. ``<a:p>``.
+    """
+    text = []
+    for sp in sld.cSld.spTree.sp:
+        if not hasattr(sp, 'txBody'):
+            continue
+        for p in getattr(sp.txBody, _p_tag):
+            if not hasattr(p, 'r'):
+                continue
+            for r in p.r:
+                text.append(r.t.text)
+    return text
+
+
+def find_text(sld):
+    """
+    Walk the text of *sld* using only ``find()`` and ``findall()``, so
+    timing it on both trees isolates the cost of the element classes from
+    that of the lookup.
+    """
+    text = []
+    spTree = sld.find(_cSld_tag).find(_spTree_tag)
+    for sp in spTree.findall(_sp_tag):
+        txBody = sp.find(_txBody_tag)
+        if txBody is None:
+            continue
+        for p in txBody.findall(_p_tag):
+            for r in p.findall(_r_tag):
+                t = r.find(_t_tag)
+                text.append('' if t is None else t.text)
+    return text
+
+
+def etree_text(sld):
+    """
+    Walk the text of *sld* using the ``find()``-based accessors of the plain
+    etree element classes above.
+    """
+    text = []
+    for sp in sld.spTree.shapes:
+        txBody = sp.txBody
+        if txBody is None:
+            continue
+        for p in txBody.paragraphs:
+            for r in p.runs:
+                text.append(r.text)
+    return text
+
+
+_cSld_tag = qn('p:cSld')
+_p_tag = qn('a:p')
+_r_tag = qn('a:r')
+_sp_tag = qn('p:sp')
+_spTree_tag = qn('p:spTree')
+_t_tag = qn('a:t')
+_txBody_tag = qn('p:txBody')
+
+
+def slide_blobs(path):
+    zipf = zipfile.ZipFile(path)
+    try:
+        return [
+            zipf.read(name) for name in zipf.namelist()
+            if name.startswith('ppt/slides/slide') and name.endswith('.xml')
+        ]
+    finally:
+        zipf.close()
+
+
+def main(argv):
+    path = argv[1] if len(argv) > 1 else 'tests/test_files/test.pptx'
+    number = int(argv[2]) if len(argv) > 2 else 1000
+    blobs = slide_blobs(path)
+
+    obj_slds = [parse_xml_bytes(blob) for blob in blobs]
+    etree_slds = [etree.fromstring(blob, etree_parser) for blob in blobs]
+    expected = [etree_text(s) for s in etree_slds]
+    assert [objectify_text(s) for s in obj_slds] == expected
+    assert [find_text(s) for s in obj_slds] == expected
+    assert [find_text(s) for s in etree_slds] == expected
+
+    def time(func):
+        # best of five, as other processes only ever add to a timing
+        best = min(timeit.repeat(func, repeat=5, number=number))
+        return best / number * 1e6
+
+    rows = (
+        ('parse (objectify)', time(
+            lambda: [parse_xml_bytes(blob) for blob in blobs])),
+        ('parse (etree)', time(
+            lambda: [etree.fromstring(blob, etree_parser) for blob in blobs])),
+        ('parse (plain etree, no lookup)', time(
+            lambda: [etree.fromstring(blob) for blob in blobs])),
+        ('walk text (objectify attributes)', time(
+            lambda: [objectify_text(sld) for sld in obj_slds])),
+        ('walk text (objectify tree, find)', time(
+            lambda: [find_text(sld) for sld in obj_slds])),
+        ('walk text (etree tree, find)', time(
+            lambda: [find_text(sld) for sld in etree_slds])),
+        ('walk text (etree accessors)', time(
+            lambda: [etree_text(sld) for sld in etree_slds])),
+    )
+    print('%d slides from %s, %d repetitions' % (len(blobs), path, number))
+    for label, usec in rows:
+        print('%-34s %10.1f usec' % (label, usec))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -12,7 +12,9 @@ import sys
 sys.modules['pptx.exceptions'] = exceptions
 del sys
 
-from pptx.api import Presentation  # noqa
+from pptx.api import (  # noqa
+    Presentation, read_core_properties, update_core_properties
+)
 
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.package import PartFactory
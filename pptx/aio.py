@@ -0,0 +1,175 @@
+# encoding: utf-8
+
+"""
+Support for opening and saving presentations without blocking an asyncio
+event loop. Loading and saving run in an executor; the functions here return
+futures that can be awaited (or yielded from) in a coroutine. asyncio is
+imported only when these functions are used; on Python 2 the ``trollius``
+backport is used when it is installed.
+"""
+
+from __future__ import absolute_import
+
+from StringIO import StringIO
+
+
+#: default size of the chunks written to an asyncio stream on save
+CHUNK_SIZE = 64 * 1024
+
+
+def open_async(prs_cls, pkg_file, executor=None, loop=None, **kwargs):
+    """
+    Return a future resolving to a *prs_cls* instance loaded from
+    *pkg_file*, which is a path, a file-like object or an asyncio stream
+    reader. Reading a path or file-like object, decompressing and parsing
+    all run in *executor*, the loop's default executor when |None|.
+    Additional keyword arguments are passed to the *prs_cls* constructor.
+    """
+    asyncio = _asyncio()
+    loop = loop or asyncio.get_event_loop()
+
+    def load(pkg_file):
+        return prs_cls(pkg_file, **kwargs)
+
+    if not _is_async_stream(asyncio, pkg_file, 'read'):
+        return loop.run_in_executor(executor, load, pkg_file)
+
+    def load_blob(blob):
+        return loop.run_in_executor(executor, load, StringIO(blob))
+
+    read = _ensure_future(asyncio, pkg_file.read(), loop)
+    return _chain(asyncio, read, load_blob, loop)
+
+
+def save_async(prs, target, executor=None, loop=None, chunk_size=None):
+    """
+    Return a future that resolves to |None| once presentation *prs* has
+    been saved to *target*, a path, a file-like object, or an asyncio stream
+    writer. Serializing and compressing run in *executor*, the loop's
+    default executor when |None|. A stream writer receives the saved
+    package in chunks of *chunk_size* bytes, waiting for the stream to
+    drain after each one. The package is assembled in memory before the
+    first chunk is written because the zip format needs a seekable file.
+    """
+    asyncio = _asyncio()
+    loop = loop or asyncio.get_event_loop()
+
+    if not _is_async_stream(asyncio, target, 'drain'):
+        return loop.run_in_executor(executor, prs.save, target)
+
+    def save_to_blob():
+        stream = StringIO()
+        prs.save(stream)
+        return stream.getvalue()
+
+    def write_blob(blob):
+        return _write_chunks(
+            asyncio, target, blob, chunk_size or CHUNK_SIZE, loop
+        )
+
+    saved = loop.run_in_executor(executor, save_to_blob)
+    return _chain(asyncio, saved, write_blob, loop)
+
+
+def _asyncio():
+    """
+    Return the asyncio module, or the trollius backport on Python 2.
+    """
+    try:
+        import asyncio
+    except ImportError:
+        import trollius as asyncio
+    return asyncio
+
+
+def _chain(asyncio, future, then, loop):
+    """
+    Return a future resolving to the result of the future returned by
+    *then* when called with the result of *future*. An exception raised
+    along the way is set on the returned future.
+    """
+    result = asyncio.Future(loop=loop)
+
+    def copy_result(inner):
+        if not _pass_failure(inner, result):
+            result.set_result(inner.result())
+
+    def on_done(future):
+        if _pass_failure(future, result):
+            return
+        try:
+            inner = then(future.result())
+        except Exception as e:
+            result.set_exception(e)
+            return
+        inner.add_done_callback(copy_result)
+
+    future.add_done_callback(on_done)
+    return result
+
+
+def _ensure_future(asyncio, coro_or_future, loop):
+    """
+    Return *coro_or_future* scheduled on *loop* as a future, using the name
+    available in this version of asyncio.
+    """
+    ensure_future = getattr(asyncio, 'ensure_future', None)
+    if ensure_future is None:
+        ensure_future = getattr(asyncio, 'async')
+    return ensure_future(coro_or_future, loop=loop)
+
+
+def _is_async_stream(asyncio, obj, method_name):
+    """
+    Return |True| if *obj* has a coroutine method named *method_name*, as
+    ``asyncio.StreamReader.read()`` and ``asyncio.StreamWriter.drain()``
+    are.
+    """
+    method = getattr(obj, method_name, None)
+    if method is None:
+        return False
+    return asyncio.iscoroutinefunction(method)
+
+
+def _pass_failure(future, result):
+    """
+    Cancel *result* or set the exception of done *future* on it if *future*
+    was cancelled or failed. Return |True| if *result* is done afterward,
+    meaning there is nothing more to do.
+    """
+    if result.done():
+        return True
+    if future.cancelled():
+        result.cancel()
+        return True
+    if future.exception() is not None:
+        result.set_exception(future.exception())
+        return True
+    return False
+
+
+def _write_chunks(asyncio, writer, blob, chunk_size, loop):
+    """
+    Return a future resolving to |None| once *blob* has been written to
+    stream *writer* in *chunk_size* pieces, draining after each piece so a
+    slow reader applies back-pressure.
+    """
+    result = asyncio.Future(loop=loop)
+    offsets = iter(range(0, len(blob), chunk_size))
+
+    def write_next(drained=None):
+        if result.done():
+            return
+        if drained is not None and _pass_failure(drained, result):
+            return
+        try:
+            offset = next(offsets)
+        except StopIteration:
+            result.set_result(None)
+            return
+        writer.write(blob[offset:offset+chunk_size])
+        drain = _ensure_future(asyncio, writer.drain(), loop)
+        drain.add_done_callback(write_next)
+
+    write_next()
+    return result
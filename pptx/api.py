@@ -11,7 +11,15 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 from warnings import warn
 
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import CT_Relationships, oxml_fromstring
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.phys_pkg import PhysPkgReader, rewrite_zip_package
+from pptx.opc.pkgreader import PackageReader
+from pptx.oxml.shared import serialize_part_xml
 from pptx.package import Package
+from pptx.parts.coreprops import CoreProperties
+from pptx.util import lazyproperty
 
 
 class Presentation(object):
@@ -19,11 +27,21 @@ class Presentation(object):
     Return a |Presentation| instance loaded from *file_*, where *file_* can
     be either a path to a ``.pptx`` file (a string) or a file-like object.
     If *file_* is missing or ``None``, load the built-in default presentation
-    template.
+    template. If *thread_safe* is |True|, distinct slides of the presentation
+    can be built from different threads at the same time; see
+    :ref:`concurrency`.
+
+    *load* is an optional predicate called with the partname and content
+    type of each part in the package, e.g. ``load=lambda partname,
+    content_type: content_type != CT.PML_NOTES_SLIDE``. A part it returns
+    |False| for is neither constructed nor parsed; it is read only when the
+    presentation is saved and is written back unchanged. Parts
+    that are excluded must not be accessed through the API and the package
+    file must remain available until the presentation is saved.
     """
-    def __init__(self, pkg_file=None):
+    def __init__(self, pkg_file=None, thread_safe=False, load=None):
         super(Presentation, self).__init__()
-        self._package = Package.open(pkg_file)
+        self._package = Package.open(pkg_file, thread_safe, load)
         self._presentation = self._package.presentation
 
     @property
@@ -34,6 +52,56 @@ class Presentation(object):
         """
         return self._package.core_properties
 
+    def find(self, pattern):
+        """
+        Return a list of |TextMatch| locating each match of *pattern*, a
+        regular expression string or compiled pattern, in the text of the
+        slides, e.g. ``prs.find(r'Q[1-4] 2014')``. A match may span runs
+        but not paragraphs. The text of each slide is indexed once and
+        reused by later calls until the slide's text changes.
+        """
+        return self._text_index.find(pattern)
+
+    @classmethod
+    def open_async(cls, pkg_file=None, executor=None, loop=None,
+                   thread_safe=False, load=None):
+        """
+        Return a future resolving to a |Presentation| loaded from
+        *pkg_file*, for use in an asyncio coroutine, e.g. ``prs = await
+        Presentation.open_async('deck.pptx')``. *pkg_file* may also be an
+        ``asyncio.StreamReader``. Reading, decompressing and parsing the
+        package run in *executor*, or the default executor of *loop* when
+        *executor* is |None|, so the event loop is not blocked.
+        """
+        # imported on use, only programs using asyncio need pptx.aio
+        from pptx import aio
+        return aio.open_async(
+            cls, pkg_file, executor, loop, thread_safe=thread_safe, load=load
+        )
+
+    def replace(self, pattern, repl):
+        """
+        Replace each match of *pattern* in the text of the slides with
+        *repl*, a string or function as for ``re.sub()``, and return the
+        number of matches replaced. The replacement takes on the formatting
+        of the run the match starts in. A match that includes a line break
+        or a field, such as a slide number, is left unchanged.
+        """
+        return self._text_index.replace(pattern, repl)
+
+    def save_async(self, file, executor=None, loop=None, chunk_size=None):
+        """
+        Return a future that resolves once this presentation is saved to
+        *file*, for use in an asyncio coroutine, e.g. ``await
+        prs.save_async('deck.pptx')``. *file* may be a path, a file-like
+        object, or an ``asyncio.StreamWriter``, which receives the package
+        in chunks of *chunk_size* bytes, draining after each chunk.
+        Serializing and compressing run in *executor*, or the default
+        executor of *loop* when *executor* is |None|.
+        """
+        from pptx import aio
+        return aio.save_async(self, file, executor, loop, chunk_size)
+
     @property
     def slide_layouts(self):
         """
@@ -130,3 +198,99 @@ class Presentation(object):
         a file (a string) or a file-like object.
         """
         return self._package.save(file)
+
+    @lazyproperty
+    def _text_index(self):
+        """
+        |TextIndex| of the text of the slides, built as slides are searched.
+        :mod:`pptx.search` is imported here rather than with this module, as
+        only programs that search or replace text need it.
+        """
+        from pptx.search import TextIndex
+        return TextIndex(self._presentation)
+
+
+def read_core_properties(pkg_file):
+    """
+    Return a |CoreProperties| object holding the core properties of the
+    presentation *pkg_file*, a path or file-like object, e.g.
+    ``read_core_properties('deck.pptx').title``. Only the package
+    relationships, the content types and the core properties part are read,
+    so this is much faster than opening the presentation. The properties are
+    all unset if the package has no core properties part.
+    """
+    phys_reader = PhysPkgReader(pkg_file)
+    try:
+        core_props = _read_core_properties(phys_reader)
+    finally:
+        phys_reader.close()
+    if core_props is None:
+        core_props = CoreProperties._new()
+    return core_props
+
+
+def update_core_properties(path, **props):
+    """
+    Set the core properties named in keyword arguments *props* on the
+    ``.pptx`` file at *path*, e.g. ``update_core_properties(path,
+    title='Q3 Results', revision=7)``, without opening the presentation. Only
+    the core properties part is rewritten (and added if not present); the
+    other parts of the package are copied as they are. Raises |TypeError| on
+    a keyword that is not the name of a core property.
+    """
+    for name in props:
+        if name not in CoreProperties._propnames:
+            raise TypeError("'%s' is not a core property" % name)
+    blobs = {}
+    phys_reader = PhysPkgReader(path)
+    try:
+        core_props = _read_core_properties(phys_reader)
+        if core_props is None:
+            core_props = CoreProperties._new()
+            blobs.update(_core_properties_refs(phys_reader, core_props))
+    finally:
+        phys_reader.close()
+    for name, value in props.items():
+        setattr(core_props, name, value)
+    blobs[core_props.partname] = core_props.blob
+    rewrite_zip_package(path, blobs)
+
+
+def _core_properties_refs(phys_reader, core_props):
+    """
+    Return a dict containing the package rels item and the content types
+    item read by *phys_reader*, each updated to refer to new core properties
+    part *core_props*, keyed by pack URI.
+    """
+    rels_xml = phys_reader.rels_xml_for(PACKAGE_URI)
+    if rels_xml is None:
+        rels = CT_Relationships.new()
+    else:
+        rels = oxml_fromstring(rels_xml)
+    rIds = set(rel.get('Id') for rel in rels.iterchildren())
+    rId = next(
+        'rId%d' % n for n in range(1, len(rIds)+2) if 'rId%d' % n not in rIds
+    )
+    target_ref = core_props.partname.relative_ref(PACKAGE_URI.baseURI)
+    rels.add_rel(rId, RT.CORE_PROPERTIES, target_ref)
+
+    types = oxml_fromstring(phys_reader.content_types_xml)
+    types.add_override(core_props.partname, CT.OPC_CORE_PROPERTIES)
+    return {
+        PACKAGE_URI.rels_uri: rels.xml,
+        CONTENT_TYPES_URI: serialize_part_xml(types),
+    }
+
+
+def _read_core_properties(phys_reader):
+    """
+    Return a |CoreProperties| part loaded from the package read by
+    *phys_reader*, or |None| if the package has no core properties part.
+    """
+    core_props_part = PackageReader.read_related_part(
+        phys_reader, PACKAGE_URI, RT.CORE_PROPERTIES
+    )
+    if core_props_part is None:
+        return None
+    partname, content_type, blob = core_props_part
+    return CoreProperties.load(partname, content_type, blob, None)
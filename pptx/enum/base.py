@@ -54,10 +54,7 @@ class _DocsPageFormatter(object):
         The docstring of the enumeration, formatted for use at the top of the
         documentation page
         """
-        try:
-            cls_docstring = self._clsdict['__doc__']
-        except KeyError:
-            cls_docstring = ''
+        cls_docstring = self._clsdict.get('__doc__') or ''
         return textwrap.dedent(cls_docstring).strip()
 
     def _member_def(self, member):
@@ -111,9 +108,18 @@ class MetaEnumeration(type):
     def __new__(meta, clsname, bases, clsdict):
         meta._add_enum_members(clsdict)
         meta._collect_valid_settings(clsdict)
-        meta._generate_docs_page(clsname, clsdict)
         return type.__new__(meta, clsname, bases, clsdict)
 
+    @property
+    def __docs_rst__(cls):
+        """
+        The RST documentation page for the enumeration, generated when asked
+        for rather than when the enumeration is defined, so importing the
+        enumerations doesn't pay for formatting pages only the docs build
+        uses.
+        """
+        return _DocsPageFormatter(cls.__name__, cls.__dict__).page_str
+
     @classmethod
     def _add_enum_members(meta, clsdict):
         """
@@ -137,15 +143,6 @@ class MetaEnumeration(type):
             valid_settings.extend(member.valid_settings)
         clsdict['_valid_settings'] = valid_settings
 
-    @classmethod
-    def _generate_docs_page(meta, clsname, clsdict):
-        """
-        Return the RST documentation page for the enumeration.
-        """
-        clsdict['__docs_rst__'] = (
-            _DocsPageFormatter(clsname, clsdict).page_str
-        )
-
 
 class Enumeration(object):
     """
@@ -0,0 +1,348 @@
+# encoding: utf-8
+
+"""
+Fast, read-only extraction of the text in a presentation.
+
+Unlike |Presentation|, which loads every part of a package and parses its
+XML into objectified trees, the functions in this module read only the parts
+they need, parsing each slide with ``lxml.etree.iterparse()`` as it is
+decompressed from the zip archive. Elements are discarded as soon as they
+have been processed, so memory use does not grow with the size of a slide.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import hashlib
+import json
+import multiprocessing
+import optparse
+import os
+import sys
+import time
+
+from collections import namedtuple
+from datetime import datetime
+
+from lxml import etree
+
+from .opc.constants import RELATIONSHIP_TYPE as RT
+from .opc.packuri import PACKAGE_URI
+from .opc.phys_pkg import PhysPkgReader
+from .opc.pkgreader import PackageReader
+from .oxml.ns import qn
+from .parts.coreprops import CoreProperties
+
+
+#: A paragraph of text extracted from a slide, along with the 0-based index
+#: of the slide in presentation order and the id and name of the shape the
+#: paragraph appears in.
+TextRecord = namedtuple(
+    'TextRecord', 'slide_index shape_id shape_name paragraph_text'
+)
+
+
+def iter_text(pkg_file):
+    """
+    Generate a |TextRecord| for each paragraph containing text in the
+    presentation *pkg_file*, a path to a ``.pptx`` file or expanded package
+    directory, or a file-like object. Slides are visited in presentation
+    order and paragraphs in document order within each slide. A line break
+    within a paragraph appears as a newline. Text in a table is attributed
+    to the table and text in a group to the member shape containing it.
+    """
+    phys_reader = PhysPkgReader(pkg_file)
+    try:
+        partnames = slide_partnames(phys_reader)
+        for record in _iter_text(phys_reader, partnames):
+            yield record
+    finally:
+        phys_reader.close()
+
+
+def main(argv=None):
+    """
+    Entry point for ``python -m pptx.extract``. Writes a JSON line produced
+    by :func:`summarize` for each presentation named on the command line,
+    or found in a directory named there, and reports throughput on stderr.
+    Presentations that can't be read are reported on stderr and skipped.
+    Returns the exit status, 1 if any presentation was skipped.
+    """
+    parser = optparse.OptionParser(
+        prog='python -m pptx.extract', usage='%prog [options] PATH...',
+        description=(
+            'Extract text and metadata from .pptx files as JSON lines. Each '
+            'PATH is a .pptx file, or a directory to search for .pptx files.'
+        )
+    )
+    parser.add_option(
+        '-j', '--processes', type='int', default=None,
+        help='number of worker processes, default one per CPU'
+    )
+    options, args = parser.parse_args(argv)
+    if not args:
+        parser.error('at least one PATH is required')
+
+    paths = list(_iter_pptx_paths(args))
+    start = time.time()
+    skipped = 0
+    for path, summary, error in _summarize_all(paths, options.processes):
+        if error is not None:
+            skipped += 1
+            print('skipped %s: %s' % (path, error), file=sys.stderr)
+            continue
+        print(json.dumps(summary, sort_keys=True))
+    elapsed = time.time() - start
+    files_per_sec = len(paths) / elapsed if elapsed else float(len(paths))
+    print(
+        '%d files (%d skipped) in %.2fs, %.1f files/sec' %
+        (len(paths), skipped, elapsed, files_per_sec), file=sys.stderr
+    )
+    return 1 if skipped else 0
+
+
+def summarize(pkg_file):
+    """
+    Return a dict describing presentation *pkg_file*, suitable for
+    serializing as JSON, with the keys ``core_properties``, ``slide_count``,
+    ``slides``, the list of paragraph texts on each slide, and ``images``,
+    the SHA1 hex digest of each distinct image used on a slide in order of
+    first use. Date core properties are ISO 8601 strings.
+    """
+    phys_reader = PhysPkgReader(pkg_file)
+    try:
+        partnames = slide_partnames(phys_reader)
+        slides = [[] for partname in partnames]
+        for record in _iter_text(phys_reader, partnames):
+            slides[record.slide_index].append(record.paragraph_text)
+        return {
+            'core_properties': _core_properties(phys_reader),
+            'slide_count': len(partnames),
+            'slides': slides,
+            'images': _image_sha1s(phys_reader, partnames),
+        }
+    finally:
+        phys_reader.close()
+
+
+def slide_partnames(phys_reader):
+    """
+    Return a list of the partnames of the slides in the package read by
+    *phys_reader*, in the order the slides appear in the presentation.
+    """
+    prs_partname = _target_partname(
+        phys_reader, PACKAGE_URI, RT.OFFICE_DOCUMENT
+    )
+    srels = PackageReader._srels_for(phys_reader, prs_partname)
+    partnames_by_rId = dict(
+        (srel.rId, srel.target_partname) for srel in srels
+        if srel.reltype == RT.SLIDE and not srel.is_external
+    )
+    stream = phys_reader.stream_for(prs_partname)
+    try:
+        r_id = qn('r:id')
+        partnames = []
+        for event, sldId in etree.iterparse(stream, tag=qn('p:sldId')):
+            partnames.append(partnames_by_rId[sldId.get(r_id)])
+            sldId.clear()
+        return partnames
+    finally:
+        stream.close()
+
+
+_shape_tags = frozenset(
+    qn(tag) for tag in (
+        'p:sp', 'p:grpSp', 'p:graphicFrame', 'p:pic', 'p:cxnSp'
+    )
+)
+_cNvPr = qn('p:cNvPr')
+_p = qn('a:p')
+_t = qn('a:t')
+_br = qn('a:br')
+
+
+def _core_properties(phys_reader):
+    """
+    Return a dict of the core properties of the package read by
+    *phys_reader*, empty if it has no core properties part.
+    """
+    core_props_part = PackageReader.read_related_part(
+        phys_reader, PACKAGE_URI, RT.CORE_PROPERTIES
+    )
+    if core_props_part is None:
+        return {}
+    partname, content_type, blob = core_props_part
+    core_props = CoreProperties.load(partname, content_type, blob, None)
+    properties = {}
+    for name in CoreProperties._propnames:
+        value = getattr(core_props, name)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        properties[name] = value
+    return properties
+
+
+def _image_sha1s(phys_reader, slide_partnames):
+    """
+    Return the SHA1 hex digest of each distinct image related to a slide in
+    *slide_partnames*, in order of first use.
+    """
+    sha1s, seen = [], set()
+    for slide_partname in slide_partnames:
+        for srel in PackageReader._srels_for(phys_reader, slide_partname):
+            if srel.reltype != RT.IMAGE or srel.is_external:
+                continue
+            partname = srel.target_partname
+            if partname in seen:
+                continue
+            seen.add(partname)
+            sha1s.append(_sha1(phys_reader, partname))
+    return sha1s
+
+
+def _iter_pptx_paths(paths):
+    """
+    Generate each path in *paths* that is not a directory, followed in
+    place of each directory by the ``.pptx`` files in its tree, in sorted
+    order.
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.lower().endswith('.pptx'):
+                    yield os.path.join(dirpath, filename)
+
+
+def _iter_text(phys_reader, slide_partnames):
+    """
+    Generate a |TextRecord| for each paragraph containing text on the slide
+    parts in *slide_partnames*, read using *phys_reader*.
+    """
+    for slide_index, partname in enumerate(slide_partnames):
+        stream = phys_reader.stream_for(partname)
+        try:
+            for record in _iter_slide_text(slide_index, stream):
+                yield record
+        finally:
+            stream.close()
+
+
+def _iter_slide_text(slide_index, stream):
+    """
+    Generate a |TextRecord| for each paragraph containing text in the slide
+    XML read from *stream*. A stack of ``[id, name]`` pairs tracks the
+    shape each paragraph belongs to, the innermost one being on top.
+    """
+    shapes = []
+    events = etree.iterparse(stream, events=('start', 'end'))
+    for event, elm in events:
+        tag = elm.tag
+        if event == 'start':
+            if tag in _shape_tags:
+                shapes.append([None, None])
+            continue
+        if tag == _cNvPr:
+            if shapes and shapes[-1][0] is None:
+                shapes[-1][:] = [int(elm.get('id')), elm.get('name')]
+        elif tag == _p:
+            text = _paragraph_text(elm)
+            if text and shapes:
+                shape_id, shape_name = shapes[-1]
+                yield TextRecord(slide_index, shape_id, shape_name, text)
+            _discard(elm)
+        elif tag in _shape_tags:
+            shapes.pop()
+            _discard(elm)
+
+
+def _discard(elm):
+    """
+    Free the memory held by *elm* and any preceding siblings, which have
+    been fully processed.
+    """
+    elm.clear()
+    parent = elm.getparent()
+    if parent is None:
+        return
+    while elm.getprevious() is not None:
+        del parent[0]
+
+
+def _paragraph_text(p):
+    """
+    Return the text of ``<a:p>`` element *p*, the text of its runs and
+    fields joined, with a newline for each line break.
+    """
+    fragments = []
+    for elm in p.iter(_t, _br):
+        if elm.tag == _br:
+            fragments.append(u'\n')
+        elif elm.text:
+            fragments.append(elm.text)
+    return u''.join(fragments)
+
+
+def _sha1(phys_reader, partname):
+    """
+    Return the SHA1 hex digest of part *partname*, read in chunks.
+    """
+    sha1 = hashlib.sha1()
+    stream = phys_reader.stream_for(partname)
+    try:
+        for chunk in iter(lambda: stream.read(64 * 1024), b''):
+            sha1.update(chunk)
+    finally:
+        stream.close()
+    return sha1.hexdigest()
+
+
+def _summarize(path):
+    """
+    Return a ``(path, summary, error)`` 3-tuple for the presentation at
+    *path*, where *summary* is |None| and *error* a message if it could not
+    be read. Runs in a worker process.
+    """
+    try:
+        summary = summarize(path)
+    except Exception as e:
+        return path, None, '%s: %s' % (type(e).__name__, e)
+    summary['path'] = path
+    return path, summary, None
+
+
+def _summarize_all(paths, processes):
+    """
+    Generate a ``(path, summary, error)`` 3-tuple for each of *paths*, in
+    order, spreading the work over *processes* worker processes.
+    """
+    if processes == 1:
+        for path in paths:
+            yield _summarize(path)
+        return
+    pool = multiprocessing.Pool(processes)
+    try:
+        for result in pool.imap(_summarize, paths, chunksize=4):
+            yield result
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _target_partname(phys_reader, source_uri, reltype):
+    """
+    Return the partname of the part *source_uri* is related to by a
+    relationship of *reltype*.
+    """
+    for srel in PackageReader._srels_for(phys_reader, source_uri):
+        if srel.reltype == reltype and not srel.is_external:
+            return srel.target_partname
+    raise KeyError("no relationship of type '%s'" % reltype)
+
+
+if __name__ == '__main__':
+    # import by module name so worker processes can find the functions
+    from pptx.extract import main as _main
+    sys.exit(_main())
@@ -7,14 +7,15 @@ writing presentations to and from a .pptx file.
 
 from __future__ import absolute_import
 
+from ..oxml.ns import compiled_xpath
 from ..oxml.shared import serialize_part_xml
 from pptx.util import lazyproperty
 
 from .constants import RELATIONSHIP_TYPE as RT
-from .oxml import CT_Relationships, nsmap
+from .oxml import CT_Relationships
 from .packuri import PACKAGE_URI, PackURI
-from .pkgreader import PackageReader
-from .pkgwriter import PackageWriter
+from .pkgreader import DeferredBlob, PackageReader
+from .pkgwriter import ContentTypesCache, PackageWriter
 
 
 class OpcPackage(object):
@@ -31,14 +32,14 @@ class OpcPackage(object):
         Generate exactly one reference to each of the parts in the package by
         performing a depth-first traversal of the rels graph.
         """
-        def walk_parts(source, visited=list()):
+        def walk_parts(source, visited=set()):
             for rel in source.rels.values():
                 if rel.is_external:
                     continue
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 yield part
                 new_source = part
                 for part in walk_parts(new_source, visited):
@@ -69,12 +70,14 @@ class OpcPackage(object):
         return self.part_related_by(RT.OFFICE_DOCUMENT)
 
     @classmethod
-    def open(cls, pkg_file):
+    def open(cls, pkg_file, load=None):
         """
         Return an |OpcPackage| instance loaded with the contents of
-        *pkg_file*.
+        *pkg_file*. If *load* is not |None|, only the parts it returns
+        |True| for when called with their partname and content type are
+        loaded as usual; the rest are |PassthroughPart| instances.
         """
-        pkg_reader = PackageReader.from_file(pkg_file)
+        pkg_reader = PackageReader.from_file(pkg_file, load)
         package = cls()
         Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
         return package
@@ -119,7 +122,17 @@ class OpcPackage(object):
         # self._notify_before_marshal()
         for part in self.parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        PackageWriter.write(
+            pkg_file, self.rels, self.parts, self._content_types_cache
+        )
+
+    @lazyproperty
+    def _content_types_cache(self):
+        """
+        |ContentTypesCache| instance holding the content types item last
+        written for this package, reused while the parts don't change.
+        """
+        return ContentTypesCache()
 
 
 class Part(object):
@@ -272,7 +285,7 @@ class Part(object):
         identified by *rId*.
         """
         assert self._element is not None
-        rIds = self._element.xpath('//@r:id', namespaces=nsmap)
+        rIds = compiled_xpath('//@r:id')(self._element)
         return len([_rId for _rId in rIds if _rId == rId])
 
     # ----------------------------------------------------------------
@@ -285,6 +298,30 @@ class Part(object):
         return self._package
 
 
+class PassthroughPart(Part):
+    """
+    Part excluded from loading when its package was opened. It is not
+    parsed and its blob is read from the package file only when needed, at
+    the latest when the package is saved, then written back unchanged. The
+    package file must remain available until then.
+    """
+    def before_marshal(self):
+        """
+        Read the blob before the package is saved, in case it is saved over
+        the file the blob is read from.
+        """
+        self.blob
+
+    @property
+    def blob(self):
+        """
+        Contents of this package part as a sequence of bytes.
+        """
+        if isinstance(self._blob, DeferredBlob):
+            self._blob = self._blob.read()
+        return self._blob
+
+
 class PartFactory(object):
     """
     Provides a way for client code to specify a subclass of |Part| to be
@@ -317,6 +354,15 @@ class RelationshipCollection(dict):
         super(RelationshipCollection, self).__init__()
         self._baseURI = baseURI
         self._target_parts_by_rId = {}
+        self._xml_cache = None
+
+    def __delitem__(self, rId):
+        """
+        Remove the relationship identified by *rId*, e.g. ``del rels[rId]``,
+        keeping the mapping of rId to target part in sync.
+        """
+        super(RelationshipCollection, self).__delitem__(rId)
+        self._target_parts_by_rId.pop(rId, None)
 
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
@@ -352,6 +398,14 @@ class RelationshipCollection(dict):
             )
         return rel.rId
 
+    def load_xml(self, rels_xml):
+        """
+        Remember *rels_xml*, the rels item this collection was loaded from,
+        so it can be saved as-is unless the collection changes first. Called
+        once all the relationships in *rels_xml* have been added.
+        """
+        self._xml_cache = (self._xml_key, rels_xml)
+
     def part_with_reltype(self, reltype):
         """
         Return target part of rel with matching *reltype*, raising |KeyError|
@@ -373,14 +427,21 @@ class RelationshipCollection(dict):
     def xml(self):
         """
         Serialize this relationship collection into XML suitable for storage
-        as a .rels file in an OPC package.
+        as a .rels file in an OPC package. The XML is composed again only
+        when a relationship has been added, removed or retargeted, or a
+        target part renamed, since it was loaded or last composed.
         """
+        key = self._xml_key
+        if self._xml_cache is not None and self._xml_cache[0] == key:
+            return self._xml_cache[1]
         rels_elm = CT_Relationships.new()
         for rel in self.values():
             rels_elm.add_rel(
                 rel.rId, rel.reltype, rel.target_ref, rel.is_external
             )
-        return rels_elm.xml
+        xml = rels_elm.xml
+        self._xml_cache = (key, xml)
+        return xml
 
     def _get_matching(self, reltype, target, is_external=False):
         """
@@ -417,6 +478,19 @@ class RelationshipCollection(dict):
             raise ValueError(tmpl % reltype)
         return matching[0]
 
+    @property
+    def _xml_key(self):
+        """
+        Hashable value that changes whenever the XML for this collection
+        would, based on the partname rather than the relative reference of
+        each target part, which is much cheaper to compute.
+        """
+        return frozenset(
+            (rel.rId, rel.reltype, rel.is_external,
+             rel.target_ref if rel.is_external else rel.target_part.partname)
+            for rel in self.values()
+        )
+
     @property
     def _next_rId(self):
         """
@@ -454,10 +528,16 @@ class Unmarshaller(object):
         """
         Return a dictionary of |Part| instances unmarshalled from
         *pkg_reader*, keyed by partname. Side-effect is that each part in
-        *pkg_reader* is constructed using *part_factory*.
+        *pkg_reader* is constructed using *part_factory*, except a part whose
+        blob was deferred, which is a |PassthroughPart|.
         """
         parts = {}
         for partname, content_type, blob in pkg_reader.iter_sparts():
+            if isinstance(blob, DeferredBlob):
+                parts[partname] = PassthroughPart.load(
+                    partname, content_type, blob, package
+                )
+                continue
             parts[partname] = part_factory(
                 partname, content_type, blob, package
             )
@@ -468,19 +548,25 @@ class Unmarshaller(object):
         """
         Add a relationship to the source object corresponding to each of the
         relationships in *pkg_reader* with its target_part set to the actual
-        target part in *parts*.
+        target part in *parts*. The rels item XML of each source is kept
+        for reuse on save.
         """
         for source_uri, srel in pkg_reader.iter_srels():
             source = package if source_uri == '/' else parts[source_uri]
             target = (srel.target_ref if srel.is_external
                       else parts[srel.target_partname])
             source.load_rel(srel.reltype, target, srel.rId, srel.is_external)
+        for source_uri, rels_xml in pkg_reader.iter_rels_xml():
+            source = package if source_uri == '/' else parts[source_uri]
+            source.rels.load_xml(rels_xml)
 
 
 class _Relationship(object):
     """
     Value object for relationship to part.
     """
+    __slots__ = ('_rId', '_reltype', '_target', '_baseURI', '_is_external')
+
     def __init__(self, rId, reltype, target, baseURI, external=False):
         super(_Relationship, self).__init__()
         self._rId = rId
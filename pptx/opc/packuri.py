@@ -9,13 +9,40 @@ import posixpath
 import re
 
 
+class _memoized(object):
+    """
+    Read-only property computed on first access and stored in the instance
+    dict under its own name, where it is found directly from then on. Only
+    suitable for an immutable object like |PackURI|.
+    """
+    def __init__(self, fget):
+        super(_memoized, self).__init__()
+        self._fget = fget
+        self.__name__ = fget.__name__
+        self.__doc__ = fget.__doc__
+
+    def __get__(self, obj, type=None):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.__name__] = self._fget(obj)
+        return value
+
+
 class PackURI(str):
     """
     Provides access to pack URI components such as the baseURI and the
-    filename slice. Behaves as |str| otherwise.
+    filename slice. Behaves as |str| otherwise. Components are computed on
+    first access and kept, a pack URI being immutable.
     """
     _filename_re = re.compile('([a-zA-Z]+)([1-9][0-9]*)?')
 
+    # pack URIs resolved by from_rel_ref(), by (baseURI, relative_ref) and by
+    # URI string, so each part's URI is resolved, and its components
+    # computed, just once however many relationships refer to it
+    _by_rel_ref = {}
+    _by_str = {}
+    _CACHE_LIMIT = 8192
+
     def __new__(cls, pack_uri_str):
         if not pack_uri_str[0] == '/':
             tmpl = "PackURI must begin with slash, got '%s'"
@@ -26,13 +53,29 @@ class PackURI(str):
     def from_rel_ref(baseURI, relative_ref):
         """
         Return a |PackURI| instance containing the absolute pack URI formed by
-        translating *relative_ref* onto *baseURI*.
-        """
+        translating *relative_ref* onto *baseURI*. The same instance is
+        returned for every reference to the same pack URI.
+        """
+        key = (baseURI, relative_ref)
+        by_rel_ref = PackURI._by_rel_ref
+        try:
+            return by_rel_ref[key]
+        except KeyError:
+            pass
         joined_uri = posixpath.join(baseURI, relative_ref)
         abs_uri = posixpath.abspath(joined_uri)
-        return PackURI(abs_uri)
+        by_str = PackURI._by_str
+        pack_uri = by_str.get(abs_uri)
+        if pack_uri is None:
+            if len(by_str) >= PackURI._CACHE_LIMIT:
+                by_str.clear()
+            pack_uri = by_str[abs_uri] = PackURI(abs_uri)
+        if len(by_rel_ref) >= PackURI._CACHE_LIMIT:
+            by_rel_ref.clear()
+        by_rel_ref[key] = pack_uri
+        return pack_uri
 
-    @property
+    @_memoized
     def baseURI(self):
         """
         The base URI of this pack URI, the directory portion, roughly
@@ -41,7 +84,7 @@ class PackURI(str):
         """
         return posixpath.split(self)[0]
 
-    @property
+    @_memoized
     def ext(self):
         """
         The extension portion of this pack URI, e.g. ``'xml'`` for
@@ -51,7 +94,7 @@ class PackURI(str):
         raw_ext = posixpath.splitext(self)[1]
         return raw_ext[1:] if raw_ext.startswith('.') else raw_ext
 
-    @property
+    @_memoized
     def filename(self):
         """
         The "filename" portion of this pack URI, e.g. ``'slide1.xml'`` for
@@ -60,7 +103,7 @@ class PackURI(str):
         """
         return posixpath.split(self)[1]
 
-    @property
+    @_memoized
     def idx(self):
         """
         Return partname index as integer for tuple partname or None for
@@ -101,7 +144,7 @@ class PackURI(str):
             relpath = posixpath.relpath(self, baseURI)
         return relpath
 
-    @property
+    @_memoized
     def rels_uri(self):
         """
         The pack URI of the .rels part corresponding to the current pack URI.
@@ -7,8 +7,10 @@ Provides a general interface to a *physical* OPC package, such as a zip file.
 from __future__ import absolute_import
 
 import os
+import shutil
+import tempfile
 
-from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
+from zipfile import ZipFile, ZipInfo, is_zipfile, ZIP_DEFLATED
 
 from pptx.exceptions import PackageNotFoundError
 
@@ -36,6 +38,73 @@ class PhysPkgReader(object):
         return super(PhysPkgReader, cls).__new__(reader_cls)
 
 
+def replace_file(path, write):
+    """
+    Replace the file at *path* with the one *write* writes when called with
+    the path of a temporary file in the same directory. The temporary file
+    takes on the mode of the original and then takes its place, so the
+    original is left intact if *write* raises.
+    """
+    dirname = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=dirname)
+    os.close(fd)
+    try:
+        write(tmp_path)
+        shutil.copymode(path, tmp_path)
+        if os.name == 'nt':
+            os.remove(path)
+        os.rename(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def rewrite_zip_package(path, blobs):
+    """
+    Replace the members of the zip package at *path* named by the pack URIs
+    in dict *blobs* with the corresponding blob, adding any not already
+    present. Other members are copied as they are, without being parsed.
+    The package is written to a temporary file in the same directory that
+    then takes the place of the original.
+    """
+    blobs = dict(
+        (pack_uri.membername, blob) for pack_uri, blob in blobs.items()
+    )
+
+    def write(tmp_path):
+        zin = ZipFile(path, 'r')
+        try:
+            zout = ZipFile(tmp_path, 'w', compression=ZIP_DEFLATED)
+            try:
+                for zinfo in zin.infolist():
+                    if zinfo.filename in blobs:
+                        zout.writestr(zinfo, blobs.pop(zinfo.filename))
+                    else:
+                        copy_zip_member(zin, zout, zinfo)
+                for membername in sorted(blobs):
+                    zout.writestr(membername, blobs[membername])
+            finally:
+                zout.close()
+        finally:
+            zin.close()
+
+    replace_file(path, write)
+
+
+def copy_zip_member(zin, zout, zinfo):
+    """
+    Copy the member described by *zinfo* from zip file *zin* to the end of
+    zip file *zout*, keeping its name, timestamp, permissions and
+    compression method.
+    """
+    new_zinfo = ZipInfo(zinfo.filename, zinfo.date_time)
+    new_zinfo.compress_type = zinfo.compress_type
+    new_zinfo.create_system = zinfo.create_system
+    new_zinfo.external_attr = zinfo.external_attr
+    zout.writestr(new_zinfo, zin.read(zinfo.filename))
+
+
 class PhysPkgWriter(object):
     """
     Factory for physical package writer objects.
@@ -91,6 +160,15 @@ class _DirPkgReader(PhysPkgReader):
             rels_xml = None
         return rels_xml
 
+    def stream_for(self, pack_uri):
+        """
+        Return a file-like object open for reading the contents of the file
+        corresponding to *pack_uri* in package directory. The caller is
+        responsible for closing it.
+        """
+        path = os.path.join(self._path, pack_uri.membername)
+        return open(path, 'rb')
+
 
 class _ZipPkgReader(PhysPkgReader):
     """
@@ -131,6 +209,15 @@ class _ZipPkgReader(PhysPkgReader):
             rels_xml = None
         return rels_xml
 
+    def stream_for(self, pack_uri):
+        """
+        Return a file-like object that decompresses the member corresponding
+        to *pack_uri* as it is read, so a large part need not be held in
+        memory. The caller is responsible for closing it. Raises |KeyError|
+        if no matching member is present in zip archive.
+        """
+        return self._zipf.open(pack_uri.membername)
+
 
 class _ZipPkgWriter(PhysPkgWriter):
     """
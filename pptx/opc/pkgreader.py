@@ -25,15 +25,21 @@ class PackageReader(object):
         self._sparts = sparts
 
     @staticmethod
-    def from_file(pkg_file):
+    def from_file(pkg_file, load=None):
         """
         Return a |PackageReader| instance loaded with contents of *pkg_file*.
+        If *load* is not |None|, it is called with the partname and content
+        type of each part and the blob of a part it returns |False| for is
+        not read; a |DeferredBlob| stands in for it instead.
         """
         phys_reader = PhysPkgReader(pkg_file)
         content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
         pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+        deferred_reader = (
+            None if load is None else _DeferredBlobReader(pkg_file, load)
+        )
         sparts = PackageReader._load_serialized_parts(
-            phys_reader, pkg_srels, content_types
+            phys_reader, pkg_srels, content_types, deferred_reader
         )
         phys_reader.close()
         return PackageReader(content_types, pkg_srels, sparts)
@@ -46,6 +52,18 @@ class PackageReader(object):
         for spart in self._sparts:
             yield (spart.partname, spart.content_type, spart.blob)
 
+    def iter_rels_xml(self):
+        """
+        Generate a 2-tuple `(source_uri, rels_xml)` for the package and each
+        of the serialized parts that has a rels item, *rels_xml* being the
+        rels item as read from the package.
+        """
+        if self._pkg_srels.xml is not None:
+            yield (PACKAGE_URI, self._pkg_srels.xml)
+        for spart in self._sparts:
+            if spart.srels.xml is not None:
+                yield (spart.partname, spart.srels.xml)
+
     def iter_srels(self):
         """
         Generate a 2-tuple `(source_uri, srel)` for each of the relationships
@@ -58,14 +76,48 @@ class PackageReader(object):
                 yield (spart.partname, srel)
 
     @staticmethod
-    def _load_serialized_parts(phys_reader, pkg_srels, content_types):
+    def read_related_part(phys_reader, source_uri, reltype):
+        """
+        Return a 3-tuple `(partname, content_type, blob)` for the part the
+        source identified by *source_uri* is related to by a relationship of
+        *reltype*, e.g. the core properties part of the package, or |None|
+        if it has no such relationship. Only the rels item of the source,
+        the content types item and the part itself are read using
+        *phys_reader*.
+        """
+        for srel in PackageReader._srels_for(phys_reader, source_uri):
+            if srel.reltype == reltype and not srel.is_external:
+                partname = srel.target_partname
+                break
+        else:
+            return None
+        content_types = _ContentTypeMap.from_xml(
+            phys_reader.content_types_xml
+        )
+        return (
+            partname, content_types[partname], phys_reader.blob_for(partname)
+        )
+
+    @staticmethod
+    def _load_serialized_parts(
+            phys_reader, pkg_srels, content_types, deferred_reader=None):
         """
         Return a list of |_SerializedPart| instances corresponding to the
         parts in *phys_reader* accessible by walking the relationship graph
-        starting with *pkg_srels*.
+        starting with *pkg_srels*. The blob of a part *deferred_reader*
+        defers is a |DeferredBlob| rather than the blob itself.
         """
+        def blob_for(partname):
+            content_type = content_types[partname]
+            if deferred_reader.defers(partname, content_type):
+                return deferred_reader.deferred_blob(partname)
+            return phys_reader.blob_for(partname)
+
         sparts = []
-        part_walker = PackageReader._walk_phys_parts(phys_reader, pkg_srels)
+        part_walker = PackageReader._walk_phys_parts(
+            phys_reader, pkg_srels,
+            blob_for=None if deferred_reader is None else blob_for
+        )
         for partname, blob, srels in part_walker:
             content_type = content_types[partname]
             spart = _SerializedPart(partname, content_type, blob, srels)
@@ -83,13 +135,18 @@ class PackageReader(object):
             source_uri.baseURI, rels_xml)
 
     @staticmethod
-    def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
+    def _walk_phys_parts(
+            phys_reader, srels, visited_partnames=None, blob_for=None):
         """
         Generate a 3-tuple `(partname, blob, srels)` for each of the parts in
-        *phys_reader* by walking the relationship graph rooted at srels.
+        *phys_reader* by walking the relationship graph rooted at srels. The
+        blob is the one returned by *blob_for* when called with the
+        partname, read from *phys_reader* if *blob_for* is |None|.
         """
         if visited_partnames is None:
             visited_partnames = []
+        if blob_for is None:
+            blob_for = phys_reader.blob_for
         for srel in srels:
             if srel.is_external:
                 continue
@@ -98,10 +155,10 @@ class PackageReader(object):
                 continue
             visited_partnames.append(partname)
             part_srels = PackageReader._srels_for(phys_reader, partname)
-            blob = phys_reader.blob_for(partname)
+            blob = blob_for(partname)
             yield (partname, blob, part_srels)
             for partname, blob, srels in PackageReader._walk_phys_parts(
-                    phys_reader, part_srels, visited_partnames):
+                    phys_reader, part_srels, visited_partnames, blob_for):
                 yield (partname, blob, srels)
 
 
@@ -159,6 +216,73 @@ class _ContentTypeMap(object):
         self._overrides[partname] = content_type
 
 
+class DeferredBlob(object):
+    """
+    Stands in for the blob of a part that was not read when its package was
+    opened. :meth:`read` returns the blob, read from the package file on
+    first use.
+    """
+    def __init__(self, reader, partname):
+        super(DeferredBlob, self).__init__()
+        self._reader = reader
+        self._partname = partname
+
+    def read(self):
+        """
+        Return the blob of the part this object stands in for, read from
+        the package file if it has not been read already.
+        """
+        return self._reader.blob_for(self._partname)
+
+
+class _DeferredBlobReader(object):
+    """
+    Reads the blobs of the parts in *pkg_file* that predicate *load* returns
+    |False| for, when one of them is first needed. The deferred blobs are all
+    read at once, so the package file is opened only once more.
+    """
+    def __init__(self, pkg_file, load):
+        super(_DeferredBlobReader, self).__init__()
+        self._pkg_file = pkg_file
+        self._load = load
+        self._pending_partnames = []
+        self._blobs = {}
+
+    def blob_for(self, partname):
+        """
+        Return the blob of deferred part *partname*, reading the blobs of
+        all the pending deferred parts if it is not already read. Each blob
+        is handed out only once, to the part it belongs to.
+        """
+        if partname not in self._blobs:
+            self._read_pending()
+        return self._blobs.pop(partname)
+
+    def deferred_blob(self, partname):
+        """
+        Return a |DeferredBlob| instance for part *partname*, which is added
+        to the parts to read when one is needed.
+        """
+        self._pending_partnames.append(partname)
+        return DeferredBlob(self, partname)
+
+    def defers(self, partname, content_type):
+        """
+        Return |True| if reading the part *partname* having *content_type*
+        is to be deferred.
+        """
+        return not self._load(partname, content_type)
+
+    def _read_pending(self):
+        phys_reader = PhysPkgReader(self._pkg_file)
+        try:
+            for partname in self._pending_partnames:
+                self._blobs[partname] = phys_reader.blob_for(partname)
+        finally:
+            phys_reader.close()
+        self._pending_partnames = []
+
+
 class _SerializedPart(object):
     """
     Value object for an OPC package part. Provides access to the partname,
@@ -194,6 +318,11 @@ class _SerializedRelationship(object):
     Serialized, in this case, means any target part is referred to via its
     partname rather than a direct link to an in-memory |Part| object.
     """
+    __slots__ = (
+        '_baseURI', '_rId', '_reltype', '_target_mode', '_target_ref',
+        '_target_partname',
+    )
+
     def __init__(self, baseURI, rel_elm):
         super(_SerializedRelationship, self).__init__()
         self._baseURI = baseURI
@@ -265,11 +394,20 @@ class _SerializedRelationshipCollection(object):
     def __init__(self):
         super(_SerializedRelationshipCollection, self).__init__()
         self._srels = []
+        self._xml = None
 
     def __iter__(self):
         """Support iteration, e.g. 'for x in srels:'"""
         return self._srels.__iter__()
 
+    @property
+    def xml(self):
+        """
+        The rels item XML this collection was loaded from, |None| if there
+        was no rels item.
+        """
+        return self._xml
+
     @staticmethod
     def load_from_xml(baseURI, rels_item_xml):
         """
@@ -278,6 +416,7 @@ class _SerializedRelationshipCollection(object):
         collection if *rels_item_xml* is |None|.
         """
         srels = _SerializedRelationshipCollection()
+        srels._xml = rels_item_xml
         if rels_item_xml is not None:
             rels_elm = oxml_fromstring(rels_item_xml)
             for rel_elm in rels_elm.Relationship:
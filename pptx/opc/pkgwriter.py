@@ -7,8 +7,9 @@ Convention (OPC) package, essentially an implementation of OpcPackage.save()
 
 from __future__ import absolute_import
 
+from ..oxml.shared import serialize_part_xml
 from .constants import CONTENT_TYPE as CT
-from .oxml import CT_Types, serialize_part_xml
+from .oxml import CT_Types
 from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
 from .phys_pkg import PhysPkgWriter
 from .shared import CaseInsensitiveDict
@@ -23,27 +24,32 @@ class PackageWriter(object):
     be instantiated.
     """
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, content_types_cache=None):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
-        content types of the parts.
+        content types of the parts. The content types stream is reused from
+        *content_types_cache* if it is not |None| and the parts are the same
+        as when it was last written.
         """
         phys_writer = PhysPkgWriter(pkg_file)
-        PackageWriter._write_content_types_stream(phys_writer, parts)
+        PackageWriter._write_content_types_stream(
+            phys_writer, parts, content_types_cache
+        )
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
         PackageWriter._write_parts(phys_writer, parts)
         phys_writer.close()
 
     @staticmethod
-    def _write_content_types_stream(phys_writer, parts):
+    def _write_content_types_stream(
+            phys_writer, parts, content_types_cache=None):
         """
         Write ``[Content_Types].xml`` part to the physical package with an
         appropriate content type lookup target for each part in *parts*.
         """
-        content_types_blob = serialize_part_xml(
-            _ContentTypesItem.xml_for(parts)
-        )
+        if content_types_cache is None:
+            content_types_cache = ContentTypesCache()
+        content_types_blob = content_types_cache.blob_for(parts)
         phys_writer.write(CONTENT_TYPES_URI, content_types_blob)
 
     @staticmethod
@@ -66,6 +72,29 @@ class PackageWriter(object):
         phys_writer.write(PACKAGE_URI.rels_uri, pkg_rels.xml)
 
 
+class ContentTypesCache(object):
+    """
+    Holds the content types item last composed for a package, so it can be
+    written again without being composed again while the partnames and
+    content types of the package's parts are unchanged.
+    """
+    def __init__(self):
+        super(ContentTypesCache, self).__init__()
+        self._key = None
+        self._blob = None
+
+    def blob_for(self, parts):
+        """
+        Return the serialized ``[Content_Types].xml`` item for *parts*,
+        composed only if it differs from the last one returned.
+        """
+        key = frozenset((part.partname, part.content_type) for part in parts)
+        if key != self._key:
+            self._blob = serialize_part_xml(_ContentTypesItem.xml_for(parts))
+            self._key = key
+        return self._blob
+
+
 class _ContentTypesItem(object):
     """
     Service class that composes a content types item ([Content_Types].xml)
@@ -119,10 +119,13 @@ register_custom_element_class('a:xfrm', CT_Transform2D)
 register_custom_element_class('p:xfrm', CT_Transform2D)
 
 
-from .shapes.table import CT_Table, CT_TableCell, CT_TableCellProperties
-register_custom_element_class('a:tbl',  CT_Table)
-register_custom_element_class('a:tc',   CT_TableCell)
-register_custom_element_class('a:tcPr', CT_TableCellProperties)
+from .shapes.table import (
+    CT_Table, CT_TableCell, CT_TableCellProperties, CT_TableProperties
+)
+register_custom_element_class('a:tbl',   CT_Table)
+register_custom_element_class('a:tblPr', CT_TableProperties)
+register_custom_element_class('a:tc',    CT_TableCell)
+register_custom_element_class('a:tcPr',  CT_TableCellProperties)
 
 
 from .slide import CT_Slide
@@ -140,7 +143,7 @@ register_custom_element_class('p:sldMaster',      CT_SlideMaster)
 from .text import (
     CT_Hyperlink, CT_RegularTextRun, CT_TextBody, CT_TextBodyProperties,
     CT_TextCharacterProperties, CT_TextFont, CT_TextParagraph,
-    CT_TextParagraphProperties
+    CT_TextParagraphProperties, CT_TextRunText
 )
 register_custom_element_class('a:bodyPr',     CT_TextBodyProperties)
 register_custom_element_class('a:defRPr',     CT_TextCharacterProperties)
@@ -151,4 +154,5 @@ register_custom_element_class('a:r',          CT_RegularTextRun)
 register_custom_element_class('a:p',          CT_TextParagraph)
 register_custom_element_class('a:pPr',        CT_TextParagraphProperties)
 register_custom_element_class('a:rPr',        CT_TextCharacterProperties)
+register_custom_element_class('a:t',          CT_TextRunText)
 register_custom_element_class('p:txBody',     CT_TextBody)
@@ -6,40 +6,24 @@ lxml custom element classes for DrawingML-related XML elements.
 
 from __future__ import absolute_import
 
-from lxml import objectify
-
 from ...enum.dml import MSO_THEME_COLOR
 from ..ns import qn
-from ..shared import SubElement
-
+from ..shared import BaseOxmlElement, SubElement
+from ..simpletypes import XsdString
+from ..xmlchemy import PropertySetterMixin, RequiredAttribute
 
-class OxmlElement(objectify.ObjectifiedElement):
 
-    def _first_child_found_in(self, *tagnames):
-        """
-        Return the first child found with tag in *tagnames*, or None if
-        not found.
-        """
-        for tagname in tagnames:
-            child = self.find(qn(tagname))
-            if child is not None:
-                return child
-        return None
+class OxmlElement(BaseOxmlElement):
+    """
+    Base class for the DrawingML custom element classes in this module.
+    """
 
 
-class _BaseColorElement(OxmlElement):
+class _BaseColorElement(PropertySetterMixin, OxmlElement):
     """
     Base class for <a:srgbClr> and <a:schemeClr> elements.
     """
-    def __setattr__(self, name, value):
-        """
-        Override ``__setattr__`` defined in ObjectifiedElement super class
-        to intercept messages intended for custom property setters.
-        """
-        if name == 'val':
-            self._set_val(value)
-        else:
-            super(_BaseColorElement, self).__setattr__(name, value)
+    val = RequiredAttribute('val', XsdString)
 
     def add_lumMod(self, value):
         """
@@ -78,13 +62,6 @@ class _BaseColorElement(OxmlElement):
         """
         return self.find(qn('a:lumOff'))
 
-    @property
-    def val(self):
-        return self.get('val')
-
-    def _set_val(self, value):
-        self.set('val', value)
-
 
 class CT_HslColor(_BaseColorElement):
     """
@@ -111,15 +88,7 @@ class CT_SchemeColor(_BaseColorElement):
     """
     Custom element class for <a:schemeClr> element.
     """
-    @property
-    def val(self):
-        val = self.get('val')
-        mso_theme_color_idx = MSO_THEME_COLOR.from_xml(val)
-        return mso_theme_color_idx
-
-    def _set_val(self, mso_theme_color_idx):
-        val = MSO_THEME_COLOR.to_xml(mso_theme_color_idx)
-        self.set('val', val)
+    val = RequiredAttribute('val', MSO_THEME_COLOR)
 
 
 class CT_ScRgbColor(_BaseColorElement):
@@ -6,24 +6,14 @@ lxml custom element classes for DrawingML-related XML elements.
 
 from __future__ import absolute_import
 
-from lxml import objectify
-
 from ..ns import qn
-from ..shared import SubElement
-
+from ..shared import BaseOxmlElement, SubElement
 
-class OxmlElement(objectify.ObjectifiedElement):
 
-    def _first_child_found_in(self, *tagnames):
-        """
-        Return the first child found with tag in *tagnames*, or None if
-        not found.
-        """
-        for tagname in tagnames:
-            child = self.find(qn(tagname))
-            if child is not None:
-                return child
-        return None
+class OxmlElement(BaseOxmlElement):
+    """
+    Base class for the DrawingML custom element classes in this module.
+    """
 
 
 class CT_BlipFillProperties(OxmlElement):
@@ -66,7 +56,7 @@ class CT_SolidColorFillProperties(OxmlElement):
         Return the child representing the EG_ColorChoice element group in
         this element, or |None| if no such child is present.
         """
-        return self._first_child_found_in(
+        return self.first_child_found_in(
             'a:scrgbClr', 'a:srgbClr', 'a:hslClr', 'a:sysClr', 'a:schemeClr',
             'a:prstClr'
         )
@@ -6,6 +6,8 @@ Namespace related objects.
 
 from __future__ import absolute_import
 
+from lxml import etree
+
 
 #: Maps namespace prefix to namespace name for all known PowerPoint XML
 #: namespaces.
@@ -96,6 +98,25 @@ class NamespacePrefixedTag(str):
         return self._ns_uri
 
 
+def compiled_xpath(expression):
+    """
+    Return an ``etree.XPath`` instance for *expression*, which can use any
+    of the namespace prefixes in ``_nsmap``, e.g.
+    ``compiled_xpath('./p:cSld/p:spTree')(sld)``. Each distinct expression is
+    compiled on first use and the compiled form reused after that. XPath
+    variables like ``$rId`` are passed as keyword arguments in the call.
+    """
+    try:
+        return _compiled_xpaths[expression]
+    except KeyError:
+        xpath = etree.XPath(expression, namespaces=_nsmap)
+        _compiled_xpaths[expression] = xpath
+        return xpath
+
+
+_compiled_xpaths = {}
+
+
 def namespaces(*prefixes):
     """
     Return a dict containing the subset namespace prefix mappings specified by
@@ -129,7 +150,15 @@ def qn(namespace_prefixed_tag):
     Return a Clark-notation qualified tag name corresponding to
     *namespace_prefixed_tag*, a string like 'p:body'. 'qn' stands for
     *qualified name*. As an example, ``qn('p:cSld')`` returns
-    ``'{http://schemas.../main}cSld'``.
+    ``'{http://schemas.../main}cSld'``. Clark names are cached, so the same
+    string object is returned each time for a given tag.
     """
-    nsptag = NamespacePrefixedTag(namespace_prefixed_tag)
-    return nsptag.clark_name
+    try:
+        return _clark_names[namespace_prefixed_tag]
+    except KeyError:
+        clark_name = NamespacePrefixedTag(namespace_prefixed_tag).clark_name
+        _clark_names[namespace_prefixed_tag] = clark_name
+        return clark_name
+
+
+_clark_names = {}
@@ -7,7 +7,9 @@ Custom element classes for presentation-related XML elements.
 from __future__ import absolute_import
 
 from .shared import BaseOxmlElement, child, Element, SubElement
-from .ns import _nsmap, qn
+from .ns import compiled_xpath, qn
+from .simpletypes import ST_Coordinate
+from .xmlchemy import PropertySetterMixin, RequiredAttribute
 
 
 class CT_Presentation(BaseOxmlElement):
@@ -108,7 +110,7 @@ class CT_SlideIdList(BaseOxmlElement):
         Return the next available slide ID as a string. Valid slide IDs start
         at 256. Unused ids in the sequences starting from 256 are used first.
         """
-        id_str_lst = self.xpath('./p:sldId/@id', namespaces=_nsmap)
+        id_str_lst = compiled_xpath('./p:sldId/@id')(self)
         used_ids = [int(id_str) for id_str in id_str_lst]
         for n in range(256, 258+len(used_ids)):
             if n not in used_ids:
@@ -152,26 +154,10 @@ class CT_SlideMasterIdListEntry(BaseOxmlElement):
         return self.get(qn('r:id'))
 
 
-class CT_SlideSize(BaseOxmlElement):
+class CT_SlideSize(PropertySetterMixin, BaseOxmlElement):
     """
     ``<p:sldSz>`` element, direct child of <p:presentation> that contains the
     width and height of slides in the presentation.
     """
-    def __setattr__(self, name, value):
-        """
-        Override ``__setattr__`` defined in ObjectifiedElement super class
-        to intercept messages intended for custom property setters.
-        """
-        if name in ('cx', 'cy'):
-            value_str = str(int(value))
-            self.set(name, value_str)
-        else:
-            super(CT_SlideSize, self).__setattr__(name, value)
-
-    @property
-    def cx(self):
-        return int(self.get('cx'))
-
-    @property
-    def cy(self):
-        return int(self.get('cy'))
+    cx = RequiredAttribute('cx', ST_Coordinate)
+    cy = RequiredAttribute('cy', ST_Coordinate)
@@ -11,7 +11,7 @@ from .graphfrm import CT_GraphicalObjectFrame
 from ..ns import qn
 from .picture import CT_Picture
 from .shared import BaseShapeElement
-from ..shared import BaseOxmlElement, Element
+from ..shared import BaseOxmlElement, ChildTagnames, Element
 
 
 class CT_GroupShape(BaseShapeElement):
@@ -25,13 +25,20 @@ class CT_GroupShape(BaseShapeElement):
         qn('p:pic'), qn('p:contentPart')
     )
 
+    child_tagnames = ChildTagnames.from_nested_sequence(
+        'p:nvGrpSpPr', 'p:grpSpPr',
+        ('p:sp', 'p:grpSp', 'p:graphicFrame', 'p:cxnSp', 'p:pic',
+         'p:contentPart'),
+        'p:extLst',
+    )
+
     def add_autoshape(self, id_, name, prst, x, y, cx, cy):
         """
         Append a new ``<p:sp>`` shape to the group/shapetree having the
         properties specified in call.
         """
         sp = CT_Shape.new_autoshape_sp(id_, name, prst, x, y, cx, cy)
-        self.insert_element_before(sp, 'p:extLst')
+        self.insert_element_in_sequence(sp)
         return sp
 
     def add_pic(self, id_, name, desc, rId, x, y, cx, cy):
@@ -40,7 +47,7 @@ class CT_GroupShape(BaseShapeElement):
         as specified in call.
         """
         pic = CT_Picture.new_pic(id_, name, desc, rId, x, y, cx, cy)
-        self.insert_element_before(pic, 'p:extLst')
+        self.insert_element_in_sequence(pic)
         return pic
 
     def add_placeholder(self, id_, name, ph_type, orient, sz, idx):
@@ -51,7 +58,7 @@ class CT_GroupShape(BaseShapeElement):
         sp = CT_Shape.new_placeholder_sp(
             id_, name, ph_type, orient, sz, idx
         )
-        self.insert_element_before(sp, 'p:extLst')
+        self.insert_element_in_sequence(sp)
         return sp
 
     def add_table(self, id_, name, rows, cols, x, y, cx, cy):
@@ -62,7 +69,7 @@ class CT_GroupShape(BaseShapeElement):
         graphicFrame = CT_GraphicalObjectFrame.new_table(
             id_, name, rows, cols, x, y, cx, cy
         )
-        self.insert_element_before(graphicFrame, 'p:extLst')
+        self.insert_element_in_sequence(graphicFrame)
         return graphicFrame
 
     def add_textbox(self, id_, name, x, y, cx, cy):
@@ -71,7 +78,7 @@ class CT_GroupShape(BaseShapeElement):
         position and size.
         """
         sp = CT_Shape.new_textbox_sp(id_, name, x, y, cx, cy)
-        self.insert_element_before(sp, 'p:extLst')
+        self.insert_element_in_sequence(sp)
         return sp
 
     def get_or_add_xfrm(self):
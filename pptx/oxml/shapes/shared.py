@@ -10,36 +10,25 @@ from ..dml.fill import EG_FillProperties
 from ..dml.line import (
     EG_LineDashProperties, EG_LineFillProperties, EG_LineJoinProperties
 )
-from ..ns import _nsmap, qn
+from ..ns import compiled_xpath, qn
 from ..shared import BaseOxmlElement, ChildTagnames, Element
+from ..simpletypes import ST_Coordinate, ST_LineWidth
+from ..xmlchemy import (
+    Delegated, OptionalAttribute, PropertySetterMixin, RequiredAttribute,
+    ZeroOrOne
+)
 from ...util import Emu
 
 
-class BaseShapeElement(BaseOxmlElement):
+class BaseShapeElement(PropertySetterMixin, BaseOxmlElement):
     """
     Provides common behavior for shape element classes like CT_Shape,
     CT_Picture, etc.
     """
-    def __getattr__(self, name):
-        # common code for position and size attributes
-        if name in ('x', 'y', 'cx', 'cy'):
-            xfrm = self.xfrm
-            if xfrm is None:
-                return None
-            return getattr(xfrm, name)
-        else:
-            return super(BaseShapeElement, self).__getattr__(name)
-
-    def __setattr__(self, name, value):
-        """
-        Override ``__setattr__`` defined in ObjectifiedElement super class
-        to intercept messages intended for custom property setters.
-        """
-        if name in ('x', 'y', 'cx', 'cy'):
-            xfrm = self.get_or_add_xfrm()
-            setattr(xfrm, name, value)
-        else:
-            super(BaseShapeElement, self).__setattr__(name, value)
+    x = Delegated('xfrm', 'x', 'get_or_add_xfrm')
+    y = Delegated('xfrm', 'y', 'get_or_add_xfrm')
+    cx = Delegated('xfrm', 'cx', 'get_or_add_xfrm')
+    cy = Delegated('xfrm', 'cy', 'get_or_add_xfrm')
 
     def get_or_add_xfrm(self):
         """
@@ -62,8 +51,7 @@ class BaseShapeElement(BaseOxmlElement):
         """
         The ``<p:ph>`` descendant element if there is one, None otherwise.
         """
-        xpath = './*[1]/p:nvPr/p:ph'
-        ph_elms = self.xpath(xpath, namespaces=_nsmap)
+        ph_elms = compiled_xpath('./*[1]/p:nvPr/p:ph')(self)
         if len(ph_elms) == 0:
             return None
         return ph_elms[0]
@@ -148,7 +136,7 @@ class BaseShapeElement(BaseOxmlElement):
         Non-visual shape properties element for this shape. Actual name
         depends on the shape type, e.g. ``<p:nvPicPr>`` for picture shape.
         """
-        return self.xpath('./*[1]', namespaces=_nsmap)[0]
+        return compiled_xpath('./*[1]')(self)[0]
 
 
 class Fillable(BaseOxmlElement):
@@ -197,18 +185,14 @@ class Fillable(BaseOxmlElement):
         EG_FillProperties element is present.
         """
         noFill = Element('a:noFill')
-        successor_tagnames = self.child_tagnames_after('a:noFill')
-        self.insert_element_before(noFill, *successor_tagnames)
-        return noFill
+        return self.insert_element_in_sequence(noFill)
 
     def _add_solidFill(self):
         """
         Return a newly added <a:solidFill> child element.
         """
         solidFill = Element('a:solidFill')
-        successor_tagnames = self.child_tagnames_after('a:solidFill')
-        self.insert_element_before(solidFill, *successor_tagnames)
-        return solidFill
+        return self.insert_element_in_sequence(solidFill)
 
 
 class EG_EffectProperties(object):
@@ -221,7 +205,7 @@ class EG_Geometry(object):
     __member_names__ = ('a:custGeom', 'a:prstGeom')
 
 
-class CT_LineProperties(Fillable):
+class CT_LineProperties(PropertySetterMixin, Fillable):
     """
     Custom element class for <a:ln> element
     """
@@ -233,20 +217,7 @@ class CT_LineProperties(Fillable):
         'a:headEnd', 'a:tailEnd', 'a:extLst',
     )
 
-    def __setattr__(self, name, value):
-        """
-        Override ``__setattr__`` defined in ObjectifiedElement super class
-        to intercept messages intended for custom property setters.
-        """
-        if name == 'w':
-            if value is None:
-                if name in self.attrib:
-                    del self.attrib[name]
-            else:
-                val = str(value)
-                self.set(name, val)
-        else:
-            super(CT_LineProperties, self).__setattr__(name, value)
+    w = OptionalAttribute('w', ST_LineWidth)
 
     @property
     def fill_element(self):
@@ -264,77 +235,21 @@ class CT_LineProperties(Fillable):
         """
         self.remove_if_present(*EG_LineFillProperties.__member_names__)
 
-    @property
-    def w(self):
-        """
-        Integer value of optional ``w`` attribute, or |None| if not present
-        """
-        w_str = self.get('w')
-        if w_str is None:
-            return None
-        return Emu(int(w_str))
-
 
-class CT_Point2D(BaseOxmlElement):
+class CT_Point2D(PropertySetterMixin, BaseOxmlElement):
     """
     Custom element class for <a:off> element.
     """
-    def __setattr__(self, name, value):
-        """
-        Override ``__setattr__`` defined in ObjectifiedElement super class
-        to intercept messages intended for custom property setters.
-        """
-        if name in ('x', 'y'):
-            self.set(name, str(value))
-        else:
-            super(CT_Point2D, self).__setattr__(name, value)
+    x = RequiredAttribute('x', ST_Coordinate)
+    y = RequiredAttribute('y', ST_Coordinate)
 
-    @property
-    def x(self):
-        """
-        Integer value of required ``x`` attribute.
-        """
-        x_str = self.get('x')
-        return int(x_str)
-
-    @property
-    def y(self):
-        """
-        Integer value of required ``y`` attribute.
-        """
-        y_str = self.get('y')
-        return int(y_str)
 
-
-class CT_PositiveSize2D(BaseOxmlElement):
+class CT_PositiveSize2D(PropertySetterMixin, BaseOxmlElement):
     """
     Custom element class for <a:ext> element.
     """
-    def __setattr__(self, name, value):
-        """
-        Override ``__setattr__`` defined in ObjectifiedElement super class
-        to intercept messages intended for custom property setters.
-        """
-        if name in ('cx', 'cy'):
-            self.set(name, str(value))
-        else:
-            super(CT_PositiveSize2D, self).__setattr__(name, value)
-
-    @property
-    def cx(self):
-        """
-        Integer value of required ``cx`` attribute.
-        """
-        cx_str = self.get('cx')
-        return int(cx_str)
-
-    @property
-    def cy(self):
-        """
-        Integer value of required ``cy`` attribute.
-        """
-        cy_str = self.get('cy')
-        return int(cy_str)
+    cx = RequiredAttribute('cx', ST_Coordinate)
+    cy = RequiredAttribute('cy', ST_Coordinate)
 
 
 class CT_ShapeProperties(Fillable):
@@ -358,7 +273,7 @@ class CT_ShapeProperties(Fillable):
         """
         Shape width as an instance of Emu, or None if not present.
         """
-        cx_str_lst = self.xpath('./a:xfrm/a:ext/@cx', namespaces=_nsmap)
+        cx_str_lst = compiled_xpath('./a:xfrm/a:ext/@cx')(self)
         if not cx_str_lst:
             return None
         return Emu(cx_str_lst[0])
@@ -368,7 +283,7 @@ class CT_ShapeProperties(Fillable):
         """
         Shape height as an instance of Emu, or None if not present.
         """
-        cy_str_lst = self.xpath('./a:xfrm/a:ext/@cy', namespaces=_nsmap)
+        cy_str_lst = compiled_xpath('./a:xfrm/a:ext/@cy')(self)
         if not cy_str_lst:
             return None
         return Emu(cy_str_lst[0])
@@ -422,7 +337,7 @@ class CT_ShapeProperties(Fillable):
         slide, as an instance of Emu. Corresponds to the value of the
         `./xfrm/off/@x` attribute. None if not present.
         """
-        x_str_lst = self.xpath('./a:xfrm/a:off/@x', namespaces=_nsmap)
+        x_str_lst = compiled_xpath('./a:xfrm/a:off/@x')(self)
         if not x_str_lst:
             return None
         return Emu(x_str_lst[0])
@@ -440,7 +355,7 @@ class CT_ShapeProperties(Fillable):
         The offset of the top of the shape from the top of the slide, as an
         instance of Emu. None if not present.
         """
-        y_str_lst = self.xpath('./a:xfrm/a:off/@y', namespaces=_nsmap)
+        y_str_lst = compiled_xpath('./a:xfrm/a:off/@y')(self)
         if not y_str_lst:
             return None
         return Emu(y_str_lst[0])
@@ -451,59 +366,26 @@ class CT_ShapeProperties(Fillable):
         responsibility to ensure one is not already present.
         """
         ln = Element('a:ln')
-        successor_tagnames = self.child_tagnames_after('a:ln')
-        self.insert_element_before(ln, *successor_tagnames)
-        return ln
+        return self.insert_element_in_sequence(ln)
 
     def _add_xfrm(self):
         """
         Return a newly added <a:xfrm> child element.
         """
         xfrm = Element('a:xfrm')
-        successor_tagnames = self.child_tagnames_after('a:xfrm')
-        self.insert_element_before(xfrm, *successor_tagnames)
-        return xfrm
+        return self.insert_element_in_sequence(xfrm)
 
 
-class CT_Transform2D(BaseOxmlElement):
+class CT_Transform2D(PropertySetterMixin, BaseOxmlElement):
     """
     Custom element class for <a:xfrm> element.
     """
-    def __getattr__(self, name):
-        # common code for position and size attributes
-        if name in ('x', 'y'):
-            off = self.off
-            if off is None:
-                return None
-            return getattr(off, name)
-        elif name in ('cx', 'cy'):
-            ext = self.ext
-            if ext is None:
-                return None
-            return getattr(ext, name)
-        else:
-            return super(CT_Transform2D, self).__getattr__(name)
-
-    def __setattr__(self, name, value):
-        """
-        Override ``__setattr__`` defined in ObjectifiedElement super class
-        to intercept messages intended for custom property setters.
-        """
-        if name in ('x', 'y'):
-            off = self.get_or_add_off()
-            setattr(off, name, value)
-        elif name in ('cx', 'cy'):
-            ext = self.get_or_add_ext()
-            setattr(ext, name, value)
-        else:
-            super(CT_Transform2D, self).__setattr__(name, value)
-
-    @property
-    def ext(self):
-        """
-        The <a:ext> child element, or None if not present.
-        """
-        return self.find(qn('a:ext'))
+    ext = ZeroOrOne('a:ext')
+    off = ZeroOrOne('a:off')
+    x = Delegated('off', 'x', 'get_or_add_off')
+    y = Delegated('off', 'y', 'get_or_add_off')
+    cx = Delegated('ext', 'cx', 'get_or_add_ext')
+    cy = Delegated('ext', 'cy', 'get_or_add_ext')
 
     def get_or_add_ext(self):
         """
@@ -531,13 +413,6 @@ class CT_Transform2D(BaseOxmlElement):
             self.insert(0, off)
         return off
 
-    @property
-    def off(self):
-        """
-        The <a:off> child element, or None if not present.
-        """
-        return self.find(qn('a:off'))
-
 
 class ST_Direction(object):
     """
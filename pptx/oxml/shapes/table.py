@@ -8,13 +8,18 @@ from __future__ import absolute_import
 
 from lxml import objectify
 
-from .. import parse_xml_bytes, XSD_TRUE
+from .. import parse_xml_bytes
 from ...enum.text import MSO_ANCHOR
 from ..ns import nsdecls, qn
-from ..shared import Element, SubElement
+from ..dml.fill import EG_FillProperties
+from ..shared import BaseOxmlElement, ChildTagnames, Element, SubElement
+from ..simpletypes import ST_Coordinate32, XsdBooleanTrueOrAbsent
+from ..xmlchemy import (
+    Delegated, OptionalAttribute, PropertySetterMixin, ZeroOrOne
+)
 
 
-class CT_Table(objectify.ObjectifiedElement):
+class CT_Table(PropertySetterMixin, BaseOxmlElement):
     """``<a:tbl>`` custom element class"""
     _tbl_tmpl = (
         '<a:tbl %s>\n'
@@ -29,54 +34,13 @@ class CT_Table(objectify.ObjectifiedElement):
         'bandCol', 'bandRow', 'firstCol', 'firstRow', 'lastCol', 'lastRow'
     )
 
-    def __getattr__(self, attr):
-        """
-        Implement getter side of properties. Filters ``__getattr__`` messages
-        to ObjectifiedElement base class to intercept messages intended for
-        custom property getters.
-        """
-        if attr in CT_Table.BOOLPROPS:
-            return self._get_boolean_property(attr)
-        else:
-            return super(CT_Table, self).__getattr__(attr)
-
-    def __setattr__(self, attr, value):
-        """
-        Implement setter side of properties. Filters ``__setattr__`` messages
-        to ObjectifiedElement base class to intercept messages intended for
-        custom property setters.
-        """
-        if attr in CT_Table.BOOLPROPS:
-            self._set_boolean_property(attr, value)
-        else:
-            super(CT_Table, self).__setattr__(attr, value)
-
-    def _get_boolean_property(self, propname):
-        """
-        Generalized getter for the boolean properties on the ``<a:tblPr>``
-        child element. Defaults to False if *propname* attribute is missing
-        or ``<a:tblPr>`` element itself is not present.
-        """
-        if not self.has_tblPr:
-            return False
-        return self.tblPr.get(propname) in ('1', 'true')
-
-    def _set_boolean_property(self, propname, value):
-        """
-        Generalized setter for boolean properties on the ``<a:tblPr>`` child
-        element, setting *propname* attribute appropriately based on *value*.
-        If *value* is truthy, the attribute is set to "1"; a tblPr child
-        element is added if necessary. If *value* is falsey, the *propname*
-        attribute is removed if present, allowing its default value of False
-        to be its effective value.
-        """
-        if value:
-            tblPr = self._get_or_insert_tblPr()
-            tblPr.set(propname, XSD_TRUE)
-        elif not self.has_tblPr:
-            pass
-        elif propname in self.tblPr.attrib:
-            del self.tblPr.attrib[propname]
+    tblPr = ZeroOrOne('a:tblPr')
+    bandCol = Delegated('tblPr', 'bandCol', '_get_or_insert_tblPr', False)
+    bandRow = Delegated('tblPr', 'bandRow', '_get_or_insert_tblPr', False)
+    firstCol = Delegated('tblPr', 'firstCol', '_get_or_insert_tblPr', False)
+    firstRow = Delegated('tblPr', 'firstRow', '_get_or_insert_tblPr', False)
+    lastCol = Delegated('tblPr', 'lastCol', '_get_or_insert_tblPr', False)
+    lastRow = Delegated('tblPr', 'lastRow', '_get_or_insert_tblPr', False)
 
     @property
     def has_tblPr(self):
@@ -84,18 +48,15 @@ class CT_Table(objectify.ObjectifiedElement):
         True if this ``<a:tbl>`` element has a ``<a:tblPr>`` child element,
         False otherwise.
         """
-        try:
-            self.tblPr
-            return True
-        except AttributeError:
-            return False
+        return self.tblPr is not None
 
     def _get_or_insert_tblPr(self):
         """Return tblPr child element, inserting a new one if not present"""
-        if not self.has_tblPr:
+        tblPr = self.tblPr
+        if tblPr is None:
             tblPr = Element('a:tblPr')
             self.insert(0, tblPr)
-        return self.tblPr
+        return tblPr
 
     @staticmethod
     def new_tbl(rows, cols, width, height, tableStyleId=None):
@@ -129,7 +90,7 @@ class CT_Table(objectify.ObjectifiedElement):
         return tbl
 
 
-class CT_TableCell(objectify.ObjectifiedElement):
+class CT_TableCell(PropertySetterMixin, BaseOxmlElement):
     """``<a:tc>`` custom element class"""
     _tc_tmpl = (
         '<a:tc %s>\n'
@@ -142,18 +103,12 @@ class CT_TableCell(objectify.ObjectifiedElement):
         '</a:tc>' % nsdecls('a')
     )
 
-    def __setattr__(self, attr, value):
-        """
-        This hack is needed to make setter side of properties work,
-        overrides ``__setattr__`` defined in ObjectifiedElement super class
-        just enough to route messages intended for custom property setters.
-        """
-        if attr == 'anchor':
-            self._set_anchor(value)
-        elif attr in ('marT', 'marR', 'marB', 'marL'):
-            self._set_marX(attr, value)
-        else:
-            super(CT_TableCell, self).__setattr__(attr, value)
+    marT = Delegated('tcPr', 'marT', 'get_or_add_tcPr', 45720)
+    marR = Delegated('tcPr', 'marR', 'get_or_add_tcPr', 91440)
+    marB = Delegated('tcPr', 'marB', 'get_or_add_tcPr', 45720)
+    marL = Delegated('tcPr', 'marL', 'get_or_add_tcPr', 91440)
+    tcPr = ZeroOrOne('a:tcPr')
+    txBody = ZeroOrOne('a:txBody')
 
     @property
     def anchor(self):
@@ -166,6 +121,10 @@ class CT_TableCell(objectify.ObjectifiedElement):
         anchor = self.tcPr.get('anchor')
         return MSO_ANCHOR.from_xml(anchor)
 
+    @anchor.setter
+    def anchor(self, anchor_enum_idx):
+        self._set_anchor(anchor_enum_idx)
+
     def get_or_add_tcPr(self):
         tcPr = self.tcPr
         if tcPr is None:
@@ -186,34 +145,6 @@ class CT_TableCell(objectify.ObjectifiedElement):
             self.insert(0, txBody)
         return self.txBody
 
-    @property
-    def marT(self):
-        """
-        Read/write integer top margin value represented in ``marT`` attribute
-        of the ``<a:tcPr>`` child element of this ``<a:tc>`` element. If the
-        attribute is not present, the default value ``45720`` (0.05 inches)
-        is returned for top and bottom; ``91440`` (0.10 inches) is the
-        default for left and right. Assigning |None| to any ``marX``
-        property clears that attribute from the element, effectively setting
-        it to the default value.
-        """
-        return self._get_marX('marT', 45720)
-
-    @property
-    def marR(self):
-        """right margin value represented in ``marR`` attribute"""
-        return self._get_marX('marR', 91440)
-
-    @property
-    def marB(self):
-        """bottom margin value represented in ``marB`` attribute"""
-        return self._get_marX('marB', 45720)
-
-    @property
-    def marL(self):
-        """left margin value represented in ``marL`` attribute"""
-        return self._get_marX('marL', 91440)
-
     @staticmethod
     def new_tc():
         """Return a new ``<a:tc>`` element tree"""
@@ -222,17 +153,6 @@ class CT_TableCell(objectify.ObjectifiedElement):
         objectify.deannotate(tc, cleanup_namespaces=True)
         return tc
 
-    @property
-    def tcPr(self):
-        return self.find(qn('a:tcPr'))
-
-    @property
-    def txBody(self):
-        """
-        The <a:txBody> child element, or None if not present.
-        """
-        return self.find(qn('a:txBody'))
-
     def _clear_anchor(self):
         """
         Remove anchor attribute from ``<a:tcPr>`` if it exists
@@ -242,14 +162,6 @@ class CT_TableCell(objectify.ObjectifiedElement):
         if 'anchor' in self.tcPr.attrib:
             del self.tcPr.attrib['anchor']
 
-    def _get_marX(self, attr_name, default):
-        """
-        generalized method to get margin values
-        """
-        if self.tcPr is None:
-            return default
-        return int(self.tcPr.get(attr_name, default))
-
     def _set_anchor(self, anchor_enum_idx):
         """
         Set value of anchor attribute on ``<a:tcPr>`` child element
@@ -260,32 +172,30 @@ class CT_TableCell(objectify.ObjectifiedElement):
         tcPr = self.get_or_add_tcPr()
         tcPr.set('anchor', anchor)
 
-    def _set_marX(self, marX, value):
-        """
-        Set value of marX attribute on ``<a:tcPr>`` child element. If *marX*
-        is |None|, the marX attribute is removed.
-        """
-        tcPr = self.get_or_add_tcPr()
-        if value is None:
-            if marX in tcPr.attrib:
-                del tcPr.attrib[marX]
-        else:
-            tcPr.set(marX, str(value))
-
 
-class CT_TableCellProperties(objectify.ObjectifiedElement):
+class CT_TableCellProperties(PropertySetterMixin, BaseOxmlElement):
     """
     ``<a:tcPr>`` custom element class
     """
+    child_tagnames = ChildTagnames.from_nested_sequence(
+        'a:lnL', 'a:lnR', 'a:lnT', 'a:lnB', 'a:lnTlToBr', 'a:lnBlToTr',
+        'a:cell3D', EG_FillProperties.__member_names__, 'a:headers',
+        'a:extLst',
+    )
+
+    marT = OptionalAttribute('marT', ST_Coordinate32, 45720)
+    marR = OptionalAttribute('marR', ST_Coordinate32, 91440)
+    marB = OptionalAttribute('marB', ST_Coordinate32, 45720)
+    marL = OptionalAttribute('marL', ST_Coordinate32, 91440)
+
     @property
     def fill_element(self):
         """
         Return the child representing the EG_FillProperties element group
         member in this element, or |None| if no such child is present.
         """
-        return self._first_child_found_in(
-            'a:noFill', 'a:solidFill', 'a:gradFill', 'a:blipFill',
-            'a:pattFill', 'a:grpFill'
+        return self.first_child_found_in(
+            *EG_FillProperties.__member_names__
         )
 
     def get_or_change_to_noFill(self):
@@ -297,7 +207,7 @@ class CT_TableCellProperties(objectify.ObjectifiedElement):
         if self.noFill is not None:
             return self.noFill
         # get rid of other fill element type if there is one
-        self._remove_if_present(
+        self.remove_if_present(
             'a:solidFill', 'a:gradFill', 'a:blipFill', 'a:pattFill',
             'a:grpFill'
         )
@@ -313,7 +223,7 @@ class CT_TableCellProperties(objectify.ObjectifiedElement):
         if self.solidFill is not None:
             return self.solidFill
         # get rid of other fill element type if there is one
-        self._remove_if_present(
+        self.remove_if_present(
             'a:noFill', 'a:gradFill', 'a:blipFill', 'a:pattFill', 'a:grpFill'
         )
         # add solidFill element in right sequence
@@ -339,49 +249,23 @@ class CT_TableCellProperties(objectify.ObjectifiedElement):
         EG_FillProperties element is present.
         """
         noFill = Element('a:noFill')
-        successor = self._first_successor_in('a:headers', 'a:extLst')
-        if successor is not None:
-            successor.addprevious(noFill)
-        else:
-            self.append(noFill)
-        return noFill
+        return self.insert_element_in_sequence(noFill)
 
     def _add_solidFill(self):
         """
         Return a newly added <a:solidFill> child element.
         """
         solidFill = Element('a:solidFill')
-        successor = self._first_successor_in('a:headers', 'a:extLst')
-        if successor is not None:
-            successor.addprevious(solidFill)
-        else:
-            self.append(solidFill)
-        return solidFill
-
-    def _first_child_found_in(self, *tagnames):
-        """
-        Return the first child found with tag in *tagnames*, or None if
-        not found.
-        """
-        for tagname in tagnames:
-            child = self.find(qn(tagname))
-            if child is not None:
-                return child
-        return None
+        return self.insert_element_in_sequence(solidFill)
 
-    def _first_successor_in(self, *successor_tagnames):
-        """
-        Return the first child with tag in *successor_tagnames*, or None if
-        not found.
-        """
-        for tagname in successor_tagnames:
-            successor = self.find(qn(tagname))
-            if successor is not None:
-                return successor
-        return None
-
-    def _remove_if_present(self, *tagnames):
-        for tagname in tagnames:
-            element = self.find(qn(tagname))
-            if element is not None:
-                self.remove(element)
+
+class CT_TableProperties(PropertySetterMixin, BaseOxmlElement):
+    """
+    ``<a:tblPr>`` custom element class
+    """
+    bandCol = OptionalAttribute('bandCol', XsdBooleanTrueOrAbsent, False)
+    bandRow = OptionalAttribute('bandRow', XsdBooleanTrueOrAbsent, False)
+    firstCol = OptionalAttribute('firstCol', XsdBooleanTrueOrAbsent, False)
+    firstRow = OptionalAttribute('firstRow', XsdBooleanTrueOrAbsent, False)
+    lastCol = OptionalAttribute('lastCol', XsdBooleanTrueOrAbsent, False)
+    lastRow = OptionalAttribute('lastRow', XsdBooleanTrueOrAbsent, False)
@@ -14,6 +14,7 @@ from lxml import etree, objectify
 
 from . import oxml_parser
 from .ns import NamespacePrefixedTag, qn
+from ..util import lazyproperty
 
 
 def child(element, child_tag_str):
@@ -21,10 +22,7 @@ def child(element, child_tag_str):
     Return the first direct child of *element* having tag matching
     *child_tag_str* or |None| if no such child element is present.
     """
-    nsptag = NamespacePrefixedTag(child_tag_str)
-    xpath = './%s' % child_tag_str
-    matching_children = element.xpath(xpath, namespaces=nsptag.nsmap)
-    return matching_children[0] if len(matching_children) else None
+    return element.find(qn(child_tag_str))
 
 
 def Element(nsptag_str, nsmap=None):
@@ -61,12 +59,45 @@ def serialize_for_reading(element):
 
 
 def serialize_part_xml(part_elm):
+    """
+    Return *part_elm* serialized as UTF-8 encoded bytes suitable for saving
+    as a package part, having a standalone XML declaration. Any objectify
+    type annotations are removed. Element classes remove the annotations
+    objectify adds as they set values, so the tree is normally serialized
+    in one pass. It is only deannotated, and serialized again, when the XML
+    has a ``py:pytype`` attribute. The objectify type namespace declaration
+    alone doesn't count, deannotating leaves it in place.
+    """
+    xml = etree.tostring(part_elm, encoding='UTF-8', standalone=True)
+    if not _has_pytype_attribute(xml):
+        return xml
     # if xsi parameter is not set to False, PowerPoint won't load without a
     # repair step; deannotate removes some original xsi:type tags in core.xml
     # if this parameter is left out (or set to True)
     objectify.deannotate(part_elm, xsi=False, cleanup_namespaces=False)
-    xml = etree.tostring(part_elm, encoding='UTF-8', standalone=True)
-    return xml
+    return etree.tostring(part_elm, encoding='UTF-8', standalone=True)
+
+
+def _has_pytype_attribute(xml):
+    """
+    Return |True| if the serialized XML bytes *xml* have a ``pytype``
+    attribute in the objectify type namespace, whatever its prefix.
+    """
+    if _pytype_nsuri not in xml:
+        return False
+    for prefix in _pytype_prefix_re.findall(xml):
+        if (b' ' + prefix + b':pytype=') in xml:
+            return True
+    return False
+
+
+# namespace of the py:pytype annotations added by objectify, as bytes
+_pytype_nsuri = objectify.PYTYPE_ATTRIBUTE[1:].split('}')[0].encode('utf-8')
+
+# matches a declaration of the objectify type namespace, capturing its prefix
+_pytype_prefix_re = re.compile(
+    b'xmlns:([^=\\s]+)=["\']' + re.escape(_pytype_nsuri) + b'["\']'
+)
 
 
 def SubElement(parent, nsptag_str, **extra):
@@ -164,17 +195,60 @@ class BaseOxmlElement(objectify.ObjectifiedElement):
 
     def first_child_found_in(self, *tagnames):
         """
-        Return the first child found with tag in *tagnames*, or None if
-        not found.
+        Return the first child having a tag in *tagnames*, or None if not
+        found. The children are visited once, in document order.
         """
-        for tagname in tagnames:
-            child = self.find(qn(tagname))
-            if child is not None:
+        clark_names = _clark_names(tagnames)
+        for child in self.iterchildren():
+            if child.tag in clark_names:
                 return child
         return None
 
     def insert_element_before(self, elm, *tagnames):
-        successor = self.first_child_found_in(*tagnames)
+        """
+        Insert *elm* before the run of trailing children having a tag in
+        *tagnames*, or append it when the last child has none of them.
+        Successors are trailing children in a valid element, so the children
+        are visited from the last one back, stopping at the first that is
+        not a successor. When the children are out of schema order, e.g. a
+        successor precedes some other child, *elm* goes after that other
+        child rather than before the first successor in document order.
+        Comments and processing instructions are skipped by passing
+        ``etree.Element`` to ``iterchildren()``, which needs lxml 3.0.
+        """
+        clark_names = _clark_names(tagnames)
+        successor = None
+        for child in self.iterchildren(etree.Element, reversed=True):
+            if child.tag not in clark_names:
+                break
+            successor = child
+        if successor is not None:
+            successor.addprevious(elm)
+        else:
+            self.append(elm)
+        return elm
+
+    def insert_element_in_sequence(self, elm):
+        """
+        Insert *elm* in the position the ``child_tagnames`` of this element
+        class gives its tag, after any children that precede it and before
+        those that follow it. The position of each tag is compiled once per
+        class, so this takes a single pass over the trailing children. As
+        for :meth:`insert_element_before`, when the children are out of
+        schema order *elm* goes after the last child that doesn't follow it.
+        """
+        positions = self.child_tagnames.positions
+        position = positions.get(elm.tag)
+        if position is None:
+            raise ValueError(
+                "'%s' is not a child of this element" % elm.tag
+            )
+        successor = None
+        for child in self.iterchildren(etree.Element, reversed=True):
+            child_position = positions.get(child.tag)
+            if child_position is None or child_position <= position:
+                break
+            successor = child
         if successor is not None:
             successor.addprevious(elm)
         else:
@@ -185,10 +259,10 @@ class BaseOxmlElement(objectify.ObjectifiedElement):
         """
         Remove all child elements having tagname in *tagnames*.
         """
-        for tagname in tagnames:
-            element = self.find(qn(tagname))
-            if element is not None:
-                self.remove(element)
+        clark_names = _clark_names(tagnames)
+        for child in self.findall('*'):
+            if child.tag in clark_names:
+                self.remove(child)
 
     @property
     def xml(self):
@@ -200,6 +274,23 @@ class BaseOxmlElement(objectify.ObjectifiedElement):
         return serialize_for_reading(self)
 
 
+def _clark_names(tagnames):
+    """
+    Return the frozenset of Clark-notation names for the namespace prefixed
+    *tagnames*, e.g. ``('p:extLst',)``. Each distinct *tagnames* tuple is
+    converted once; call sites pass a handful of literal sequences.
+    """
+    try:
+        return _clark_names_cache[tagnames]
+    except KeyError:
+        clark_names = frozenset(qn(tagname) for tagname in tagnames)
+        _clark_names_cache[tagnames] = clark_names
+        return clark_names
+
+
+_clark_names_cache = {}
+
+
 class _Tagname(object):
     """
     A leaf node in a |_ChildTagnames| tree, containing an individual tagname.
@@ -242,6 +333,19 @@ class ChildTagnames(object):
     def __iter__(self):
         return iter(self._children)
 
+    @lazyproperty
+    def positions(self):
+        """
+        Mapping of the Clark-notation name of each tagname in this tree to
+        the index of the child node it occurs in. Tagnames in the same
+        element group share a position.
+        """
+        positions = {}
+        for idx, child in enumerate(self._children):
+            for tagname in child.tagnames:
+                positions[qn(tagname)] = idx
+        return positions
+
     @classmethod
     def from_nested_sequence(cls, *nested_sequence):
         """
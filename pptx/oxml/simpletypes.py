@@ -0,0 +1,204 @@
+# encoding: utf-8
+
+"""
+Simple types from the schema, each converting an XML attribute value to and
+from its Python value with its ``from_xml()`` and ``to_xml()`` class
+methods, the same protocol the XML enumerations implement.
+"""
+
+from __future__ import absolute_import
+
+import re
+
+from datetime import datetime, timedelta
+
+from ..util import Centipoints, Emu
+
+
+class ST_Coordinate(object):
+    """
+    A position or extent in EMU, e.g. the ``x`` attribute of ``<a:off>``.
+    """
+    @classmethod
+    def from_xml(cls, str_value):
+        return int(str_value)
+
+    @classmethod
+    def to_xml(cls, value):
+        return str(int(value))
+
+
+class ST_Coordinate32(object):
+    """
+    A 32-bit distance in EMU, e.g. the ``lIns`` attribute of ``<a:bodyPr>``.
+    Only an integer can be assigned.
+    """
+    @classmethod
+    def from_xml(cls, str_value):
+        return int(str_value)
+
+    @classmethod
+    def to_xml(cls, value):
+        if not isinstance(value, (int, long)):
+            raise ValueError('int value required')
+        return str(value)
+
+
+class ST_CorePropertyString(object):
+    """
+    The text of a string core property such as ``<dc:title>``, at most 255
+    characters long.
+    """
+    @classmethod
+    def from_xml(cls, str_value):
+        return str_value
+
+    @classmethod
+    def to_xml(cls, value):
+        value = str(value)
+        if len(value) > 255:
+            tmpl = ("exceeded 255 char max length of core property, got:"
+                    "\n\n'%s'")
+            raise ValueError(tmpl % value)
+        return value
+
+
+class ST_LineWidth(object):
+    """
+    A line width in EMU, read as an |Emu| instance.
+    """
+    @classmethod
+    def from_xml(cls, str_value):
+        return Emu(int(str_value))
+
+    @classmethod
+    def to_xml(cls, value):
+        return str(value)
+
+
+class ST_TextFontSize(object):
+    """
+    A font size in hundredths of a point, read as a |Centipoints| instance
+    and assigned a length such as ``Pt(12)``.
+    """
+    @classmethod
+    def from_xml(cls, str_value):
+        return Centipoints(int(str_value))
+
+    @classmethod
+    def to_xml(cls, value):
+        return str(value.centipoints)
+
+
+class ST_W3CDTF(object):
+    """
+    A W3C date and time, e.g. the text of ``<dcterms:created>``, read as a
+    |datetime|. Text that can't be parsed reads as |None|.
+    """
+    _offset_pattern = re.compile('([+-])(\d\d):(\d\d)')
+
+    @classmethod
+    def from_xml(cls, str_value):
+        try:
+            return cls._parse(str_value)
+        except ValueError:
+            # invalid datetime strings are ignored
+            return None
+
+    @classmethod
+    def to_xml(cls, value):
+        if not isinstance(value, datetime):
+            tmpl = ("date property requires <type 'datetime.datetime'> obje"
+                    "ct, got %s")
+            raise ValueError(tmpl % type(value))
+        return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    @classmethod
+    def _offset_dt(cls, dt, offset_str):
+        """
+        Return a |datetime| instance that is offset from datetime *dt* by
+        the timezone offset specified in *offset_str*, a string like
+        ``'-07:00'``.
+        """
+        match = cls._offset_pattern.match(offset_str)
+        if match is None:
+            raise ValueError("'%s' is not a valid offset string" % offset_str)
+        sign, hours_str, minutes_str = match.groups()
+        sign_factor = -1 if sign == '+' else 1
+        hours = int(hours_str) * sign_factor
+        minutes = int(minutes_str) * sign_factor
+        td = timedelta(hours=hours, minutes=minutes)
+        return dt + td
+
+    @classmethod
+    def _parse(cls, w3cdtf_str):
+        # valid W3CDTF date cases:
+        # yyyy e.g. '2003'
+        # yyyy-mm e.g. '2003-12'
+        # yyyy-mm-dd e.g. '2003-12-31'
+        # UTC timezone e.g. '2003-12-31T10:14:55Z'
+        # numeric timezone e.g. '2003-12-31T10:14:55-08:00'
+        templates = (
+            '%Y-%m-%dT%H:%M:%S',
+            '%Y-%m-%d',
+            '%Y-%m',
+            '%Y',
+        )
+        # strptime isn't smart enough to parse literal timezone offsets like
+        # '-07:30', so we have to do it ourselves
+        parseable_part = w3cdtf_str[:19]
+        offset_str = w3cdtf_str[19:]
+        dt = None
+        for tmpl in templates:
+            try:
+                dt = datetime.strptime(parseable_part, tmpl)
+            except ValueError:
+                continue
+        if dt is None:
+            tmpl = "could not parse W3CDTF datetime string '%s'"
+            raise ValueError(tmpl % w3cdtf_str)
+        if len(offset_str) == 6:
+            return cls._offset_dt(dt, offset_str)
+        return dt
+
+
+class XsdBoolean(object):
+    """
+    ``'1'`` or ``'true'`` read as |True|, anything else as |False|. Written
+    as ``'1'`` or ``'0'``.
+    """
+    @classmethod
+    def from_xml(cls, str_value):
+        return str_value in ('1', 'true')
+
+    @classmethod
+    def to_xml(cls, value):
+        return '1' if value else '0'
+
+
+class XsdBooleanTrueOrAbsent(object):
+    """
+    An ``xsd:boolean`` attribute defaulting to false that is written only
+    when true, like ``firstRow`` of ``<a:tblPr>``. Assigning a false value
+    removes the attribute rather than writing ``'0'``.
+    """
+    @classmethod
+    def from_xml(cls, str_value):
+        return XsdBoolean.from_xml(str_value)
+
+    @classmethod
+    def to_xml(cls, value):
+        return '1' if value else None
+
+
+class XsdString(object):
+    """
+    A string attribute value, unchanged either way.
+    """
+    @classmethod
+    def from_xml(cls, str_value):
+        return str_value
+
+    @classmethod
+    def to_xml(cls, value):
+        return value
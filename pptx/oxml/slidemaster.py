@@ -7,7 +7,7 @@ lxml custom element classes for slide master-related XML elements.
 from __future__ import absolute_import
 
 from .ns import qn
-from .shared import BaseOxmlElement, Element
+from .shared import BaseOxmlElement, ChildTagnames, Element
 
 
 class CT_SlideLayoutIdList(BaseOxmlElement):
@@ -51,6 +51,11 @@ class CT_SlideMaster(BaseOxmlElement):
     """
     ``<p:sldMaster>`` element, root of a slide master part
     """
+    child_tagnames = ChildTagnames.from_nested_sequence(
+        'p:cSld', 'p:clrMap', 'p:sldLayoutIdLst', 'p:transition',
+        'p:timing', 'p:hf', 'p:txStyles', 'p:extLst',
+    )
+
     def get_or_add_sldLayoutIdLst(self):
         """
         Return the sldLayoutIdLst child element, newly added if not present.
@@ -74,8 +79,4 @@ class CT_SlideMaster(BaseOxmlElement):
         present.
         """
         sldLayoutIdLst = CT_SlideLayoutIdList.new()
-        self.insert_element_before(
-            sldLayoutIdLst, 'p:transition', 'p:timing', 'p:hf', 'p:txStyles',
-            'p:extLst'
-        )
-        return sldLayoutIdLst
+        return self.insert_element_in_sequence(sldLayoutIdLst)
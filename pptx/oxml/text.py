@@ -6,13 +6,17 @@ lxml custom element classes for text-related XML elements.
 
 from __future__ import absolute_import
 
-from lxml import objectify
+from lxml import etree, objectify
 
-from . import parse_xml_bytes
+from . import oxml_parser, parse_xml_bytes
 from ..enum.text import MSO_AUTO_SIZE
 from .ns import nsdecls, nsmap, qn
-from .shared import Element, SubElement
-from ..util import Centipoints
+from .dml.fill import EG_FillProperties
+from .shared import BaseOxmlElement, ChildTagnames, Element, SubElement
+from .simpletypes import (
+    ST_Coordinate32, ST_TextFontSize, XsdBoolean, XsdString
+)
+from .xmlchemy import OptionalAttribute, PropertySetterMixin, ZeroOrOne
 
 
 class CT_Hyperlink(objectify.ObjectifiedElement):
@@ -38,6 +42,14 @@ class CT_RegularTextRun(objectify.ObjectifiedElement):
         return self.rPr
 
 
+class CT_TextRunText(etree.ElementBase):
+    """
+    Custom element class for <a:t> elements. Based on plain
+    ``etree.ElementBase`` rather than objectify, so its ``text`` property is
+    writable and text can be set without objectify's type annotations.
+    """
+
+
 class CT_TextBody(objectify.ObjectifiedElement):
     """
     <p:txBody> custom element class
@@ -62,98 +74,36 @@ class CT_TextBody(objectify.ObjectifiedElement):
     def bodyPr(self):
         return self[qn('a:bodyPr')]
 
-
-class Schema(object):
-    def __init__(self):
-        self._attrs = {}
-
-    def add_attr(self, attr):
-        self._attrs[attr.prop_name] = attr
-
-    @property
-    def attrs(self):
-        return self._attrs
-
-    def is_attr_prop(self, prop_name):
-        return prop_name in self._attrs.keys()
-
-
-class Attribute(object):
-    def __init__(self, prop_name, type_cls, attr_name=None):
-        self._prop_name = prop_name
-        self._type_cls = type_cls
-        self._attr_name = attr_name if attr_name is not None else prop_name
-
-    @property
-    def prop_name(self):
-        return self._prop_name
-
-    def get(self, elm):
-        if self._attr_name not in elm.attrib:
-            return None
-        xml_val = elm.get(self._attr_name)
-        return self._type_cls.from_xml(xml_val)
-
-    def set(self, elm, value):
-        if value is None and self._attr_name in elm.attrib:
-            del elm.attrib[self._attr_name]
-        else:
-            xml_val = self._type_cls.to_xml(value)
-            elm.set(self._attr_name, xml_val)
-
-
-class ST_Coordinate32(object):
-    @classmethod
-    def from_xml(cls, value):
-        return int(value)
-
-    @classmethod
-    def to_xml(cls, value):
-        if not isinstance(value, int):
-            raise ValueError('int value required')
-        return str(value)
-
-
-class OxmlElement(objectify.ObjectifiedElement):
-
-    def __getattr__(self, name):
-        if self.schema.is_attr_prop(name):
-            attr = self.schema.attrs[name]
-            return attr.get(self)
-        else:
-            return super(OxmlElement, self).__getattr__(name)
-
-    def __setattr__(self, name, value):
+    def replace_p_elms(self, p_elms):
         """
-        Override ``__setattr__`` defined in ObjectifiedElement super class
-        to intercept messages intended for custom property setters.
+        Replace all the ``<a:p>`` child elements with those in *p_elms*.
+        ``<a:p>`` elements are last in ``<p:txBody>``, so the new ones are
+        simply appended.
         """
-        if self.schema.is_attr_prop(name):
-            attr = self.schema.attrs[name]
-            attr.set(self, value)
-        else:
-            super(OxmlElement, self).__setattr__(name, value)
+        for p in self.findall(qn('a:p')):
+            self.remove(p)
+        self.extend(p_elms)
 
 
-class CT_TextBodyProperties(OxmlElement):
+class CT_TextBodyProperties(PropertySetterMixin, BaseOxmlElement):
     """
     <a:bodyPr> custom element class
     """
-    schema = Schema()
-    schema.add_attr(Attribute('lIns', ST_Coordinate32))
-    schema.add_attr(Attribute('tIns', ST_Coordinate32))
-    schema.add_attr(Attribute('rIns', ST_Coordinate32))
-    schema.add_attr(Attribute('bIns', ST_Coordinate32))
-    # lIns = Attribute(ST_Coordinate32)
+    child_tagnames = ChildTagnames.from_nested_sequence(
+        'a:prstTxWarp',
+        ('a:noAutofit', 'a:normAutofit', 'a:spAutoFit'),
+        'a:scene3d',
+        ('a:sp3d', 'a:flatTx'),
+        'a:extLst',
+    )
 
-    def __setattr__(self, name, value):
-        """
-        Implement property setters
-        """
-        if name == 'autofit':
-            self._set_autofit(value)
-        else:
-            super(CT_TextBodyProperties, self).__setattr__(name, value)
+    lIns = OptionalAttribute('lIns', ST_Coordinate32)
+    tIns = OptionalAttribute('tIns', ST_Coordinate32)
+    rIns = OptionalAttribute('rIns', ST_Coordinate32)
+    bIns = OptionalAttribute('bIns', ST_Coordinate32)
+    noAutofit = ZeroOrOne('a:noAutofit')
+    normAutofit = ZeroOrOne('a:normAutofit')
+    spAutoFit = ZeroOrOne('a:spAutoFit')
 
     @property
     def autofit(self):
@@ -168,26 +118,9 @@ class CT_TextBodyProperties(OxmlElement):
             return MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT
         return None
 
-    @property
-    def noAutofit(self):
-        """
-        The <a:noAutofit> child element, or None if not present.
-        """
-        return self.find(qn('a:noAutofit'))
-
-    @property
-    def normAutofit(self):
-        """
-        The <a:normAutofit> child element, or None if not present.
-        """
-        return self.find(qn('a:normAutofit'))
-
-    @property
-    def spAutoFit(self):
-        """
-        The <a:spAutoFit> child element, or None if not present.
-        """
-        return self.find(qn('a:spAutoFit'))
+    @autofit.setter
+    def autofit(self, value):
+        self._set_autofit(value)
 
     def _add_noAutofit(self):
         noAutofit = Element('a:noAutofit')
@@ -204,38 +137,11 @@ class CT_TextBodyProperties(OxmlElement):
         self._insert_autofit(spAutoFit)
         return spAutoFit
 
-    def _first_child_found_in(self, *tagnames):
-        """
-        Return the first child found with tag in *tagnames*, or None if
-        not found.
-        """
-        for tagname in tagnames:
-            child = self.find(qn(tagname))
-            if child is not None:
-                return child
-        return None
-
     def _insert_autofit(self, autofit_elm):
-        self._insert_element_before(
-            autofit_elm, 'a:scene3d', 'a:sp3d', 'a:flatTx', 'a:extLst'
-        )
-
-    def _insert_element_before(self, elm, *tagnames):
-        successor = self._first_child_found_in(*tagnames)
-        if successor is not None:
-            successor.addprevious(elm)
-        else:
-            self.append(elm)
-        return elm
-
-    def _remove_if_present(self, *tagnames):
-        for tagname in tagnames:
-            element = self.find(qn(tagname))
-            if element is not None:
-                self.remove(element)
+        self.insert_element_in_sequence(autofit_elm)
 
     def _set_autofit(self, value):
-        self._remove_if_present(
+        self.remove_if_present(
             'a:noAutofit', 'a:normAutofit', 'a:spAutoFit'
         )
         if value == MSO_AUTO_SIZE.NONE:
@@ -246,40 +152,49 @@ class CT_TextBodyProperties(OxmlElement):
             self._add_spAutoFit()
 
 
-class CT_TextCharacterProperties(objectify.ObjectifiedElement):
+class CT_TextCharacterProperties(PropertySetterMixin, BaseOxmlElement):
     """
     Custom element class for all of <a:rPr>, <a:defRPr>, and <a:endParaRPr>
     elements. 'rPr' is short for 'run properties', and it corresponds to the
     _Font proxy class.
     """
-    def __getattr__(self, name):
-        """
-        Override ``__getattr__`` defined in ObjectifiedElement super class
-        to intercept messages intended for custom property setters.
-        """
-        if name in ('b', 'i'):
-            return self._get_bool_attr(name)
-        elif name == 'fill_element':
-            return self._eg_fill_properties()
-        elif name == 'hlinkClick':
-            return self.find(qn('a:hlinkClick'))
-        else:
-            return super(CT_TextCharacterProperties, self).__getattr__(name)
-
-    def __setattr__(self, name, value):
-        """
-        Override ``__setattr__`` defined in ObjectifiedElement super class
-        to intercept messages intended for custom property setters.
-        """
-        if name in ('b', 'i'):
-            self._set_bool_attr(name, value)
-        elif name == 'hlinkClick':
-            self._set_hlinkClick(value)
-        elif name == 'sz':
-            emu_str = str(value.centipoints)
-            self.set(name, emu_str)
-        else:
-            super(CT_TextCharacterProperties, self).__setattr__(name, value)
+    child_tagnames = ChildTagnames.from_nested_sequence(
+        'a:ln',
+        EG_FillProperties.__member_names__,
+        ('a:effectLst', 'a:effectDag'),
+        'a:highlight',
+        ('a:uLnTx', 'a:uLn'),
+        ('a:uFillTx', 'a:uFill'),
+        'a:latin', 'a:ea', 'a:cs', 'a:sym', 'a:hlinkClick',
+        'a:hlinkMouseOver', 'a:rtl', 'a:extLst',
+    )
+
+    b = OptionalAttribute('b', XsdBoolean)
+    i = OptionalAttribute('i', XsdBoolean)
+    sz = OptionalAttribute('sz', ST_TextFontSize)
+    latin = ZeroOrOne('a:latin')
+    noFill = ZeroOrOne('a:noFill')
+    solidFill = ZeroOrOne('a:solidFill')
+
+    @property
+    def fill_element(self):
+        """
+        Return the child representing the EG_FillProperties element group
+        member in this element, or |None| if no such child is present.
+        """
+        return self._eg_fill_properties()
+
+    @property
+    def hlinkClick(self):
+        """
+        The <a:hlinkClick> child element, or None if not present. Only
+        |None| can be assigned, removing the element.
+        """
+        return self.find(qn('a:hlinkClick'))
+
+    @hlinkClick.setter
+    def hlinkClick(self, value):
+        self._set_hlinkClick(value)
 
     def add_hlinkClick(self, rId):
         """
@@ -289,21 +204,7 @@ class CT_TextCharacterProperties(objectify.ObjectifiedElement):
 
         hlinkClick = Element('a:hlinkClick', nsmap('a', 'r'))
         hlinkClick.set(qn('r:id'), rId)
-
-        # find right insertion spot, will go away once xmlchemy comes in
-        if self.find(qn('a:hlinkMouseOver')):
-            successor = self.find(qn('a:hlinkMouseOver'))
-            successor.addprevious(hlinkClick)
-        elif self.find(qn('a:rtl')):
-            successor = self.find(qn('a:rtl'))
-            successor.addprevious(hlinkClick)
-        elif self.find(qn('a:extLst')):
-            successor = self.find(qn('a:extLst'))
-            successor.addprevious(hlinkClick)
-        else:
-            self.append(hlinkClick)
-
-        return hlinkClick
+        return self.insert_element_in_sequence(hlinkClick)
 
     def get_or_add_latin(self):
         """
@@ -323,7 +224,7 @@ class CT_TextCharacterProperties(objectify.ObjectifiedElement):
         if self.noFill is not None:
             return self.noFill
         # get rid of other fill element type if there is one
-        self._remove_if_present(
+        self.remove_if_present(
             'a:blipFill', 'a:gradFill', 'a:grpFill', 'a:pattFill',
             'a:solidFill'
         )
@@ -339,26 +240,12 @@ class CT_TextCharacterProperties(objectify.ObjectifiedElement):
         if self.solidFill is not None:
             return self.solidFill
         # get rid of other fill element type if there is one
-        self._remove_if_present(
+        self.remove_if_present(
             'a:blipFill', 'a:gradFill', 'a:grpFill', 'a:noFill', 'a:pattFill'
         )
         # add solidFill element in right sequence
         return self._add_solidFill()
 
-    @property
-    def latin(self):
-        """
-        The <a:latin> child element, or None if not present.
-        """
-        return self.find(qn('a:latin'))
-
-    @property
-    def noFill(self):
-        """
-        The <a:noFill> child element, or None if not present.
-        """
-        return self.find(qn('a:noFill'))
-
     def remove_latin(self):
         """
         Remove the <a:latin> child element if it exists.
@@ -366,38 +253,13 @@ class CT_TextCharacterProperties(objectify.ObjectifiedElement):
         if self.latin is not None:
             self.remove(self.latin)
 
-    @property
-    def solidFill(self):
-        """
-        The <a:solidFill> child element, or None if not present.
-        """
-        return self.find(qn('a:solidFill'))
-
-    @property
-    def sz(self):
-        """
-        The value of the ``sz`` attribute, or None if not present.
-        """
-        val = self.get('sz')
-        if val is None:
-            return None
-        return Centipoints(int(val))
-
     def _add_latin(self):
         """
         Return a newly added <a:latin> child element; assume one is not
         already present.
         """
         latin = Element('a:latin')
-        successor = self._first_child_found_in(
-            'a:ea', 'a:cs', 'a:sym', 'a:hlinkClick', 'a:hlinkMouseOver',
-            'a:rtl', 'a:extLst'
-        )
-        if successor is not None:
-            successor.addprevious(latin)
-        else:
-            self.append(latin)
-        return latin
+        return self.insert_element_in_sequence(latin)
 
     def _add_noFill(self):
         """
@@ -405,77 +267,24 @@ class CT_TextCharacterProperties(objectify.ObjectifiedElement):
         EG_FillProperties element is present.
         """
         noFill = Element('a:noFill')
-        ln = self.find(qn('a:ln'))
-        if ln is not None:
-            self.insert(1, noFill)
-        else:
-            self.insert(0, noFill)
-        return noFill
+        return self.insert_element_in_sequence(noFill)
 
     def _add_solidFill(self):
         """
         Return a newly added <a:solidFill> child element.
         """
         solidFill = Element('a:solidFill')
-        ln = self.find(qn('a:ln'))
-        if ln is not None:
-            self.insert(1, solidFill)
-        else:
-            self.insert(0, solidFill)
-        return solidFill
+        return self.insert_element_in_sequence(solidFill)
 
     def _eg_fill_properties(self):
         """
         Return the child representing the EG_FillProperties element group
         member in this element, or |None| if no such child is present.
         """
-        return self._first_child_found_in(
-            'a:noFill', 'a:solidFill', 'a:gradFill', 'a:blipFill',
-            'a:pattFill', 'a:grpFill'
+        return self.first_child_found_in(
+            *EG_FillProperties.__member_names__
         )
 
-    def _first_child_found_in(self, *tagnames):
-        """
-        Return the first child found with tag in *tagnames*, or None if
-        not found.
-        """
-        for tagname in tagnames:
-            child = self.find(qn(tagname))
-            if child is not None:
-                return child
-        return None
-
-    def _get_bool_attr(self, name):
-        """
-        True if *name* attribute is a truthy value, False if a falsey value,
-        and None if no *name* attribute is present.
-        """
-        attr_str = self.get(name)
-        if attr_str is None:
-            return None
-        if attr_str in ('true', '1'):
-            return True
-        return False
-
-    def _remove_if_present(self, *tagnames):
-        for tagname in tagnames:
-            element = self.find(qn(tagname))
-            if element is not None:
-                self.remove(element)
-
-    def _set_bool_attr(self, name, value):
-        """
-        Set boolean attribute of this element having *name* to boolean value
-        of *value*.
-        """
-        if value is None:
-            if name in self.attrib:
-                del self.attrib[name]
-        elif bool(value):
-            self.set(name, '1')
-        else:
-            self.set(name, '0')
-
     def _set_hlinkClick(self, value):
         """
         For *value* is None, remove the ``<a:hlinkClick>`` child. For all
@@ -490,30 +299,40 @@ class CT_TextCharacterProperties(objectify.ObjectifiedElement):
             self.remove(hlinkClick)
 
 
-class CT_TextFont(objectify.ObjectifiedElement):
+class CT_TextFont(PropertySetterMixin, BaseOxmlElement):
     """
     Custom element class for <a:latin>, <a:ea>, <a:cs>, and <a:sym> child
-    elements of CT_TextCharacterProperties, e.g. <a:rPr>.
+    elements of CT_TextCharacterProperties, e.g. <a:rPr>. Its ``typeface``
+    is the name of the typeface to use for characters governed by this
+    element, e.g. Latin characters if it is a <a:latin> element.
     """
-    def __setattr__(self, name, value):
-        if name == 'typeface':
-            self.set('typeface', value)
-        else:
-            super(CT_TextFont, self).__setattr__(name, value)
-
-    @property
-    def typeface(self):
-        """
-        Typeface name to use for characters governed by this element, e.g.
-        Latin characters if it is a <a:latin> element.
-        """
-        return self.get('typeface')
+    typeface = OptionalAttribute('typeface', XsdString)
 
 
 class CT_TextParagraph(objectify.ObjectifiedElement):
     """
     <a:p> custom element class
     """
+    @staticmethod
+    def new_p(runs, level=0):
+        """
+        Return a new ``<a:p>`` element at indentation *level*, containing a
+        run for each ``(text, font)`` pair in *runs*. *font* is a dict that
+        may have any of the keys 'bold', 'italic', 'size' (a length) and
+        'name' (the typeface); |None| values are left out. The subtree is
+        built with ``etree.SubElement()`` directly, not by finding or adding
+        one child at a time.
+        """
+        p = oxml_parser.makeelement(_p_tag, nsmap=_p_nsmap)
+        if level:
+            etree.SubElement(p, _pPr_tag, lvl=str(level))
+        for text, font in runs:
+            r = etree.SubElement(p, _r_tag)
+            if font:
+                _add_rPr(r, font)
+            etree.SubElement(r, _t_tag).text = text
+        return p
+
     def add_r(self):
         """
         Return a newly appended <a:r> element.
@@ -548,28 +367,44 @@ class CT_TextParagraph(objectify.ObjectifiedElement):
         return self.pPr
 
 
-class CT_TextParagraphProperties(objectify.ObjectifiedElement):
+def _add_rPr(r, font):
     """
-    <a:pPr> custom element class
+    Add an ``<a:rPr>`` child to *r* having the character formatting in the
+    *font* dict, unless it has no values other than |None|.
     """
-    def __setattr__(self, name, value):
-        """
-        Override ``__setattr__`` defined in ObjectifiedElement super class
-        to intercept messages intended for custom property setters.
-        """
-        if name in ('algn',):
-            self._set_attr(name, value)
-        else:
-            super(CT_TextParagraphProperties, self).__setattr__(name, value)
-
-    @property
-    def algn(self):
-        """
-        Paragraph horizontal alignment value, like ``TAT.CENTER``. Value of
-        'algn' attribute on <a:pPr> child element. None if no 'algn'
-        attribute is present.
-        """
-        return self.get('algn')
+    attrs = [
+        (attr_name, simple_type.to_xml(font[key]))
+        for key, attr_name, simple_type in _rPr_attrs
+        if font.get(key) is not None
+    ]
+    typeface = font.get('name')
+    if not attrs and typeface is None:
+        return
+    rPr = etree.SubElement(r, _rPr_tag)
+    for attr_name, value in attrs:
+        rPr.set(attr_name, value)
+    if typeface is not None:
+        etree.SubElement(rPr, _latin_tag, typeface=typeface)
+
+
+_latin_tag, _p_tag, _pPr_tag, _r_tag, _rPr_tag, _t_tag = (
+    qn('a:latin'), qn('a:p'), qn('a:pPr'), qn('a:r'), qn('a:rPr'), qn('a:t')
+)
+_p_nsmap = nsmap('a')
+_rPr_attrs = (
+    ('bold', 'b', XsdBoolean),
+    ('italic', 'i', XsdBoolean),
+    ('size', 'sz', ST_TextFontSize),
+)
+
+
+class CT_TextParagraphProperties(PropertySetterMixin, BaseOxmlElement):
+    """
+    <a:pPr> custom element class. Its ``algn`` is the paragraph horizontal
+    alignment value, like ``TAT.CENTER``, None if no 'algn' attribute is
+    present.
+    """
+    algn = OptionalAttribute('algn', XsdString)
 
     def get_or_add_defRPr(self):
         """
@@ -583,12 +418,3 @@ class CT_TextParagraphProperties(objectify.ObjectifiedElement):
             except AttributeError:
                 self.append(defRPr)
         return self.defRPr
-
-    def _set_attr(self, name, value):
-        """
-        Set attribute of this element having *name* to *value*.
-        """
-        if value is None and name in self.attrib:
-            del self.attrib[name]
-        else:
-            self.set(name, value)
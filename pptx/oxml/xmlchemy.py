@@ -0,0 +1,174 @@
+# encoding: utf-8
+
+"""
+Properties for custom element classes declared from the schema, such as an
+optional attribute with its simple type and default. Each is a data
+descriptor, so a read like ``xfrm.x`` is a single descriptor call rather
+than a failed objectify child lookup followed by a Python ``__getattr__``
+dispatching on the attribute name. Assignment reaches them through
+``PropertySetterMixin.__setattr__``.
+"""
+
+from __future__ import absolute_import
+
+from lxml import objectify
+
+from .ns import qn
+
+
+class PropertySetterMixin(object):
+    """
+    Mixin for element classes having a read/write property, such as an
+    ``OptionalAttribute``. The ``__setattr__`` of ObjectifiedElement ignores
+    properties and adds or replaces a child element instead, so it's
+    overridden here to call the property setter. It must come before the
+    element base class, e.g. ``CT_Foo(PropertySetterMixin, BaseOxmlElement)``.
+    Element classes without one keep the faster objectify ``__setattr__``.
+    """
+    def __setattr__(self, name, value):
+        prop = getattr(type(self), name, None)
+        if isinstance(prop, property) and prop.fset is not None:
+            prop.fset(self, value)
+        else:
+            super(PropertySetterMixin, self).__setattr__(name, value)
+
+
+class Delegated(property):
+    """
+    Read/write property for the *name* property of the object the
+    *holder_name* property holds, e.g. the ``x`` property of the ``off``
+    child of ``<a:xfrm>``. Reads as *default* when that is |None|. On
+    assignment the holder is obtained by calling the *get_or_add_holder*
+    method, if given, so a missing child element is added. Assigning
+    *default* when there is no holder leaves the XML unchanged.
+    """
+    def __init__(self, holder_name, name, get_or_add_holder=None,
+                 default=None):
+        def get_value(obj):
+            holder = getattr(obj, holder_name)
+            if holder is None:
+                return default
+            return getattr(holder, name)
+
+        def set_value(obj, value):
+            holder = getattr(obj, holder_name)
+            if holder is None:
+                if value == default:
+                    return
+                holder = getattr(obj, get_or_add_holder)()
+            setattr(holder, name, value)
+
+        doc = 'Value of ``%s`` of ``%s``, %r when not present.' % (
+            name, holder_name, default
+        )
+        super(Delegated, self).__init__(get_value, set_value, None, doc)
+
+
+class OptionalAttribute(property):
+    """
+    Read/write property for the optional XML attribute *attr_name*, whose
+    value is converted to and from Python using the ``from_xml()`` and
+    ``to_xml()`` class methods of *simple_type*. Reads as *default* when
+    the attribute is not present. Assigning |None|, or a value
+    ``to_xml()`` returns |None| for, removes the attribute.
+    """
+    def __init__(self, attr_name, simple_type, default=None):
+        def get_attr_value(elm):
+            xml_val = elm.get(attr_name)
+            if xml_val is None:
+                return default
+            return simple_type.from_xml(xml_val)
+
+        def set_attr_value(elm, value):
+            xml_val = None if value is None else simple_type.to_xml(value)
+            if xml_val is None:
+                if attr_name in elm.attrib:
+                    del elm.attrib[attr_name]
+                return
+            elm.set(attr_name, xml_val)
+
+        doc = (
+            'Value of the optional ``%s`` attribute, %r when not present.'
+            % (attr_name, default)
+        )
+        super(OptionalAttribute, self).__init__(
+            get_attr_value, set_attr_value, None, doc
+        )
+
+
+class RequiredAttribute(property):
+    """
+    Read/write property for the required XML attribute *attr_name*, whose
+    value is converted to and from Python using the ``from_xml()`` and
+    ``to_xml()`` class methods of *simple_type*.
+    """
+    def __init__(self, attr_name, simple_type):
+        def get_attr_value(elm):
+            return simple_type.from_xml(elm.get(attr_name))
+
+        def set_attr_value(elm, value):
+            elm.set(attr_name, simple_type.to_xml(value))
+
+        doc = 'Value of the required ``%s`` attribute.' % attr_name
+        super(RequiredAttribute, self).__init__(
+            get_attr_value, set_attr_value, None, doc
+        )
+
+
+class ZeroOrOne(property):
+    """
+    Read-only property for the optional child element *nsptagname*, e.g.
+    ``'a:off'``, |None| when not present. Unlike objectify child lookup, it
+    doesn't raise when the child is missing, and ``iterchildren()`` avoids
+    the path parsing ``find()`` goes through.
+    """
+    def __init__(self, nsptagname):
+        tag = qn(nsptagname)
+
+        def get_child_element(elm):
+            return next(elm.iterchildren(tag), None)
+
+        doc = 'The ``<%s>`` child element, or |None| if not present.' % (
+            nsptagname
+        )
+        super(ZeroOrOne, self).__init__(get_child_element, None, None, doc)
+
+
+class ZeroOrOneText(property):
+    """
+    Read/write property for the text of the optional child element
+    *nsptagname*, e.g. ``'dc:title'``, converted to and from Python using
+    the ``from_xml()`` and ``to_xml()`` class methods of *simple_type*.
+    Reads as *default* when the child is not present; assignment adds it
+    when necessary. When *xsi_type* is given, an assigned child gets an
+    ``xsi:type`` attribute having that value.
+    """
+    def __init__(self, nsptagname, simple_type, default=None, xsi_type=None):
+        tag = qn(nsptagname)
+
+        def get_text_value(elm):
+            child = next(elm.iterchildren(tag), None)
+            if child is None:
+                return default
+            return simple_type.from_xml(child.text)
+
+        def set_text_value(elm, value):
+            str_value = simple_type.to_xml(value)
+            objectify.ObjectifiedElement.__setattr__(elm, tag, str_value)
+            child = next(elm.iterchildren(tag))
+            # objectify will leave in a py: namespace without this cleanup
+            objectify.deannotate(child, cleanup_namespaces=True)
+            if xsi_type is not None:
+                # first and last line are a hack required to add the xsi
+                # namespace to this element rather than each child element
+                # in which it is referenced
+                elm.set(qn('xsi:foo'), 'bar')
+                child.set(qn('xsi:type'), xsi_type)
+                del elm.attrib[qn('xsi:foo')]
+
+        doc = 'Text of the ``<%s>`` child element, %r when not present.' % (
+            nsptagname, default
+        )
+        super(ZeroOrOneText, self).__init__(
+            get_text_value, set_text_value, None, doc
+        )
@@ -8,12 +8,14 @@ encounters as an end-user of the PowerPoint user interface.
 from __future__ import absolute_import
 
 import os
+import threading
 
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import OpcPackage
 from pptx.parts.coreprops import CoreProperties
 from pptx.parts.image import ImageCollection
-from pptx.util import lazyproperty
+from pptx.textstyle import TextStyles
+from pptx.util import lazyproperty, lock_lazyproperties
 
 
 class Package(OpcPackage):
@@ -31,6 +33,10 @@ class Package(OpcPackage):
         os.path.split(__file__)[0], 'templates', 'default.pptx'
     )
 
+    def __init__(self):
+        super(Package, self).__init__()
+        self._lock = _NullLock()
+
     def after_unmarshal(self):
         """
         Called by loading code after all parts and relationships have been
@@ -46,23 +52,56 @@ class Package(OpcPackage):
         document properties for this presentation. Creates a default core
         properties part if one is not present (not common).
         """
-        try:
-            return self.part_related_by(RT.CORE_PROPERTIES)
-        except KeyError:
-            core_props = CoreProperties.default()
-            self.relate_to(core_props, RT.CORE_PROPERTIES)
-            return core_props
+        with self._lock:
+            try:
+                return self.part_related_by(RT.CORE_PROPERTIES)
+            except KeyError:
+                core_props = CoreProperties.default()
+                self.relate_to(core_props, RT.CORE_PROPERTIES)
+                return core_props
+
+    def drop_unreachable_parts(self):
+        """
+        Release references this package holds to parts that are no longer
+        reachable by walking the relationship graph, for example an image
+        used only on a slide that has been removed. Unreachable parts are
+        not written on save in any case; this keeps them from being reused.
+        """
+        self._images.retain(self.parts)
+
+    @property
+    def lock(self):
+        """
+        Context manager that serializes changes shared by all the slides in
+        this package, such as adding a slide or adding an image. It does
+        nothing unless the package was opened with *thread_safe* |True|.
+        """
+        return self._lock
 
     @classmethod
-    def open(cls, pkg_file=None):
+    def open(cls, pkg_file=None, thread_safe=False, load=None):
         """
         Return |Package| instance loaded with contents of .pptx package at
         *pkg_file*, or the default presentation package if *pkg_file* is
-        missing or |None|.
+        missing or |None|. If *thread_safe* is |True|, changes shared by
+        all slides are made under a lock, so distinct slides can be worked
+        on from different threads. *load* is an optional predicate selecting
+        the parts to load, as described for |Presentation|.
         """
         if pkg_file is None:
             pkg_file = cls._default_pptx_path
-        return super(Package, cls).open(pkg_file)
+        package = super(Package, cls).open(pkg_file, load)
+        if thread_safe:
+            package._lock = threading.RLock()
+            lock_lazyproperties(package, package._lock)
+        return package
+
+    @property
+    def thread_safe(self):
+        """
+        |True| if this package was opened in thread-safe mode.
+        """
+        return not isinstance(self._lock, _NullLock)
 
     @property
     def presentation(self):
@@ -71,6 +110,15 @@ class Package(OpcPackage):
         """
         return self.main_document
 
+    @lazyproperty
+    def text_styles(self):
+        """
+        |TextStyles| instance resolving the effective font of text in this
+        package, caching the styles slides inherit from their layouts and
+        masters.
+        """
+        return TextStyles(self)
+
     @lazyproperty
     def _images(self):
         """
@@ -78,3 +126,15 @@ class Package(OpcPackage):
         package.
         """
         return ImageCollection()
+
+
+class _NullLock(object):
+    """
+    Stand-in for a lock when a package is not opened in thread-safe mode,
+    so locking code has no cost in the common single-threaded case.
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
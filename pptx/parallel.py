@@ -0,0 +1,246 @@
+# encoding: utf-8
+
+"""
+Generate many presentations from one template using a pool of worker
+processes.
+
+Presentation objects can't be pickled, so a deck is described to a worker
+by a *build spec*, a plain dict, and the worker hands back the saved deck
+rather than the presentation object. A build spec looks like this::
+
+    {
+        'filename': 'q3-sales.pptx',  # only used when saving to a directory
+        'slides': [
+            {
+                'layout': 'Title Only',   # layout name or index, default 0
+                'title': 'Q3 Sales',
+                'placeholders': {1: 'Subtitle text'},  # by placeholder idx
+                'textboxes': [
+                    {'left': 914400, 'top': 914400, 'width': 914400,
+                     'height': 914400, 'text': 'Hello'},
+                ],
+                'tables': [
+                    {'left': 0, 'top': 0, 'width': 914400, 'height': 914400,
+                     'rows': [['Region', 'Total'], ['West', '42']]},
+                ],
+                'pictures': [
+                    {'image': 'logo.png', 'left': 0, 'top': 0},
+                ],
+            },
+        ],
+    }
+
+Positions and sizes are in English Metric Units (EMU); ``width`` and
+``height`` are optional for pictures.
+"""
+
+from __future__ import absolute_import, division
+
+import multiprocessing
+import os
+import time
+
+from StringIO import StringIO
+
+from pptx.api import Presentation
+
+
+def build_decks(template, specs, out_dir=None, processes=None, builder=None):
+    """
+    Return a |BuildReport| for the presentations built from *template*, a
+    path to a ``.pptx`` file, one for each build spec in *specs*. Each deck
+    is built by calling *builder* with the new presentation and its spec,
+    :func:`build_deck` by default; a custom builder must be a module-level
+    function so it can be pickled. If *out_dir* is |None| the saved decks
+    are reported as bytes, otherwise each is written to a file in *out_dir*
+    named by the spec's ``'filename'`` key and its path is reported. The
+    work is spread over *processes* worker processes, one per CPU when
+    |None|; a value of 1 builds the decks in this process. A spec that
+    fails to build doesn't stop the others, its error is reported instead
+    of a deck.
+    """
+    if builder is None:
+        builder = build_deck
+    jobs = [(builder, spec, out_dir, idx) for idx, spec in enumerate(specs)]
+    start = time.time()
+    if processes == 1:
+        _init_worker(template)
+        outcomes = [_build_job(job) for job in jobs]
+    else:
+        pool = multiprocessing.Pool(processes, _init_worker, (template,))
+        try:
+            outcomes = pool.map(_build_job, jobs)
+        finally:
+            pool.close()
+            pool.join()
+    elapsed = time.time() - start
+    return BuildReport(outcomes, elapsed, processes or _cpu_count())
+
+
+def build_deck(prs, spec):
+    """
+    Default builder, adds to presentation *prs* the slides described in
+    build spec *spec*.
+    """
+    layouts = prs.slide_layouts
+    layouts_by_name = dict((layout.name, layout) for layout in layouts)
+    for slide_spec in spec.get('slides', ()):
+        layout = slide_spec.get('layout', 0)
+        if isinstance(layout, basestring):
+            layout = layouts_by_name[layout]
+        else:
+            layout = layouts[layout]
+        slide = prs.slides.add_slide(layout)
+        _build_slide(slide, slide_spec)
+
+
+class BuildReport(object):
+    """
+    Outcome of a :func:`build_decks` call. Provides the saved decks and the
+    errors of those that failed, in build spec order, along with throughput
+    figures.
+    """
+    def __init__(self, outcomes, elapsed, processes):
+        super(BuildReport, self).__init__()
+        self._outcomes = outcomes
+        self._elapsed = elapsed
+        self._processes = processes
+
+    @property
+    def build_times(self):
+        """
+        List of the seconds taken to build and save each deck, in build spec
+        order, as measured in the worker that built it. For a deck that
+        failed it's the time taken until the error.
+        """
+        return [build_time for result, build_time, error in self._outcomes]
+
+    @property
+    def deck_count(self):
+        """
+        Number of decks built, not counting those that failed.
+        """
+        return len([error for error in self.errors if error is None])
+
+    @property
+    def decks_per_second(self):
+        """
+        Overall throughput, the number of decks built per second of elapsed
+        time.
+        """
+        if not self._elapsed:
+            return float(self.deck_count)
+        return self.deck_count / self._elapsed
+
+    @property
+    def elapsed(self):
+        """
+        Wall-clock seconds taken to build all the decks, including worker
+        start-up.
+        """
+        return self._elapsed
+
+    @property
+    def errors(self):
+        """
+        List of the error message for each build spec, in build spec order,
+        like ``'KeyError: ...'``, or |None| for a deck built successfully.
+        """
+        return [error for result, build_time, error in self._outcomes]
+
+    @property
+    def processes(self):
+        """
+        Number of worker processes used.
+        """
+        return self._processes
+
+    @property
+    def results(self):
+        """
+        List of the saved decks in build spec order, as bytes or as file
+        paths when an output directory was given. The item for a deck that
+        failed is |None|.
+        """
+        return [result for result, build_time, error in self._outcomes]
+
+
+def _build_job(job):
+    """
+    Build and save the deck for one *job*, a ``(builder, spec, out_dir,
+    idx)`` tuple, returning a ``(result, build_time, error)`` 3-tuple, where
+    *error* is |None|, or a message and *result* |None| if it failed. Runs
+    in a worker process.
+    """
+    builder, spec, out_dir, idx = job
+    start = time.time()
+    try:
+        prs = Presentation(StringIO(_template_blob))
+        builder(prs, spec)
+        if out_dir is None:
+            stream = StringIO()
+            prs.save(stream)
+            result = stream.getvalue()
+        else:
+            filename = spec.get('filename', 'deck%d.pptx' % (idx+1))
+            result = os.path.join(out_dir, filename)
+            prs.save(result)
+    except Exception as e:
+        error = '%s: %s' % (type(e).__name__, e)
+        return None, time.time() - start, error
+    return result, time.time() - start, None
+
+
+def _build_slide(slide, slide_spec):
+    """
+    Add the content described in *slide_spec* to *slide*.
+    """
+    if 'title' in slide_spec:
+        slide.shapes.title.textframe.text = slide_spec['title']
+    placeholder_text = slide_spec.get('placeholders', {})
+    for placeholder in slide.placeholders:
+        if placeholder.idx in placeholder_text:
+            text = placeholder_text[placeholder.idx]
+            placeholder.textframe.text = text
+    shapes = slide.shapes
+    for tb in slide_spec.get('textboxes', ()):
+        textbox = shapes.add_textbox(
+            tb['left'], tb['top'], tb['width'], tb['height']
+        )
+        textbox.textframe.text = tb['text']
+    for tbl in slide_spec.get('tables', ()):
+        rows = tbl['rows']
+        cols = max(len(row) for row in rows)
+        table = shapes.add_table(
+            len(rows), cols, tbl['left'], tbl['top'], tbl['width'],
+            tbl['height']
+        )
+        for row_idx, row in enumerate(rows):
+            for col_idx, text in enumerate(row):
+                table.cell(row_idx, col_idx).text = text
+    for pic in slide_spec.get('pictures', ()):
+        shapes.add_picture(
+            pic['image'], pic['left'], pic['top'], pic.get('width'),
+            pic.get('height')
+        )
+
+
+def _cpu_count():
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+
+#: contents of the template file, read once by each worker process
+_template_blob = None
+
+
+def _init_worker(template):
+    """
+    Read the template file at *template* so each worker process does so
+    only once, however many decks it builds.
+    """
+    global _template_blob
+    with open(template, 'rb') as f:
+        _template_blob = f.read()
@@ -13,6 +13,7 @@ from ..opc.package import Part
 from ..opc.packuri import PackURI
 from ..oxml import parse_xml_bytes
 from ..oxml.coreprops import CT_CoreProperties
+from ..oxml.xmlchemy import Delegated
 
 
 class CoreProperties(Part):
@@ -26,6 +27,22 @@ class CoreProperties(Part):
         'last_printed', 'modified', 'revision', 'subject', 'title', 'version'
     )
 
+    author = Delegated('_element', 'author')
+    category = Delegated('_element', 'category')
+    comments = Delegated('_element', 'comments')
+    content_status = Delegated('_element', 'content_status')
+    created = Delegated('_element', 'created')
+    identifier = Delegated('_element', 'identifier')
+    keywords = Delegated('_element', 'keywords')
+    language = Delegated('_element', 'language')
+    last_modified_by = Delegated('_element', 'last_modified_by')
+    last_printed = Delegated('_element', 'last_printed')
+    modified = Delegated('_element', 'modified')
+    revision = Delegated('_element', 'revision')
+    subject = Delegated('_element', 'subject')
+    title = Delegated('_element', 'title')
+    version = Delegated('_element', 'version')
+
     def __init__(self, partname, content_type, core_props_elm):
         super(CoreProperties, self).__init__(
             partname, content_type, element=core_props_elm
@@ -53,20 +70,3 @@ class CoreProperties(Part):
         core_props_elm = CT_CoreProperties.new_coreProperties()
         return CoreProperties(partname, content_type, core_props_elm)
 
-    def __getattribute__(self, name):
-        """
-        Intercept attribute access to generalize property getters.
-        """
-        if name in CoreProperties._propnames:
-            return getattr(self._element, name)
-        else:
-            return super(CoreProperties, self).__getattribute__(name)
-
-    def __setattr__(self, name, value):
-        """
-        Intercept attribute assignment to generalize assignment to properties
-        """
-        if name in CoreProperties._propnames:
-            setattr(self._element, name, value)
-        else:
-            super(CoreProperties, self).__setattr__(name, value)
@@ -6,12 +6,6 @@ Image part objects, including Image
 
 import hashlib
 import os
-import posixpath
-
-try:
-    from PIL import Image as PIL_Image
-except ImportError:
-    import Image as PIL_Image
 
 from StringIO import StringIO
 
@@ -19,7 +13,7 @@ from pptx.opc.package import Part
 from pptx.opc.packuri import PackURI
 from pptx.opc.spec import image_content_types
 from pptx.parts.part import PartCollection
-from pptx.util import Px
+from pptx.util import lazyproperty, Px
 
 
 class Image(Part):
@@ -55,7 +49,7 @@ class Image(Part):
 
     @classmethod
     def load(cls, partname, content_type, blob, package):
-        ext = posixpath.splitext(partname)[1]
+        ext = partname.ext
         return cls(partname, content_type, blob, ext)
 
     @property
@@ -82,7 +76,7 @@ class Image(Part):
             'WMF': 'wmf'
         }
         stream.seek(0)
-        format = PIL_Image.open(stream).format
+        format = _PIL_Image().open(stream).format
         if format not in ext_map:
             tmpl = "unsupported image format, expected one of: %s, got '%s'"
             raise ValueError(tmpl % (ext_map.keys(), format))
@@ -144,7 +138,7 @@ class Image(Part):
             height = int(round(native_height * scaling_factor))
         return width, height
 
-    @property
+    @lazyproperty
     def _sha1(self):
         """Return SHA1 hash digest for image"""
         return hashlib.sha1(self._blob).hexdigest()
@@ -156,7 +150,7 @@ class Image(Part):
         image in pixels.
         """
         image_stream = StringIO(self._blob)
-        width_px, height_px = PIL_Image.open(image_stream).size
+        width_px, height_px = _PIL_Image().open(image_stream).size
         image_stream.close()
         return width_px, height_px
 
@@ -170,6 +164,7 @@ class ImageCollection(PartCollection):
     """
     def __init__(self):
         super(ImageCollection, self).__init__()
+        self._reserved_partnames = set()
 
     def add_image(self, file):
         """
@@ -190,27 +185,77 @@ class ImageCollection(PartCollection):
         self._rename_images()
         return image
 
+    def add_image_part(self, image):
+        """
+        Return the image part in this collection having the same content as
+        *image*, an image part typically belonging to another package. If no
+        such image part is present, a copy of *image* is added and returned.
+        """
+        for existing_image in self._values:
+            if existing_image._sha1 == image._sha1:
+                return existing_image
+        partname = PackURI('/ppt/media/image1.%s' % image.ext)  # renamed below
+        image_copy = Image(
+            partname, image.content_type, image.blob, image.ext,
+            image._filepath
+        )
+        self._values.append(image_copy)
+        self._rename_images()
+        return image_copy
+
     def load(self, parts):
         """
         Load the image collection with all the image parts in iterable
-        *parts*.
+        *parts*. The partnames of other parts under ``/ppt/media/``, such as
+        images left unloaded as passthrough parts, are noted so no image
+        added later is given one of them.
         """
-        def is_image_part(part):
-            return (
-                isinstance(part, Image) and
-                part.partname.startswith('/ppt/media/')
-            )
+        images = []
         for part in parts:
-            if is_image_part(part):
-                self.add_part(part)
+            if not part.partname.startswith('/ppt/media/'):
+                continue
+            if isinstance(part, Image):
+                images.append(part)
+            else:
+                self._reserved_partnames.add(part.partname)
+        self.add_parts(images)
+
+    def retain(self, parts):
+        """
+        Remove from this collection any image part not in *parts*, for
+        example after removing a slide that was the only one referencing an
+        image.
+        """
+        parts = set(parts)
+        self._values[:] = [image for image in self._values if image in parts]
+        self._reserved_partnames &= set(part.partname for part in parts)
 
     def _rename_images(self):
         """
         Assign partnames like ``/ppt/media/image9.png`` to all images in the
         collection. The name portion is always ``image``. The number part
-        forms a continuous sequence starting at 1 (e.g. 1, 2, 3, ...). The
-        extension is preserved during renaming.
+        forms a sequence starting at 1 (e.g. 1, 2, 3, ...), skipping any
+        number whose partname is taken by a media part not in the collection.
+        The extension is preserved during renaming.
         """
-        for idx, image in enumerate(self._values):
-            partname_str = '/ppt/media/image%d.%s' % (idx+1, image.ext)
-            image.partname = PackURI(partname_str)
+        idx = 0
+        for image in self._values:
+            while True:
+                idx += 1
+                partname = '/ppt/media/image%d.%s' % (idx, image.ext)
+                if partname not in self._reserved_partnames:
+                    break
+            image.partname = PackURI(partname)
+
+
+def _PIL_Image():
+    """
+    Return the PIL Image module, imported on first use rather than when this
+    module is imported since PIL is slow to import and many programs never
+    add or measure an image.
+    """
+    try:
+        from PIL import Image as PIL_Image
+    except ImportError:
+        import Image as PIL_Image
+    return PIL_Image
@@ -4,7 +4,6 @@
 General-purpose Part-related objects
 """
 
-from pptx.opc.packuri import PackURI
 from pptx.util import Collection
 
 
@@ -22,11 +21,26 @@ class PartCollection(Collection):
         """
         Insert a new part into the collection such that list remains sorted
         in logical partname order (e.g. slide10.xml comes after slide9.xml).
+        The insertion point is found by binary search, after any parts having
+        the same partname index.
         """
+        values = self._values
         new_partidx = part.partname.idx
-        for idx, seq_part in enumerate(self._values):
-            partidx = PackURI(seq_part.partname).idx
-            if partidx > new_partidx:
-                self._values.insert(idx, part)
-                return
-        self._values.append(part)
+        lo, hi = 0, len(values)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if new_partidx < values[mid].partname.idx:
+                hi = mid
+            else:
+                lo = mid + 1
+        values.insert(lo, part)
+
+    def add_parts(self, parts):
+        """
+        Add each part in iterable *parts* to the collection, leaving it in
+        the same order as calling add_part() for each in turn would, but
+        sorting just once, which is much faster for a large number of parts.
+        """
+        values = self._values
+        values.extend(parts)
+        values.sort(key=lambda part: part.partname.idx)
@@ -24,6 +24,14 @@ class PresentationPart(Part):
             partname, content_type, element=presentation_elm, package=package
         )
 
+    def before_marshal(self):
+        """
+        Assign slide partnames in presentation order. Renaming is deferred to
+        save time so removing or reordering slides doesn't rename every
+        slide part on each change.
+        """
+        self.slides.rename_slides()
+
     @classmethod
     def load(cls, partname, content_type, blob, package):
         presentation_elm = parse_xml_bytes(blob)
@@ -6,13 +6,17 @@ Slide and related objects.
 
 from __future__ import absolute_import
 
+import hashlib
+import posixpath
+import re
+
 from warnings import warn
 
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
-from ..opc.package import Part
+from ..opc.package import Part, PartFactory
 from ..opc.packuri import PackURI
 from ..oxml import parse_xml_bytes
-from ..oxml.ns import nsmap, _nsmap, qn
+from ..oxml.ns import compiled_xpath, nsmap, qn
 from ..oxml.shared import Element, SubElement
 from ..oxml.shapes.shared import ST_Direction, ST_PlaceholderType
 from ..shapes.autoshape import AutoShapeType
@@ -59,10 +63,7 @@ class BaseSlide(Part):
         """
         Reference to ``<p:spTree>`` element for this slide
         """
-        spTree_lst = self._element.xpath(
-            './p:cSld/p:spTree', namespaces=_nsmap
-        )
-        return spTree_lst[0]
+        return compiled_xpath('./p:cSld/p:spTree')(self._element)[0]
 
     def _add_image(self, img_file):
         """
@@ -71,7 +72,9 @@ class BaseSlide(Part):
         matching image part is already present. If the slide already has a
         relationship to an existing image, that relationship is reused.
         """
-        image = self._package._images.add_image(img_file)
+        package = self._package
+        with package.lock:
+            image = package._images.add_image(img_file)
         rId = self.relate_to(image, RT.IMAGE)
         return (image, rId)
 
@@ -186,13 +189,100 @@ class SlideCollection(object):
         """
         Return a newly added slide that inherits layout from *slidelayout*.
         """
-        partname = self._next_partname
         package = self._prs.package
-        slide = Slide.new(slidelayout, partname, package)
-        rId = self._prs.relate_to(slide, RT.SLIDE)
-        self._sldIdLst.add_sldId(rId)
+        with package.lock:
+            partname = self._next_partname
+            slide = Slide.new(slidelayout, partname, package)
+            rId = self._prs.relate_to(slide, RT.SLIDE)
+            self._sldIdLst.add_sldId(rId)
         return slide
 
+    def import_from(self, source, slides=None, layout_mapping=None):
+        """
+        Append copies of slides from |Presentation| *source* to this
+        collection and return them as a list. *slides* is a sequence of
+        slides (or slide indexes) in *source*; all of its slides are copied
+        when |None|. Each copy is related to a slide layout of this
+        presentation rather than to a copy of the source layout. The layout
+        is taken from *layout_mapping*, a dict keyed by source layout or
+        layout name, when present there; otherwise the first layout having
+        the same name, or failing that identical XML, is used. Raises
+        |ValueError| if no layout matches. Images are shared with any
+        existing image having the same content. Notes slides are not copied.
+        """
+        src_slides = source.slides
+        if slides is None:
+            slides = list(src_slides)
+        else:
+            slides = [
+                src_slides[s] if isinstance(s, (int, long)) else s
+                for s in slides
+            ]
+        layout_for = _LayoutMapper(self._prs, layout_mapping)
+        package = self._prs.package
+        with package.lock:
+            used_partnames = set(part.partname for part in package.parts)
+            copies = {}
+            for src_slide in slides:
+                if src_slide in copies:
+                    continue
+                slide = self._import_slide(src_slide, layout_for)
+                copies[src_slide] = slide
+            part_copies = {}
+            for src_slide, slide in copies.items():
+                self._import_rels(
+                    src_slide, slide, copies, part_copies, used_partnames
+                )
+        return [copies[src_slide] for src_slide in slides]
+
+    def index(self, slide):
+        """
+        Return the zero-based position of *slide* in this collection.
+        Raises |ValueError| if *slide* is not in the collection.
+        """
+        for idx, sldId in enumerate(self._sldIdLst):
+            if self._prs.related_parts[sldId.rId] is slide:
+                return idx
+        raise ValueError('slide not in collection')
+
+    def move(self, slide, new_idx):
+        """
+        Move *slide* to position *new_idx* in this collection, with the same
+        semantics as ``list.insert()`` with respect to out-of-range and
+        negative values of *new_idx*. Slide partnames are not changed until
+        the presentation is saved.
+        """
+        with self._prs.package.lock:
+            sldId = self._sldIdLst[self.index(slide)]
+            self._sldIdLst.remove(sldId)
+            self._sldIdLst.insert(new_idx, sldId)
+
+    def remove(self, slide):
+        """
+        Remove *slide* from this presentation. Raises |ValueError| if *slide*
+        is not in the collection.
+        """
+        self.remove_slides((slide,))
+
+    def remove_slides(self, slides):
+        """
+        Remove each slide in iterable *slides* from this presentation. The
+        relationship from the presentation to each slide is dropped, along
+        with any parts, such as images and notes slides, that are no longer
+        reachable once the slides are gone. Raises |ValueError| if any of
+        *slides* is not in the collection, in which case no slide is
+        removed.
+        """
+        package = self._prs.package
+        with package.lock:
+            rIds = set(self._rIds_for(slides))
+            for sldId in list(self._sldIdLst):
+                if sldId.rId in rIds:
+                    self._sldIdLst.remove(sldId)
+            for rId in rIds:
+                del self._prs.rels[rId]
+            package.drop_unreachable_parts()
+
     def rename_slides(self):
         """
         Assign partnames like ``/ppt/slides/slide9.xml`` to all slides in the
@@ -204,15 +294,212 @@ class SlideCollection(object):
             partname_str = '/ppt/slides/slide%d.xml' % (idx+1)
             slide.partname = PackURI(partname_str)
 
+    def reorder(self, slides):
+        """
+        Rearrange the slides in this collection into the order they appear
+        in *slides*, a sequence containing each slide in the collection
+        exactly once. Raises |ValueError| if *slides* is not a permutation of
+        the slides in this collection.
+        """
+        slides = list(slides)
+        with self._prs.package.lock:
+            if len(slides) != len(self):
+                raise ValueError('reorder() requires every slide exactly once')
+            rIds = self._rIds_for(slides)
+            if len(rIds) != len(slides):
+                raise ValueError('reorder() requires every slide exactly once')
+            sldIds = dict((sldId.rId, sldId) for sldId in self._sldIdLst)
+            for rId in rIds:
+                self._sldIdLst.append(sldIds[rId])
+
+    def _import_rels(self, src_part, part, slide_copies, part_copies,
+                     used_partnames):
+        """
+        Give *part*, a copy of *src_part* from another package, the
+        relationships *src_part* has, with the same rIds. Images are merged
+        into this package's image collection, slides are mapped to their
+        copy in *slide_copies* and other parts are copied once each, tracked
+        in *part_copies*. A relationship to a slide that was not imported
+        is dropped along with the XML references to it, as is the
+        relationship to a notes slide.
+        """
+        package = self._prs.package
+        for rel in src_part.rels.values():
+            if rel.rId in part.rels:
+                continue
+            if rel.is_external:
+                part.load_rel(rel.reltype, rel.target_ref, rel.rId, True)
+            elif rel.reltype == RT.IMAGE:
+                image = package._images.add_image_part(rel.target_part)
+                part.load_rel(RT.IMAGE, image, rel.rId)
+            elif rel.reltype in (RT.SLIDE, RT.NOTES_SLIDE):
+                target = slide_copies.get(rel.target_part)
+                if target is None:
+                    _remove_rId_references(part, rel.rId)
+                    continue
+                part.load_rel(RT.SLIDE, target, rel.rId)
+            else:
+                src_target = rel.target_part
+                target = part_copies.get(src_target)
+                if target is None:
+                    partname = _unused_partname(
+                        src_target.partname, used_partnames
+                    )
+                    target = PartFactory(
+                        partname, src_target.content_type, src_target.blob,
+                        package
+                    )
+                    part_copies[src_target] = target
+                    self._import_rels(
+                        src_target, target, slide_copies, part_copies,
+                        used_partnames
+                    )
+                part.load_rel(rel.reltype, target, rel.rId)
+
+    def _import_slide(self, src_slide, layout_for):
+        """
+        Return a copy of *src_slide* appended to this collection, related
+        only to the slide layout *layout_for* maps its layout to.
+        """
+        slide_layout = layout_for(src_slide.slide_layout)
+        slide = self._append_slide(parse_xml_bytes(src_slide.blob))
+        layout_rel = src_slide.rels._get_rel_of_type(RT.SLIDE_LAYOUT)
+        slide.load_rel(RT.SLIDE_LAYOUT, slide_layout, layout_rel.rId)
+        return slide
+
+    def _append_slide(self, slide_elm):
+        """
+        Return a new slide having *slide_elm* as its XML, appended to this
+        collection. The caller relates it to its slide layout and any other
+        parts it refers to.
+        """
+        partname = self._next_partname
+        slide = Slide(partname, CT.PML_SLIDE, slide_elm, self._prs.package)
+        rId = self._prs.relate_to(slide, RT.SLIDE)
+        self._sldIdLst.add_sldId(rId)
+        return slide
+
     @property
     def _next_partname(self):
         """
         Return |PackURI| instance containing the partname for a slide to be
         appended to this slide collection, e.g. ``/ppt/slides/slide9.xml``
-        for a slide collection containing 8 slides.
+        for a slide collection containing 8 slides. Because renaming is
+        deferred until save, the number is advanced past any partname still
+        held by a slide after a removal.
+        """
+        used_partnames = set(slide.partname for slide in self)
+        n = len(self) + 1
+        while True:
+            partname = PackURI('/ppt/slides/slide%d.xml' % n)
+            if partname not in used_partnames:
+                return partname
+            n += 1
+
+    def _rIds_for(self, slides):
         """
-        partname_str = '/ppt/slides/slide%d.xml' % (len(self)+1)
-        return PackURI(partname_str)
+        Return the rIds of the presentation relationships to *slides*, in
+        the same order, with duplicates removed. Raises |ValueError| if any
+        slide in *slides* is not in this collection.
+        """
+        rIds_by_slide = dict(
+            (self._prs.related_parts[sldId.rId], sldId.rId)
+            for sldId in self._sldIdLst
+        )
+        rIds, seen = [], set()
+        for slide in slides:
+            if slide not in rIds_by_slide:
+                raise ValueError('slide not in collection')
+            rId = rIds_by_slide[slide]
+            if rId not in seen:
+                seen.add(rId)
+                rIds.append(rId)
+        return rIds
+
+
+class _LayoutMapper(object):
+    """
+    Callable that returns the slide layout in destination presentation part
+    *prs* to use in place of a slide layout from another presentation.
+    Destination layouts are indexed by name and by a hash of their XML just
+    once, so importing many slides does not rescan the layouts per slide.
+    """
+    def __init__(self, prs, layout_mapping=None):
+        super(_LayoutMapper, self).__init__()
+        self._prs = prs
+        self._layout_mapping = layout_mapping or {}
+
+    def __call__(self, src_layout):
+        for key in (src_layout, src_layout.name):
+            if key in self._layout_mapping:
+                return self._layout_mapping[key]
+        if src_layout.name in self._layouts_by_name:
+            return self._layouts_by_name[src_layout.name]
+        sha1 = _xml_sha1(src_layout)
+        if sha1 in self._layouts_by_sha1:
+            return self._layouts_by_sha1[sha1]
+        tmpl = "no slide layout in destination matches source layout '%s'"
+        raise ValueError(tmpl % src_layout.name)
+
+    @lazyproperty
+    def _layouts_by_name(self):
+        layouts_by_name = {}
+        for slide_layout in self._slide_layouts:
+            layouts_by_name.setdefault(slide_layout.name, slide_layout)
+        return layouts_by_name
+
+    @lazyproperty
+    def _layouts_by_sha1(self):
+        layouts_by_sha1 = {}
+        for slide_layout in self._slide_layouts:
+            sha1 = _xml_sha1(slide_layout)
+            layouts_by_sha1.setdefault(sha1, slide_layout)
+        return layouts_by_sha1
+
+    @property
+    def _slide_layouts(self):
+        for slide_master in self._prs.slide_masters:
+            for slide_layout in slide_master.slide_layouts:
+                yield slide_layout
+
+
+def _remove_rId_references(part, rId):
+    """
+    Remove each ``r:id`` attribute in the XML of *part* having the value
+    *rId*, e.g. a hyperlink to a slide that is not present in the package.
+    """
+    if part._element is None:
+        return
+    r_id = qn('r:id')
+    for elm in compiled_xpath('//*[@r:id=$rId]')(part._element, rId=rId):
+        del elm.attrib[r_id]
+
+
+def _unused_partname(partname, used_partnames):
+    """
+    Return a |PackURI| like *partname* but having the lowest index that
+    does not appear in *used_partnames*, e.g. ``/ppt/charts/chart3.xml``
+    for ``/ppt/charts/chart1.xml`` when chart1 and chart2 are in use. The
+    new partname is added to *used_partnames*.
+    """
+    name, ext = posixpath.splitext(partname.filename)
+    name = re.sub(r'[0-9]*$', '', name)
+    n = 1
+    while True:
+        candidate = PackURI(
+            posixpath.join(partname.baseURI, '%s%d%s' % (name, n, ext))
+        )
+        if candidate not in used_partnames:
+            used_partnames.add(candidate)
+            return candidate
+        n += 1
+
+
+def _xml_sha1(part):
+    """
+    Return the SHA1 hex digest of the serialized XML of *part*.
+    """
+    return hashlib.sha1(part.blob).hexdigest()
 
 
 class _SlideShapeTree(BaseShapeTree):
@@ -419,7 +706,7 @@ class _SlideShapeTree(BaseShapeTree):
 
         # increment numpart as necessary to make name unique
         numpart = id - 1
-        names = self._spTree.xpath('//p:cNvPr/@name', namespaces=_nsmap)
+        names = compiled_xpath('//p:cNvPr/@name')(self._spTree)
         while True:
             name = '%s %d' % (basename, numpart)
             if name not in names:
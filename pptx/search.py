@@ -0,0 +1,272 @@
+# encoding: utf-8
+
+"""
+Deck-wide search and replace over the text of the slides in a presentation.
+
+The text of each slide is indexed in a single pass over its ``<a:t>`` and
+``<a:br>`` elements, which records the text of each paragraph and the
+element each piece of it comes from. The index of a slide is kept between
+searches and rebuilt only when the slide's text elements have changed, which
+is checked by comparing the elements and their text with those indexed.
+"""
+
+from __future__ import absolute_import
+
+import re
+
+from bisect import bisect_right
+from collections import namedtuple
+
+from .oxml.ns import qn
+from .util import to_unicode
+
+
+#: A match of a search pattern in the text of a paragraph. *slide* is the
+#: slide the paragraph is on and *slide_index* its 0-based position in the
+#: presentation. *shape_id* and *shape_name* identify the shape containing
+#: the paragraph. The match is ``paragraph_text[start:end]``, where a line
+#: break in the paragraph appears as a newline.
+TextMatch = namedtuple(
+    'TextMatch',
+    'slide slide_index shape_id shape_name paragraph_text start end'
+)
+
+
+class TextIndex(object):
+    """
+    Index of the paragraph text on each slide of presentation part *prs*.
+    """
+    def __init__(self, prs):
+        super(TextIndex, self).__init__()
+        self._prs = prs
+        self._slide_texts = {}
+
+    def find(self, pattern):
+        """
+        Return a list of |TextMatch| for each non-empty match of *pattern*, a
+        regular expression string or compiled pattern, in the paragraphs of
+        the slides, in presentation and then document order. A match may
+        span runs but not paragraphs.
+        """
+        regex = _compile(pattern)
+        matches = []
+        for slide_index, slide, slide_text in self._iter_slide_texts():
+            for paragraph in slide_text.paragraphs:
+                for match in _finditer(regex, paragraph.text):
+                    shape_id, shape_name = paragraph.shape_id_and_name
+                    matches.append(TextMatch(
+                        slide, slide_index, shape_id, shape_name,
+                        paragraph.text, match.start(), match.end()
+                    ))
+        return matches
+
+    def replace(self, pattern, repl):
+        """
+        Replace each non-empty match of *pattern* in the paragraphs of the
+        slides with *repl* and return the number of matches replaced. *repl*
+        is a string, in which backreferences like ``\\1`` are expanded, or a
+        function called with the match object and returning the replacement
+        string, as for ``re.sub()``. The replacement takes on the formatting
+        of the run the match starts in, and a run a match leaves empty is
+        removed. A match that includes a line break or a field, such as a
+        slide number, is not replaced.
+        """
+        regex = _compile(pattern)
+        if not callable(repl):
+            template = to_unicode(repl)
+            repl = lambda match: match.expand(template)  # noqa
+        count, changed_slides = 0, []
+        for slide_index, slide, slide_text in self._iter_slide_texts():
+            slide_count = 0
+            for paragraph in slide_text.paragraphs:
+                slide_count += paragraph.replace(regex, repl)
+            if slide_count:
+                changed_slides.append(slide)
+            count += slide_count
+        for slide in changed_slides:
+            del self._slide_texts[slide]
+        return count
+
+    def _iter_slide_texts(self):
+        """
+        Generate a ``(slide_index, slide, slide_text)`` 3-tuple for each
+        slide in the presentation, indexing the text of any slide not
+        indexed or changed since it was indexed. Slides that are no longer
+        in the presentation are dropped from the index once all the slides
+        are visited.
+        """
+        slide_texts = {}
+        for slide_index, slide in enumerate(self._prs.slides):
+            sld = slide._element
+            if sld is None:
+                continue
+            slide_text = self._slide_texts.get(slide)
+            if slide_text is None or not slide_text.is_current(sld):
+                slide_text = _SlideText(sld)
+            slide_texts[slide] = slide_text
+            yield slide_index, slide, slide_text
+        self._slide_texts = slide_texts
+
+
+class _SlideText(object):
+    """
+    The paragraph text of slide element *sld*, along with the text elements
+    it was read from, for checking whether it is still current.
+    """
+    __slots__ = ('paragraphs', '_elms', '_elm_ids', '_texts')
+
+    def __init__(self, sld):
+        super(_SlideText, self).__init__()
+        self._elms = elms = list(sld.iter(_t_tag, _br_tag))
+        self._elm_ids = [id(elm) for elm in elms]
+        self._texts = [elm.text for elm in elms]
+        self.paragraphs = _ParagraphText.group(elms)
+
+    def is_current(self, sld):
+        """
+        Return |True| if *sld* has the same text elements, having the same
+        text, as when this index was built. The elements are held by this
+        object, so their ids can't be reused by other elements meanwhile.
+        This takes a fraction of the time indexing the slide again does.
+        """
+        if [id(elm) for elm in sld.iter(_t_tag, _br_tag)] != self._elm_ids:
+            return False
+        return [elm.text for elm in self._elms] == self._texts
+
+
+class _ParagraphText(object):
+    """
+    The text of paragraph *p*, the concatenation of *texts*, each read from
+    the ``<a:t>`` or ``<a:br>`` element at the same position in *elms*.
+    """
+    __slots__ = ('_p', '_elms', '_texts', 'text')
+
+    def __init__(self, p, elms, texts):
+        super(_ParagraphText, self).__init__()
+        self._p = p
+        self._elms = elms
+        self._texts = texts
+        self.text = u''.join(texts)
+
+    @classmethod
+    def group(cls, elms):
+        """
+        Return a list of |_ParagraphText| for the paragraphs containing the
+        ``<a:t>`` and ``<a:br>`` elements in *elms*, in document order.
+        """
+        groups = []
+        p = None
+        for elm in elms:
+            if elm.tag == _br_tag:
+                elm_p, text = elm.getparent(), u'\n'
+            else:
+                elm_p, text = elm.getparent().getparent(), elm.text or u''
+            if elm_p is not p:
+                p = elm_p
+                groups.append((p, [], []))
+            groups[-1][1].append(elm)
+            groups[-1][2].append(text)
+        return [
+            cls(group_p, group_elms, group_texts)
+            for group_p, group_elms, group_texts in groups
+        ]
+
+    def replace(self, regex, repl):
+        """
+        Replace each match of *regex* in this paragraph with the string
+        returned by *repl* for it and return the number replaced. Matches
+        are replaced from the last one back, so the offsets of the earlier
+        ones remain valid.
+        """
+        if regex.search(self.text) is None:
+            return 0
+        texts = list(self._texts)
+        starts, offset = [], 0
+        for text in self._texts:
+            starts.append(offset)
+            offset += len(text)
+        emptied = set()
+        count = 0
+        for match in reversed(list(_finditer(regex, self.text))):
+            first = _piece_at(starts, match.start())
+            last = _piece_at(starts, match.end() - 1)
+            if not all(self._is_run_text(idx) for idx in
+                       range(first, last+1)):
+                continue
+            start = match.start() - starts[first]
+            end = match.end() - starts[last]
+            replacement = to_unicode(repl(match))
+            if first == last:
+                text = texts[first]
+                texts[first] = text[:start] + replacement + text[end:]
+            else:
+                texts[first] = texts[first][:start] + replacement
+                texts[first+1:last] = [u''] * (last - first - 1)
+                texts[last] = texts[last][end:]
+                emptied.update(range(first+1, last+1))
+            count += 1
+        for idx, (elm, text) in enumerate(zip(self._elms, texts)):
+            if idx in emptied and not text:
+                self._p.remove(elm.getparent())
+            elif text != self._texts[idx]:
+                elm.text = text
+        return count
+
+    @property
+    def shape_id_and_name(self):
+        """
+        The ``(id, name)`` of the shape containing this paragraph, taken from
+        the first ``<p:cNvPr>`` element in the shape.
+        """
+        for shape in self._p.iterancestors(*_shape_tags):
+            for cNvPr in shape.iter(_cNvPr_tag):
+                return int(cNvPr.get('id')), cNvPr.get('name')
+        return None, None
+
+    def _is_run_text(self, idx):
+        """
+        Return |True| if the piece of text at *idx* is the text of a run,
+        rather than a line break or field.
+        """
+        elm = self._elms[idx]
+        return elm.tag == _t_tag and elm.getparent().tag == _r_tag
+
+
+_br_tag = qn('a:br')
+_cNvPr_tag = qn('p:cNvPr')
+_r_tag = qn('a:r')
+_t_tag = qn('a:t')
+_shape_tags = tuple(
+    qn(tag) for tag in (
+        'p:sp', 'p:grpSp', 'p:graphicFrame', 'p:pic', 'p:cxnSp'
+    )
+)
+
+
+def _compile(pattern):
+    """
+    Return *pattern* compiled as a unicode regular expression, or *pattern*
+    itself if it is already compiled.
+    """
+    if isinstance(pattern, basestring):
+        return re.compile(to_unicode(pattern), re.UNICODE)
+    return pattern
+
+
+def _finditer(regex, text):
+    """
+    Generate each non-empty match of *regex* in *text*.
+    """
+    for match in regex.finditer(text):
+        if match.end() > match.start():
+            yield match
+
+
+def _piece_at(starts, offset):
+    """
+    Return the index of the piece of text containing character *offset*,
+    given the offset at which each piece starts in *starts*. An empty piece
+    never contains a character, so the last piece starting at or before
+    *offset* is the one.
+    """
+    return bisect_right(starts, offset) - 1
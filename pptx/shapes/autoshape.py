@@ -10,7 +10,6 @@ from ..dml.fill import FillFormat
 from ..dml.line import LineFormat
 from ..enum.shapes import MSO_AUTO_SHAPE_TYPE, MSO_SHAPE_TYPE
 from .shape import BaseShape
-from ..spec import autoshape_types
 from ..util import lazyproperty
 
 
@@ -210,6 +209,7 @@ class AutoShapeType(object):
         if hasattr(self, '_loaded'):
             return
         # raise on bad autoshape_type_id
+        autoshape_types = _autoshape_types()
         if autoshape_type_id not in autoshape_types:
             tmpl = "no autoshape type with id %d in pptx.spec.autoshape_types"
             raise KeyError(tmpl % autoshape_type_id)
@@ -242,7 +242,7 @@ class AutoShapeType(object):
             autoshape_type_id = cls.id_from_prst(prst)
         except KeyError:
             return ()
-        return autoshape_types[autoshape_type_id]['avLst']
+        return _autoshape_types()[autoshape_type_id]['avLst']
 
     @property
     def desc(self):
@@ -344,3 +344,12 @@ class Shape(BaseShape):
             return MSO_SHAPE_TYPE.TEXT_BOX
         msg = 'Shape instance of unrecognized shape type'
         raise NotImplementedError(msg)
+
+
+def _autoshape_types():
+    """
+    Return the ``pptx.spec.autoshape_types`` table, imported on first use
+    rather than when this module is imported.
+    """
+    from ..spec import autoshape_types
+    return autoshape_types
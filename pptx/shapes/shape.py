@@ -7,7 +7,7 @@ Base shape-related objects such as BaseShape.
 from __future__ import absolute_import, print_function
 
 from ..text import TextFrame
-from ..util import to_unicode
+from ..util import cached_element_proxy, to_unicode
 
 
 class BaseShape(object):
@@ -139,7 +139,7 @@ class BaseShape(object):
         txBody = self._element.txBody
         if txBody is None:
             raise ValueError('shape has no text frame')
-        return TextFrame(txBody, self)
+        return cached_element_proxy(TextFrame, txBody, self)
 
     @property
     def width(self):
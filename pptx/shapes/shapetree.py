@@ -5,7 +5,7 @@ The shape tree, the structure that holds a slide's shapes.
 """
 
 from .autoshape import Shape
-from ..oxml.ns import qn
+from ..oxml.ns import compiled_xpath, qn
 from .picture import Picture
 from .shape import BaseShape
 from .table import Table
@@ -81,7 +81,7 @@ class BaseShapeTree(object):
         the minimum id is 2 because the spTree element is always assigned
         id="1".
         """
-        id_str_lst = self._spTree.xpath('//@id')
+        id_str_lst = compiled_xpath('//@id')(self._spTree)
         used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
         for n in range(1, len(used_ids)+2):
             if n not in used_ids:
@@ -10,7 +10,9 @@ from ..enum.shapes import MSO_SHAPE_TYPE
 from .graphfrm import GraphicFrame
 from ..oxml.ns import qn
 from ..text import TextFrame
-from ..util import lazyproperty, to_unicode
+from ..util import (
+    cached_element_proxy, cached_proxy, lazyproperty, to_unicode
+)
 
 
 class Table(GraphicFrame):
@@ -229,7 +231,7 @@ class _Cell(Subshape):
         |TextFrame| instance containing the text that appears in the cell.
         """
         txBody = self._tc.get_or_add_txBody()
-        return TextFrame(txBody, self)
+        return cached_element_proxy(TextFrame, txBody, self)
 
     @property
     def vertical_anchor(self):
@@ -341,7 +343,7 @@ class _CellCollection(Subshape):
         if idx < 0 or idx >= len(self._tr.tc):
             msg = "cell index [%d] out of range" % idx
             raise IndexError(msg)
-        return _Cell(self._tr.tc[idx], self)
+        return cached_proxy(_Cell, self._tr.tc[idx], self)
 
     def __len__(self):
         """Supports len() function (e.g. 'len(cells) == 1')."""
@@ -361,7 +363,8 @@ class _ColumnCollection(Subshape):
         if idx < 0 or idx >= len(self._tbl_elm.tblGrid.gridCol):
             msg = "column index [%d] out of range" % idx
             raise IndexError(msg)
-        return _Column(self._tbl_elm.tblGrid.gridCol[idx], self)
+        gridCol = self._tbl_elm.tblGrid.gridCol[idx]
+        return cached_proxy(_Column, gridCol, self)
 
     def __len__(self):
         """Supports len() function (e.g. 'len(columns) == 1')."""
@@ -387,7 +390,7 @@ class _RowCollection(Subshape):
         if idx < 0 or idx >= len(self._tbl_elm.tr):
             msg = "row index [%d] out of range" % idx
             raise IndexError(msg)
-        return _Row(self._tbl_elm.tr[idx], self)
+        return cached_proxy(_Row, self._tbl_elm.tr[idx], self)
 
     def __len__(self):
         """Supports len() function (e.g. 'len(rows) == 1')."""
@@ -0,0 +1,412 @@
+# encoding: utf-8
+
+"""
+Compiled presentation templates, filled in from a context dict.
+
+A |Template| is compiled from a ``.pptx`` file just once. Compiling merges
+the runs a ``{{name}}`` token is split across into the run it starts in and
+records where each token appears, as the path of child indexes from the
+slide element to the ``<a:t>`` element holding it. Rendering copies each
+slide element and sets the text at those locations, so the cost of a render
+depends on the number of tokens rather than the size of the slides.
+
+A slide having the token ``{{#each name}}`` somewhere in its text is
+rendered once for each item in ``context[name]``, and a table row having it
+in one of its cells is repeated the same way. Tokens in a repeated slide or
+row are looked up in the item before the enclosing context. The ``#each``
+token itself is removed from the text.
+"""
+
+from __future__ import absolute_import
+
+import re
+
+from copy import deepcopy
+from io import BytesIO
+
+from lxml import etree
+
+from .api import Presentation
+from .opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from .oxml.ns import qn
+from .parts.slide import _remove_rId_references
+from .util import to_unicode
+
+
+class Template(object):
+    """
+    Presentation template loaded from *pkg_file*, a path to a ``.pptx`` file
+    or a file-like object, and compiled for rendering any number of times.
+    Raises |ValueError| if a slide or table row has more than one ``#each``
+    token.
+    """
+    def __init__(self, pkg_file):
+        super(Template, self).__init__()
+        prs = Presentation(pkg_file)
+        self._slides = tuple(
+            _CompiledSlide.compile(slide._element) for slide in prs.slides
+        )
+        stream = BytesIO()
+        prs.save(stream)
+        self._blob = stream.getvalue()
+
+    def render(self, context):
+        """
+        Return a new |Presentation| having the slides of this template with
+        each token replaced by its value in dict *context*. A value that is
+        not a string is converted with ``unicode()`` and |None| becomes an
+        empty string. A name like ``client.name`` looks up ``name`` in
+        ``context['client']``, by key or else by attribute, and the name
+        ``.`` stands for the current item of an ``#each`` loop. Raises
+        |KeyError| if a name is not in the context. Slides are related to
+        the same slide layouts and images as in the template; notes slides
+        are not rendered.
+        """
+        prs = Presentation(BytesIO(self._blob), load=_load_part)
+        slides = prs.slides
+        src_slides = list(slides)
+        copies = {}
+        for compiled, src_slide in zip(self._slides, src_slides):
+            copies[src_slide] = [
+                slides._append_slide(slide_elm)
+                for slide_elm in compiled.render((context,))
+            ]
+        for src_slide, slide_copies in copies.items():
+            for slide in slide_copies:
+                _relate_copy(src_slide, slide, copies)
+        slides.remove_slides(src_slides)
+        return prs
+
+
+class _CompiledSlide(object):
+    """
+    A template slide element with its runs normalized, along with the
+    location of each token in it.
+    """
+    __slots__ = ('_element', '_loop_name', '_sites', '_row_loops')
+
+    def __init__(self, element, loop_name, sites, row_loops):
+        super(_CompiledSlide, self).__init__()
+        self._element = element
+        self._loop_name = loop_name
+        self._sites = sites
+        self._row_loops = row_loops
+
+    @classmethod
+    def compile(cls, sld):
+        """
+        Return a |_CompiledSlide| for slide element *sld*, which is
+        normalized in place and has its ``#each`` tokens removed.
+        """
+        for p in list(sld.iter(_p_tag)):
+            _normalize_runs(p)
+        loop_name, row_loop_names = _remove_loop_tokens(sld)
+        row_sites = dict((tr, []) for tr in row_loop_names)
+        sites = []
+        for t in sld.iter(_t_tag):
+            if t.getparent().tag != _r_tag:
+                continue
+            segments = _segments(t.text)
+            if segments is None:
+                continue
+            tr = _enclosing_row(t, row_sites)
+            if tr is None:
+                sites.append((_path(sld, t), segments))
+            else:
+                row_sites[tr].append((_path(tr, t), segments))
+        row_loops = tuple(
+            (_path(sld, tr), name, tuple(row_sites[tr]))
+            for tr, name in row_loop_names.items()
+        )
+        return cls(sld, loop_name, tuple(sites), row_loops)
+
+    def render(self, scopes):
+        """
+        Generate a rendered copy of the slide element for each item in the
+        ``#each`` loop of this slide, or just one if it has no loop. Names
+        are looked up in the mappings in *scopes*, innermost first.
+        """
+        if self._loop_name is None:
+            yield self._render(scopes)
+            return
+        for item in _resolve(self._loop_name, scopes):
+            yield self._render((item,) + scopes)
+
+    def _render(self, scopes):
+        """
+        Return a copy of the slide element with its tokens replaced. The
+        token locations are all resolved in the copy before any row is
+        repeated, so the compiled paths remain valid.
+        """
+        sld = deepcopy(self._element)
+        ts = [_descendant(sld, path) for path, segments in self._sites]
+        rows = [
+            (_descendant(sld, path), name, sites)
+            for path, name, sites in self._row_loops
+        ]
+        for t, (path, segments) in zip(ts, self._sites):
+            t.text = _substitute(segments, scopes)
+        for tr, name, sites in rows:
+            for item in _resolve(name, scopes):
+                tr_copy = deepcopy(tr)
+                item_scopes = (item,) + scopes
+                for path, segments in sites:
+                    _descendant(tr_copy, path).text = _substitute(
+                        segments, item_scopes
+                    )
+                tr.addprevious(tr_copy)
+            tr.getparent().remove(tr)
+        return sld
+
+
+_p_tag = qn('a:p')
+_r_tag = qn('a:r')
+_t_tag = qn('a:t')
+_tr_tag = qn('a:tr')
+_run_break_tags = frozenset((qn('a:br'), qn('a:fld')))
+_each_re = re.compile(r'\{\{\s*#each\s+([\w.]+)\s*\}\}', re.UNICODE)
+_token_re = re.compile(r'\{\{\s*(#each\s+)?([\w.]+)\s*\}\}', re.UNICODE)
+
+#: unbound lxml child indexing, counting children of any tag; indexing an
+#: objectified element selects among siblings having the same tag
+_child_at = etree.ElementBase.__getitem__
+
+
+def _descendant(elm, path):
+    """
+    Return the descendant of *elm* at *path*, a sequence of child indexes.
+    """
+    for idx in path:
+        elm = _child_at(elm, idx)
+    return elm
+
+
+def _enclosing_row(t, rows):
+    """
+    Return the ``<a:tr>`` element in *rows* that contains *t*, or |None| if
+    *t* is not in one of them.
+    """
+    for tr in t.iterancestors(_tr_tag):
+        if tr in rows:
+            return tr
+    return None
+
+
+def _load_part(partname, content_type):
+    """
+    Return |False| for the parts a render replaces, which are left unparsed.
+    """
+    return content_type not in (CT.PML_SLIDE, CT.PML_NOTES_SLIDE)
+
+
+def _normalize_runs(p):
+    """
+    Move the text of any token in paragraph *p* that is split across runs
+    into the run it starts in, so each token is in the text of a single
+    run and takes on its formatting. A run emptied in the process is
+    removed. Runs separated by a line break or field are not joined.
+    """
+    for runs in _run_sequences(p):
+        ts = [r.find(_t_tag) for r in runs]
+        texts = [t.text or u'' for t in ts]
+        matches = list(_token_re.finditer(u''.join(texts)))
+        if not matches:
+            continue
+        emptied = set()
+        for match in matches:
+            first = _run_offset(texts, match.start())[0]
+            last, last_offset = _run_offset(texts, match.end() - 1)
+            if first == last:
+                continue
+            moved = texts[first+1:last] + [texts[last][:last_offset+1]]
+            texts[first] += u''.join(moved)
+            texts[first+1:last] = [u''] * (last - first - 1)
+            texts[last] = texts[last][last_offset+1:]
+            for idx in range(first+1, last+1):
+                if not texts[idx]:
+                    emptied.add(idx)
+        for idx, (r, t, text) in enumerate(zip(runs, ts, texts)):
+            if idx in emptied:
+                p.remove(r)
+            elif text != (t.text or u''):
+                t.text = text
+
+
+def _path(ancestor, elm):
+    """
+    Return the tuple of child indexes leading from *ancestor* to *elm*.
+    """
+    path = []
+    while elm is not ancestor:
+        parent = elm.getparent()
+        path.append(parent.index(elm))
+        elm = parent
+    return tuple(reversed(path))
+
+
+def _relate_copy(src_slide, slide, copies):
+    """
+    Give *slide*, a rendered copy of template slide *src_slide*, the
+    relationships *src_slide* has, with the same rIds. A relationship to a
+    template slide is redirected to its first rendered copy, or dropped
+    with the references to it if the slide rendered no copies. The
+    relationship to a notes slide is dropped.
+    """
+    for rel in src_slide.rels.values():
+        if rel.is_external:
+            slide.load_rel(rel.reltype, rel.target_ref, rel.rId, True)
+        elif rel.reltype == RT.NOTES_SLIDE:
+            continue
+        elif rel.reltype == RT.SLIDE:
+            target_copies = copies.get(rel.target_part)
+            if not target_copies:
+                _remove_rId_references(slide, rel.rId)
+                continue
+            slide.load_rel(RT.SLIDE, target_copies[0], rel.rId)
+        else:
+            slide.load_rel(rel.reltype, rel.target_part, rel.rId)
+
+
+def _remove_loop_tokens(sld):
+    """
+    Remove the ``#each`` tokens from slide element *sld*. Return the loop
+    name of the slide, or |None| if it has no loop, and a dict mapping each
+    ``<a:tr>`` element having a loop token to its loop name. A run emptied
+    in the process is removed, and then its paragraph if the paragraph has
+    no other content and is not the only one in its text body.
+    """
+    loop_name, row_loop_names = None, {}
+    for t in list(sld.iter(_t_tag)):
+        if t.getparent().tag != _r_tag:
+            continue
+        names = _each_re.findall(t.text or u'')
+        if not names:
+            continue
+        text = _each_re.sub(u'', t.text)
+        tr = next(t.iterancestors(_tr_tag), None)
+        for name in names:
+            if tr is not None:
+                if tr in row_loop_names:
+                    raise ValueError('table row has more than one #each')
+                row_loop_names[tr] = name
+            else:
+                if loop_name is not None:
+                    raise ValueError('slide has more than one #each')
+                loop_name = name
+        t.text = text
+        if not text:
+            _remove_empty_run(t.getparent())
+    return loop_name, row_loop_names
+
+
+def _remove_empty_run(r):
+    """
+    Remove run *r* from its paragraph, and the paragraph from its text body
+    if it is left without content and has a sibling paragraph.
+    """
+    p = r.getparent()
+    p.remove(r)
+    if p.find(_r_tag) is not None:
+        return
+    if any(p.iterchildren(*_run_break_tags)):
+        return
+    txBody = p.getparent()
+    if sum(1 for _ in txBody.iterchildren(_p_tag)) > 1:
+        txBody.remove(p)
+
+
+def _resolve(name, scopes):
+    """
+    Return the value of *name*, a possibly dotted name, looking up its first
+    part in each of the mappings in *scopes* in turn. Raises |KeyError| if
+    it is not found.
+    """
+    if name == u'.':
+        return scopes[0]
+    parts = name.split(u'.')
+    for scope in scopes:
+        try:
+            value = scope[parts[0]]
+        except (KeyError, TypeError, IndexError):
+            continue
+        break
+    else:
+        raise KeyError(name)
+    for part in parts[1:]:
+        try:
+            value = value[part]
+        except (KeyError, TypeError):
+            try:
+                value = getattr(value, part)
+            except AttributeError:
+                raise KeyError(name)
+    return value
+
+
+def _run_offset(texts, offset):
+    """
+    Return ``(idx, offset)`` locating character *offset* of the joined
+    *texts* in ``texts[idx]``.
+    """
+    for idx, text in enumerate(texts):
+        if offset < len(text):
+            return idx, offset
+        offset -= len(text)
+    raise IndexError('offset out of range')
+
+
+def _run_sequences(p):
+    """
+    Generate each list of consecutive ``<a:r>`` children of paragraph *p*.
+    """
+    runs = []
+    for child in p.iterchildren():
+        if child.tag == _r_tag:
+            runs.append(child)
+            continue
+        if runs:
+            yield runs
+        runs = []
+    if runs:
+        yield runs
+
+
+def _segments(text):
+    """
+    Return *text* parsed into a tuple of ``(literal, name)`` pairs, the last
+    having a name of |None|, or |None| if *text* has no tokens.
+    """
+    if not text or u'{{' not in text:
+        return None
+    segments, pos = [], 0
+    for match in _token_re.finditer(text):
+        segments.append((text[pos:match.start()], match.group(2)))
+        pos = match.end()
+    if not segments:
+        return None
+    segments.append((text[pos:], None))
+    return tuple(segments)
+
+
+def _substitute(segments, scopes):
+    """
+    Return the text compiled into *segments* with each name replaced by its
+    value looked up in *scopes*.
+    """
+    fragments = []
+    for literal, name in segments:
+        fragments.append(literal)
+        if name is not None:
+            fragments.append(_to_text(_resolve(name, scopes)))
+    return u''.join(fragments)
+
+
+def _to_text(value):
+    """
+    Return *value* as a unicode string, empty for |None|.
+    """
+    if value is None:
+        return u''
+    if isinstance(value, basestring):
+        return to_unicode(value)
+    return unicode(value)
@@ -6,12 +6,13 @@ Text-related objects such as TextFrame and Paragraph.
 
 from .dml.fill import FillFormat
 from .enum.dml import MSO_FILL
-from .enum.text import MSO_ANCHOR, PP_ALIGN
+from .enum.text import MSO_ANCHOR, MSO_AUTO_SIZE, PP_ALIGN
 from .opc.constants import RELATIONSHIP_TYPE as RT
 from .oxml.shared import Element, get_or_add
-from .oxml.ns import _nsmap, qn
+from .oxml.ns import qn
+from .oxml.text import CT_TextParagraph
 from .shapes import Subshape
-from .util import Emu, lazyproperty, to_unicode
+from .util import cached_proxy, Emu, lazyproperty, to_unicode
 
 
 class TextFrame(Subshape):
@@ -53,12 +54,37 @@ class TextFrame(Subshape):
         """
         Remove all paragraphs except one empty one.
         """
-        p_list = self._txBody.xpath('./a:p', namespaces=_nsmap)
+        p_list = self._txBody.findall(qn('a:p'))
         for p in p_list[1:]:
             self._txBody.remove(p)
         p = self.paragraphs[0]
         p.clear()
 
+    def fit_text(self, max_size=None):
+        """
+        Set the text of this text frame's shape in the largest whole-point
+        font size, not larger than *max_size*, at which it fits within the
+        shape inside its margins, and return that size. In a table cell the
+        text is fit to the cell's column and row, or columns and rows when
+        it's merged across several. Each run, field and line break gets
+        that size, as does the end of each paragraph, and auto size is
+        turned off so PowerPoint keeps it. When *max_size* is |None| it is
+        the largest effective size of the text, so text is never enlarged.
+        Text is measured with the metrics :mod:`pptx.textlayout` has for its
+        effective font.
+        """
+        from .textlayout import fit_font_size
+        paragraphs, sizes = self._measurable_paragraphs()
+        if max_size is None:
+            max_size = max(sizes)
+        width, height = self._text_area()
+        wrap = self.word_wrap is not False
+        size = fit_font_size(paragraphs, width, height, max_size, wrap)
+        for p in self._txBody.iterchildren(qn('a:p')):
+            _set_font_size(p, size)
+        self.auto_size = MSO_AUTO_SIZE.NONE
+        return size
+
     @property
     def margin_bottom(self):
         """
@@ -107,7 +133,89 @@ class TextFrame(Subshape):
         paragraphs in this text frame. A text frame always contains at least
         one paragraph.
         """
-        return tuple([_Paragraph(p, self) for p in self._txBody[qn('a:p')]])
+        return tuple([
+            cached_proxy(_Paragraph, p, self)
+            for p in self._txBody.iterchildren(qn('a:p'))
+        ])
+
+    def set_paragraphs(self, paragraphs):
+        """
+        Replace all the text in this text frame with *paragraphs*, a
+        sequence having an item for each paragraph. An item is a string, or
+        a ``(text, level)`` or ``(text, level, font)`` tuple. *text* is a
+        string or a sequence of runs, each a string or a ``(text, font)``
+        pair. A *font* is a dict with any of the keys ``'bold'``,
+        ``'italic'``, ``'size'`` and ``'name'``, taking the values the
+        same-named |_Font| properties do. A run's font is applied over its
+        paragraph's::
+
+            textframe.set_paragraphs([
+                ('Agenda', 0, {'bold': True, 'size': Pt(28)}),
+                ('Revenue', 1),
+                (['Costs ', ('up 4%', {'italic': True})], 1),
+            ])
+
+        All the new paragraphs are built before any existing one is removed,
+        so a bad value raises without changing the text frame. String values
+        are converted to unicode assuming UTF-8 encoding.
+        """
+        p_elms = [_new_p(paragraph) for paragraph in paragraphs]
+        if not p_elms:
+            p_elms = [CT_TextParagraph.new_p(())]
+        self._txBody.replace_p_elms(p_elms)
+
+    def _measurable_paragraphs(self):
+        """
+        Return a ``(paragraphs, sizes)`` pair, where *paragraphs* has a
+        sequence of ``(text, font_metrics)`` pairs for the runs, fields and
+        line breaks of each paragraph, as :func:`fit_font_size` takes, and
+        *sizes* is the effective font size of each of them.
+        """
+        from .textlayout import font_metrics
+        part = self.part
+        text_styles = part.package.text_styles
+        paragraphs, sizes = [], []
+        br_tag, rPr_tag, t_tag = qn('a:br'), qn('a:rPr'), qn('a:t')
+        for p in self._txBody.iterchildren(qn('a:p')):
+            texts = [
+                (u'\n' if elm.tag == br_tag else elm.findtext(t_tag) or u'',
+                 elm.find(rPr_tag))
+                for elm in p.iterchildren(qn('a:r'), br_tag, qn('a:fld'))
+            ]
+            if not texts:
+                # an empty paragraph still takes a line
+                texts = [(u'', p.find(qn('a:endParaRPr')))]
+            pieces = []
+            for text, rPr in texts:
+                font = text_styles.effective_font(part, p, rPr)
+                pieces.append(
+                    (text, font_metrics(font.name, font.bold, font.italic))
+                )
+                sizes.append(font.size)
+            paragraphs.append(pieces)
+        return paragraphs, sizes
+
+    def _text_area(self):
+        """
+        Return a ``(width, height)`` pair, the extents in EMU of the area
+        inside the margins of this text frame that its text is laid out in.
+        """
+        txBody = self._txBody
+        tc = txBody.getparent()
+        if tc.tag == qn('a:tc'):
+            width, height = _cell_extents(tc)
+            return (
+                width - tc.marL - tc.marR, height - tc.marT - tc.marB
+            )
+        bodyPr = self._bodyPr
+        shape = self._parent
+        width = shape.width - _inset(bodyPr.lIns, 91440) - _inset(
+            bodyPr.rIns, 91440
+        )
+        height = shape.height - _inset(bodyPr.tIns, 45720) - _inset(
+            bodyPr.bIns, 45720
+        )
+        return width, height
 
     def _set_text(self, text):
         """Replace all text in text frame with single run containing *text*"""
@@ -166,6 +274,99 @@ class TextFrame(Subshape):
         return self._txBody.bodyPr
 
 
+def _new_p(paragraph):
+    """
+    Return a new ``<a:p>`` element for *paragraph*, an item in the sequence
+    passed to :meth:`TextFrame.set_paragraphs`.
+    """
+    if isinstance(paragraph, basestring):
+        paragraph = (paragraph,)
+    text = paragraph[0]
+    level = paragraph[1] if len(paragraph) > 1 else 0
+    font = paragraph[2] if len(paragraph) > 2 else {}
+    if not isinstance(level, (int, long)) or level < 0 or level > 8:
+        msg = "paragraph level must be integer between 0 and 8 inclusive"
+        raise ValueError(msg)
+    if isinstance(text, basestring):
+        text = (text,)
+    runs = []
+    for run in text:
+        if isinstance(run, basestring):
+            run_text, run_font = run, font
+        else:
+            run_text, run_font = run
+            run_font = dict(font, **run_font)
+        runs.append((to_unicode(run_text), _rPr_values(run_font)))
+    return CT_TextParagraph.new_p(runs, level)
+
+
+def _cell_extents(tc):
+    """
+    Return a ``(width, height)`` pair, the extents in EMU of the table cell
+    ``<a:tc>`` element *tc*, spanning the columns and rows it's merged
+    across.
+    """
+    tr = tc.getparent()
+    tbl = tr.getparent()
+    col_idx = len(list(tc.itersiblings(qn('a:tc'), preceding=True)))
+    col_span = int(tc.get('gridSpan', 1))
+    gridCols = tbl.find(qn('a:tblGrid')).findall(qn('a:gridCol'))
+    width = sum(
+        int(gridCol.get('w'))
+        for gridCol in gridCols[col_idx:col_idx+col_span]
+    )
+    row_idx = len(list(tr.itersiblings(qn('a:tr'), preceding=True)))
+    row_span = int(tc.get('rowSpan', 1))
+    trs = tbl.findall(qn('a:tr'))[row_idx:row_idx+row_span]
+    height = sum(int(tr_.get('h')) for tr_ in trs)
+    return width, height
+
+
+def _inset(value, default):
+    """
+    Return *value*, a text frame margin, or *default*, its value when not
+    set, if it is |None|.
+    """
+    return default if value is None else value
+
+
+def _set_font_size(p, size):
+    """
+    Give each run, field and line break in the ``<a:p>`` element *p* font
+    size *size*. Its ``<a:endParaRPr>`` gets it too, added if *p* is empty,
+    as it sets the height of an empty paragraph.
+    """
+    rPr_tag = qn('a:rPr')
+    is_empty = True
+    for elm in p.iterchildren(qn('a:r'), qn('a:br'), qn('a:fld')):
+        is_empty = False
+        rPr = elm.find(rPr_tag)
+        if rPr is None:
+            rPr = Element('a:rPr')
+            elm.insert(0, rPr)
+        rPr.sz = size
+    endParaRPr = p.find(qn('a:endParaRPr'))
+    if endParaRPr is None and is_empty:
+        endParaRPr = Element('a:endParaRPr')
+        p.append(endParaRPr)
+    if endParaRPr is not None:
+        endParaRPr.sz = size
+
+
+def _rPr_values(font):
+    """
+    Return a copy of the *font* dict of |_Font| property values with the
+    size as an |Emu| instance, raising |ValueError| on an unknown key.
+    """
+    for key in font:
+        if key not in ('bold', 'italic', 'size', 'name'):
+            raise ValueError("unsupported font property '%s'" % (key,))
+    font = dict(font)
+    if font.get('size') is not None:
+        font['size'] = Emu(font['size'])
+    return font
+
+
 class _Font(object):
     """
     Character properties object, providing font size, font name, bold,
@@ -345,6 +546,17 @@ class _Paragraph(Subshape):
         """
         self._p.remove_child_r_elms()
 
+    @property
+    def effective_font(self):
+        """
+        |EffectiveFont| instance holding the bold, italic, size and name
+        values a run in this paragraph having no character properties of
+        its own is rendered with, after those inherited from the paragraph,
+        shape, slide layout, slide master and presentation are resolved.
+        """
+        part = self.part
+        return part.package.text_styles.effective_font(part, self._p)
+
     @property
     def font(self):
         """
@@ -354,7 +566,7 @@ class _Paragraph(Subshape):
         contained in and they may be overridden by character properties set at
         the run level.
         """
-        return _Font(self._defRPr)
+        return cached_proxy(_Font, self._defRPr)
 
     @property
     def level(self):
@@ -369,7 +581,7 @@ class _Paragraph(Subshape):
 
     @level.setter
     def level(self, level):
-        if not isinstance(level, int) or level < 0 or level > 8:
+        if not isinstance(level, (int, long)) or level < 0 or level > 8:
             msg = "paragraph level must be integer between 0 and 8 inclusive"
             raise ValueError(msg)
         self._pPr.set('lvl', str(level))
@@ -380,12 +592,10 @@ class _Paragraph(Subshape):
         Immutable sequence of |_Run| instances corresponding to the runs in
         this paragraph.
         """
-        xpath = './a:r'
-        r_elms = self._p.xpath(xpath, namespaces=_nsmap)
-        runs = []
-        for r in r_elms:
-            runs.append(_Run(r, self))
-        return tuple(runs)
+        return tuple([
+            cached_proxy(_Run, r, self)
+            for r in self._p.iterchildren(qn('a:r'))
+        ])
 
     @property
     def _defRPr(self):
@@ -428,6 +638,20 @@ class _Run(Subshape):
         super(_Run, self).__init__(parent)
         self._r = r
 
+    @property
+    def effective_font(self):
+        """
+        |EffectiveFont| instance holding the bold, italic, size and name
+        values the text of this run is rendered with. Unlike those of
+        :attr:`font`, these are never |None| for an inherited value; each is
+        resolved from the paragraph, shape, slide layout, slide master and
+        presentation as PowerPoint does.
+        """
+        part = self.part
+        return part.package.text_styles.effective_font(
+            part, self._r.getparent(), self._r.find(qn('a:rPr'))
+        )
+
     @property
     def font(self):
         """
@@ -438,7 +662,7 @@ class _Run(Subshape):
         the run level are contained in the font object.
         """
         rPr = self._r.get_or_add_rPr()
-        return _Font(rPr)
+        return cached_proxy(_Font, rPr)
 
     @lazyproperty
     def hyperlink(self):
@@ -466,4 +690,4 @@ class _Run(Subshape):
     @text.setter
     def text(self, str):
         """Set the text of this run to *str*."""
-        self._r.t._setText(to_unicode(str))
+        self._r.t.text = to_unicode(str)
@@ -0,0 +1,397 @@
+# encoding: utf-8
+
+"""
+Measurement of text and computation of the font size that fits it in a shape.
+
+Text is measured with |FontMetrics|, the advance width of each character of
+a typeface. Metrics for Arial (and Helvetica, which shares its widths) are
+built in, and are used for any typeface not registered with
+:func:`register_font`, which loads them from a TrueType or OpenType font
+file. Arial is wider than most typefaces, Calibri for one, so text measured
+with its metrics in their place is estimated on the generous side.
+
+Line breaking is greedy, at whitespace, as PowerPoint does for Latin text. A
+word too long for a line is broken wherever it reaches the edge. Because
+every width scales with font size, each word is measured once in ems, after
+which trying a font size costs only a pass over the word widths; a binary
+search then finds the largest size that fits in a few such passes.
+Paragraph indents and spacing are not taken into account.
+"""
+
+from __future__ import absolute_import, division
+
+import re
+import struct
+
+from bisect import bisect_left
+
+from .util import Emu, Pt
+
+
+class FontMetrics(object):
+    """
+    Character widths and line height of a typeface. *advance* is a function
+    returning the advance width of a character in font units,
+    *units_per_em* of which make up the font size. *line_height* is the
+    distance between the baselines of single-spaced lines, in ems. Use
+    :func:`font_metrics` to get the metrics of a typeface rather than
+    constructing them.
+    """
+    def __init__(self, advance, units_per_em, line_height):
+        super(FontMetrics, self).__init__()
+        self._advance = advance
+        self._units_per_em = units_per_em
+        self.line_height = line_height
+        self._widths = {}
+
+    @classmethod
+    def from_file(cls, font_file):
+        """
+        Return a |FontMetrics| instance loaded from *font_file*, a path to a
+        TrueType or OpenType font file or a file-like object containing
+        one. The characters it maps are those of its Unicode BMP character
+        map. Raises |ValueError| if it is not such a font file.
+        """
+        if isinstance(font_file, basestring):
+            with open(font_file, 'rb') as f:
+                blob = f.read()
+        else:
+            blob = font_file.read()
+        return _TrueTypeReader(blob).font_metrics()
+
+    def width(self, text):
+        """
+        Return the width of *text* when set in this typeface, in ems, that
+        is, as a multiple of the font size. The width of each distinct
+        *text* is computed only once.
+        """
+        try:
+            return self._widths[text]
+        except KeyError:
+            pass
+        advance = self._advance
+        width = sum([advance(char) for char in text]) / self._units_per_em
+        if len(self._widths) >= _WIDTH_CACHE_SIZE:
+            self._widths.clear()
+        self._widths[text] = width
+        return width
+
+
+def fit_font_size(paragraphs, width, height, max_size, wrap=True):
+    """
+    Return the largest whole-point font size, not larger than *max_size*,
+    at which text with all its runs set in that size fits within *width*
+    and *height*, or ``Pt(1)`` if it doesn't fit even at that size.
+    *paragraphs* is a sequence having an item for each paragraph, a
+    sequence of ``(text, font_metrics)`` pairs for its runs, where a
+    ``u'\\n'`` text is a line break. *wrap* is |False| if lines are not
+    wrapped to *width*.
+    """
+    measured = [_MeasuredParagraph(pieces) for pieces in paragraphs]
+    lo, hi = 1, int(Emu(max_size).pt)
+    best = 1
+    while lo <= hi:
+        points = (lo + hi) // 2
+        if _fits(measured, Pt(points), width, height, wrap):
+            best, lo = points, points + 1
+        else:
+            hi = points - 1
+    return Pt(best)
+
+
+def font_metrics(name, bold=False, italic=False):
+    """
+    Return the |FontMetrics| of typeface *name* in the style *bold* and
+    *italic* specify. The metrics registered for the style nearest it are
+    used when none are registered for the style, falling back to the
+    built-in Arial metrics when none are registered for *name*.
+    """
+    key = (name or '').lower()
+    for style in ((bold, italic), (bold, False), (False, italic),
+                  (False, False)):
+        metrics = _registered.get((key,) + style)
+        if metrics is not None:
+            return metrics
+    return _registered[('arial', bold, False)]
+
+
+def register_font(name, font_file, bold=False, italic=False):
+    """
+    Load the metrics of the font in *font_file*, a path or file-like
+    object, and use them for text in typeface *name* in the style *bold*
+    and *italic* specify.
+    """
+    metrics = FontMetrics.from_file(font_file)
+    _registered[(name.lower(), bold, italic)] = metrics
+
+
+def text_height(paragraphs, width, size, wrap=True):
+    """
+    Return the height of the lines of *paragraphs* set in font size *size*
+    and wrapped to *width*, as an |Emu| length. *paragraphs* and *wrap*
+    are as for :func:`fit_font_size`.
+    """
+    measured = [_MeasuredParagraph(pieces) for pieces in paragraphs]
+    max_ems = width / size if wrap else None
+    return Emu(int(sum([
+        paragraph.line_count(max_ems) * paragraph.line_height * size
+        for paragraph in measured
+    ])))
+
+
+class _MeasuredParagraph(object):
+    """
+    The words of a paragraph, measured in ems, grouped into the lines its
+    line breaks delimit.
+    """
+    __slots__ = ('lines', 'line_height')
+
+    def __init__(self, pieces):
+        lines = [[]]
+        line_height = 0.0
+        word = space = 0.0
+        in_word = False
+        for text, metrics in pieces:
+            line_height = max(line_height, metrics.line_height)
+            for token in _token_re.findall(text):
+                if token == u'\n':
+                    if in_word:
+                        lines[-1].append((word, space))
+                    lines.append([])
+                    word = space = 0.0
+                    in_word = False
+                elif token[0].isspace():
+                    space += metrics.width(token)
+                else:
+                    if space:
+                        if in_word:
+                            lines[-1].append((word, space))
+                        word = space = 0.0
+                    word += metrics.width(token)
+                    in_word = True
+        if in_word:
+            lines[-1].append((word, space))
+        self.lines = lines
+        self.line_height = line_height or _default_line_height
+
+    def line_count(self, max_ems):
+        """
+        Return the number of lines this paragraph takes when wrapped to a
+        width of *max_ems* ems, or without wrapping if *max_ems* is |None|.
+        """
+        if max_ems is None:
+            return len(self.lines)
+        count = 0
+        for words in self.lines:
+            count += 1
+            x = 0.0
+            for word, space in words:
+                if x and x + word > max_ems:
+                    count += 1
+                    x = 0.0
+                if word > max_ems:
+                    # a word wider than a line is broken across lines
+                    extra_lines = int(word // max_ems)
+                    count += extra_lines
+                    x = word - extra_lines * max_ems
+                else:
+                    x += word
+                x += space
+        return count
+
+    def max_width(self):
+        """
+        The width in ems of the widest line of this paragraph when it is not
+        wrapped, excluding trailing whitespace.
+        """
+        widths = [0.0]
+        for words in self.lines:
+            if words:
+                line_width = sum([word + space for word, space in words])
+                widths.append(line_width - words[-1][1])
+        return max(widths)
+
+
+def _fits(measured, size, width, height, wrap):
+    """
+    True if the paragraphs *measured* fit in *width* and *height* when set
+    in font size *size*.
+    """
+    max_ems = width / size
+    if not wrap:
+        for paragraph in measured:
+            if paragraph.max_width() > max_ems:
+                return False
+        max_ems = None
+    max_lines = height / size
+    lines = 0.0
+    for paragraph in measured:
+        lines += paragraph.line_count(max_ems) * paragraph.line_height
+        if lines > max_lines:
+            return False
+    return True
+
+
+class _TrueTypeReader(object):
+    """
+    Reads the tables of a TrueType or OpenType font file needed for its
+    |FontMetrics|: ``head``, ``hhea``, ``hmtx`` and ``cmap``.
+    """
+    def __init__(self, blob):
+        super(_TrueTypeReader, self).__init__()
+        self._blob = blob
+        self._tables = self._read_table_directory()
+
+    def font_metrics(self):
+        units_per_em = self._unpack('head', 18, '>H')[0]
+        ascender, descender, line_gap = self._unpack('hhea', 4, '>hhh')
+        hmetric_count = self._unpack('hhea', 34, '>H')[0]
+        hmtx_offset = self._table_offset('hmtx')
+        advances = struct.unpack_from(
+            '>' + 'Hxx' * hmetric_count, self._blob, hmtx_offset
+        )
+        glyph_for = self._glyph_lookup()
+
+        def advance(char):
+            glyph = glyph_for(ord(char))
+            if glyph >= hmetric_count:
+                glyph = hmetric_count - 1
+            return advances[glyph]
+
+        line_height = (ascender - descender + line_gap) / units_per_em
+        return FontMetrics(advance, units_per_em, line_height)
+
+    def _glyph_lookup(self):
+        """
+        Return a function returning the glyph index of a code point, from
+        the format 4 Unicode subtable of the ``cmap`` table.
+        """
+        blob = self._blob
+        cmap_offset = self._table_offset('cmap')
+        table_count = struct.unpack_from('>H', blob, cmap_offset + 2)[0]
+        subtable_offset = None
+        for idx in range(table_count):
+            platform_id, encoding_id, offset = struct.unpack_from(
+                '>HHL', blob, cmap_offset + 4 + idx * 8
+            )
+            if (platform_id, encoding_id) in ((3, 1), (0, 3), (0, 4)):
+                fmt = struct.unpack_from('>H', blob, cmap_offset + offset)[0]
+                if fmt == 4:
+                    subtable_offset = cmap_offset + offset
+                    break
+        if subtable_offset is None:
+            raise ValueError('font has no format 4 Unicode character map')
+
+        seg_count = struct.unpack_from('>H', blob, subtable_offset + 6)[0]
+        seg_count //= 2
+        array_fmt = '>%dH' % seg_count
+        end_codes_offset = subtable_offset + 14
+        start_codes_offset = end_codes_offset + 2 * seg_count + 2
+        deltas_offset = start_codes_offset + 2 * seg_count
+        range_offsets_offset = deltas_offset + 2 * seg_count
+        end_codes = struct.unpack_from(array_fmt, blob, end_codes_offset)
+        start_codes = struct.unpack_from(array_fmt, blob, start_codes_offset)
+        deltas = struct.unpack_from(array_fmt, blob, deltas_offset)
+        range_offsets = struct.unpack_from(
+            array_fmt, blob, range_offsets_offset
+        )
+
+        def glyph_for(code_point):
+            idx = bisect_left(end_codes, code_point)
+            if idx == seg_count or start_codes[idx] > code_point:
+                return 0
+            if range_offsets[idx] == 0:
+                return (code_point + deltas[idx]) & 0xFFFF
+            glyph_offset = (
+                range_offsets_offset + 2 * idx + range_offsets[idx] +
+                2 * (code_point - start_codes[idx])
+            )
+            glyph = struct.unpack_from('>H', blob, glyph_offset)[0]
+            if glyph == 0:
+                return 0
+            return (glyph + deltas[idx]) & 0xFFFF
+
+        return glyph_for
+
+    def _read_table_directory(self):
+        blob = self._blob
+        if len(blob) < 12 or blob[:4] not in _sfnt_versions:
+            raise ValueError('not a TrueType or OpenType font file')
+        table_count = struct.unpack_from('>H', blob, 4)[0]
+        tables = {}
+        for idx in range(table_count):
+            tag, checksum, offset, length = struct.unpack_from(
+                '>4sLLL', blob, 12 + idx * 16
+            )
+            tables[tag] = offset
+        return tables
+
+    def _table_offset(self, tag):
+        try:
+            return self._tables[tag.encode('ascii')]
+        except KeyError:
+            raise ValueError("font has no '%s' table" % tag)
+
+    def _unpack(self, tag, offset, fmt):
+        offset += self._table_offset(tag)
+        return struct.unpack_from(fmt, self._blob, offset)
+
+
+def _builtin_metrics(widths, wide_width):
+    """
+    Return |FontMetrics| for the built-in *widths*, a string of the widths
+    of the printable ASCII characters in thousandths of an em, separated by
+    whitespace. *wide_width* is the width used for characters in the East
+    Asian ranges, the average Latin width for any other character.
+    """
+    widths = [int(width) for width in widths.split()]
+    ascii_widths = dict(zip(map(unichr, range(32, 127)), widths))
+    ascii_widths[u'\t'] = ascii_widths[u' ']
+    average_width = sum(widths) // len(widths)
+
+    def advance(char):
+        try:
+            return ascii_widths[char]
+        except KeyError:
+            return wide_width if char >= u'\u2e80' else average_width
+
+    return FontMetrics(advance, 1000, _default_line_height)
+
+
+#: Widths of the printable ASCII characters of Arial and Arial Bold, the
+#: same as those of Helvetica and Helvetica Bold in the Adobe Font Metrics
+#: files for the standard PDF fonts. The oblique styles share them.
+_ARIAL_WIDTHS = """
+    278 278 355 556 556 889 667 191 333 333 389 584 278 333 278 278
+    556 556 556 556 556 556 556 556 556 556 278 278 584 584 584 556
+    1015 667 667 722 722 667 611 778 722 278 500 667 556 833 722 778
+    667 778 722 667 611 722 667 944 667 667 611 278 278 278 469 556
+    333 556 556 500 556 556 278 556 556 222 222 500 222 833 556 556
+    556 556 333 500 278 556 500 722 500 500 500 334 260 334 584
+"""
+_ARIAL_BOLD_WIDTHS = """
+    278 333 474 556 556 889 722 238 333 333 389 584 278 333 278 278
+    556 556 556 556 556 556 556 556 556 556 333 333 584 584 584 611
+    975 722 722 722 722 667 611 778 722 278 556 722 611 833 722 778
+    667 778 722 667 611 722 667 944 667 667 611 333 278 333 584 556
+    333 556 611 556 611 556 333 611 611 278 278 556 278 889 611 611
+    611 611 389 556 333 611 556 778 556 556 500 389 280 389 584
+"""
+
+#: Arial's ascent, descent and line gap sum to 1.15 ems
+_default_line_height = 1.15
+
+_sfnt_versions = (b'\x00\x01\x00\x00', b'OTTO', b'true')
+_token_re = re.compile(r'\n|[^\S\n]+|[^\s]+', re.UNICODE)
+_WIDTH_CACHE_SIZE = 65536
+
+_arial = _builtin_metrics(_ARIAL_WIDTHS, 1000)
+_arial_bold = _builtin_metrics(_ARIAL_BOLD_WIDTHS, 1000)
+
+#: Font metrics by (lowercase typeface name, bold, italic)
+_registered = {
+    ('arial', False, False):     _arial,
+    ('arial', True, False):      _arial_bold,
+    ('helvetica', False, False): _arial,
+    ('helvetica', True, False):  _arial_bold,
+}
@@ -0,0 +1,308 @@
+# encoding: utf-8
+
+"""
+Resolution of the effective character properties of text, the values
+PowerPoint renders after inheritance is taken into account.
+
+A run's properties come from the first of these that sets them: the run's
+``<a:rPr>``, its paragraph's ``<a:defRPr>``, the list style of the shape,
+the list styles of the layout and master placeholders the shape inherits
+from, the text styles of the slide master, and last the presentation's
+default text style. The run, paragraph and shape are read on each call, so
+changes made through |_Font| are reflected at once. The inherited levels
+are merged just once for each part, placeholder and paragraph level, and
+the result cached, so resolving every run of a deck doesn't search layouts
+and masters again for each one.
+"""
+
+from __future__ import absolute_import
+
+from collections import namedtuple
+
+from lxml import etree
+
+from .opc.constants import RELATIONSHIP_TYPE as RT
+from .oxml.ns import qn
+from .oxml.shapes.shared import ST_PlaceholderType
+from .parts.slide import Slide
+from .parts.slidelayout import SlideLayout
+from .parts.slidemaster import SlideMaster
+from .util import Centipoints
+
+
+class EffectiveFont(namedtuple('EffectiveFont', 'bold italic size name')):
+    """
+    The character properties text is rendered with. *bold* and *italic*
+    are booleans, *size* is a length such as ``Centipoints(1800)`` and
+    *name* is a typeface name, with theme fonts like ``'+mn-lt'`` resolved
+    to the name of the font the theme specifies. *name* is |None| when no
+    typeface can be determined.
+    """
+    __slots__ = ()
+
+
+class TextStyles(object):
+    """
+    Resolves the effective font of runs and paragraphs in the presentation
+    package *package*. Obtain the instance for a package from
+    ``package.text_styles`` rather than constructing one, so its cache is
+    shared.
+    """
+    def __init__(self, package):
+        super(TextStyles, self).__init__()
+        self._package = package
+        self._inherited_cache = {}
+        self._theme_fonts_cache = {}
+
+    def clear(self):
+        """
+        Discard the cached styles. Needed only after changing the XML of a
+        slide layout, slide master or presentation part directly, or after
+        relating a slide to a different layout.
+        """
+        self._inherited_cache.clear()
+        self._theme_fonts_cache.clear()
+
+    def effective_font(self, part, p, rPr=None):
+        """
+        Return the |EffectiveFont| for the text of the ``<a:p>`` element
+        *p* on *part*, a slide, layout or master part. If *rPr* is the
+        ``<a:rPr>`` element of a run in *p*, the result is for that run,
+        otherwise it's for a run in *p* having no properties of its own.
+        """
+        txBody = p.getparent()
+        shape = _shape_of(txBody)
+        pPr = p.find(_pPr_tag)
+        level = 0 if pPr is None else int(pPr.get('lvl', 0))
+        ph = None if shape is None else shape.ph
+        if ph is None:
+            ph_type = ph_idx = None
+        else:
+            ph_type = ph.get('type', ST_PlaceholderType.OBJ)
+            ph_idx = int(ph.get('idx', 0))
+
+        props = {}
+        _merge_rPr(props, rPr)
+        if pPr is not None:
+            _merge_rPr(props, pPr.find(_defRPr_tag))
+        _merge_lstStyle(props, txBody.find(_lstStyle_tag), level)
+        for name, value in self._inherited(part, ph_type, ph_idx, level):
+            props.setdefault(name, value)
+
+        name = props.get('name')
+        if name is not None and name.startswith('+'):
+            name = self._theme_font(part, name)
+        return EffectiveFont(
+            props.get('bold', False), props.get('italic', False),
+            props.get('size', _default_size), name
+        )
+
+    def _inherited(self, part, ph_type, ph_idx, level):
+        """
+        Return a sequence of ``(name, value)`` pairs for the properties text
+        at paragraph level *level* in a shape on *part* inherits from
+        outside that shape. *ph_type* and *ph_idx* identify the placeholder
+        the shape is, or are |None| when it's not a placeholder. A theme
+        font is resolved to the typeface it refers to.
+        """
+        key = (part, ph_type, ph_idx, level)
+        try:
+            return self._inherited_cache[key]
+        except KeyError:
+            pass
+        props = {}
+        for lstStyle in self._inherited_lstStyles(part, ph_type, ph_idx):
+            _merge_lstStyle(props, lstStyle, level)
+        prs_elm = self._package.main_document._element
+        _merge_lstStyle(props, prs_elm.find(_defaultTextStyle_tag), level)
+        if props.get('name', '').startswith('+'):
+            props['name'] = self._theme_font(part, props['name'])
+        inherited = tuple(props.items())
+        self._inherited_cache[key] = inherited
+        return inherited
+
+    def _inherited_lstStyles(self, part, ph_type, ph_idx):
+        """
+        Generate the list style elements a placeholder shape on *part*
+        inherits from, most specific first, ending with the slide master's
+        text style for its type. Generates nothing for a shape that's not a
+        placeholder.
+        """
+        if ph_type is None:
+            return
+        master_ph = None
+        if isinstance(part, Slide):
+            slide_layout = part.slide_layout
+            layout_ph = _layout_placeholder(slide_layout, ph_type, ph_idx)
+            if layout_ph is not None:
+                yield _lstStyle_of(layout_ph._element)
+                master_ph = _master_placeholder(layout_ph)
+            slide_master = slide_layout.slide_master
+        elif isinstance(part, SlideLayout):
+            layout_ph = _layout_placeholder(part, ph_type, ph_idx)
+            if layout_ph is not None:
+                master_ph = _master_placeholder(layout_ph)
+            slide_master = part.slide_master
+        elif isinstance(part, SlideMaster):
+            slide_master = part
+        else:
+            return
+        if master_ph is not None:
+            yield _lstStyle_of(master_ph._element)
+        txStyles = slide_master._element.find(_txStyles_tag)
+        if txStyles is not None:
+            yield txStyles.find(_txStyle_tags.get(ph_type, _bodyStyle_tag))
+
+    def _theme_font(self, part, name):
+        """
+        Return the typeface theme font reference *name*, like ``'+mj-lt'``,
+        stands for in the theme of the slide master *part* belongs to, or
+        |None| if it can't be determined.
+        """
+        slide_master = _slide_master_of(part)
+        if slide_master is None:
+            return None
+        try:
+            theme_fonts = self._theme_fonts_cache[slide_master]
+        except KeyError:
+            theme_fonts = _theme_fonts(slide_master)
+            self._theme_fonts_cache[slide_master] = theme_fonts
+        return theme_fonts.get(name)
+
+
+_default_size = Centipoints(1800)
+
+_defaultTextStyle_tag = qn('p:defaultTextStyle')
+_defRPr_tag = qn('a:defRPr')
+_latin_tag = qn('a:latin')
+_lstStyle_tag = qn('a:lstStyle')
+_pPr_tag = qn('a:pPr')
+_txBody_tag = qn('p:txBody')
+_txStyles_tag = qn('p:txStyles')
+_bodyStyle_tag = qn('p:bodyStyle')
+_lvlpPr_tags = tuple(qn('a:lvl%dpPr' % n) for n in range(1, 10))
+_shape_tags = frozenset((qn('p:sp'), qn('p:graphicFrame')))
+
+#: The text style of the slide master each placeholder type takes its
+#: properties from. Types not listed use the body style.
+_txStyle_tags = {
+    ST_PlaceholderType.CTR_TITLE: qn('p:titleStyle'),
+    ST_PlaceholderType.TITLE:     qn('p:titleStyle'),
+    ST_PlaceholderType.DT:        qn('p:otherStyle'),
+    ST_PlaceholderType.FTR:       qn('p:otherStyle'),
+    ST_PlaceholderType.SLD_NUM:   qn('p:otherStyle'),
+}
+
+
+def _layout_placeholder(slide_layout, ph_type, ph_idx):
+    """
+    Return the placeholder on *slide_layout* having *ph_idx*, or failing
+    that the first one of type *ph_type*, or |None| if there is neither.
+    """
+    placeholders = slide_layout.placeholders
+    layout_ph = placeholders.get(ph_idx)
+    if layout_ph is not None:
+        return layout_ph
+    for layout_ph in placeholders:
+        if layout_ph.ph_type == ph_type:
+            return layout_ph
+    return None
+
+
+def _lstStyle_of(shape_elm):
+    """
+    Return the ``<a:lstStyle>`` element of the text of *shape_elm*, or
+    |None| if it has none.
+    """
+    txBody = shape_elm.find(_txBody_tag)
+    if txBody is None:
+        return None
+    return txBody.find(_lstStyle_tag)
+
+
+def _master_placeholder(layout_ph):
+    """
+    Return the master placeholder *layout_ph* inherits from, or |None| if
+    there is none.
+    """
+    try:
+        return layout_ph._master_placeholder
+    except KeyError:
+        # ph type a layout placeholder doesn't inherit by, like 'hdr'
+        return None
+
+
+def _merge_lstStyle(props, lstStyle, level):
+    """
+    Add to dict *props* the properties the ``<a:defRPr>`` for paragraph
+    level *level* in list style element *lstStyle* sets that *props* has
+    no value for yet. *lstStyle* may be |None|.
+    """
+    if lstStyle is None:
+        return
+    lvlpPr = lstStyle.find(_lvlpPr_tags[level])
+    if lvlpPr is not None:
+        _merge_rPr(props, lvlpPr.find(_defRPr_tag))
+
+
+def _merge_rPr(props, rPr):
+    """
+    Add to dict *props* the properties character properties element *rPr*
+    sets that *props* has no value for yet. *rPr* may be |None|.
+    """
+    if rPr is None:
+        return
+    if 'bold' not in props and rPr.b is not None:
+        props['bold'] = rPr.b
+    if 'italic' not in props and rPr.i is not None:
+        props['italic'] = rPr.i
+    if 'size' not in props and rPr.sz is not None:
+        props['size'] = rPr.sz
+    if 'name' not in props:
+        latin = rPr.find(_latin_tag)
+        if latin is not None and latin.get('typeface'):
+            props['name'] = latin.get('typeface')
+
+
+def _shape_of(txBody):
+    """
+    Return the ``<p:sp>`` or ``<p:graphicFrame>`` element *txBody* belongs
+    to, or |None| if it's in neither.
+    """
+    for ancestor in txBody.iterancestors():
+        if ancestor.tag in _shape_tags:
+            return ancestor
+    return None
+
+
+def _slide_master_of(part):
+    """
+    Return the slide master *part* is based on, or |None| if it is not a
+    slide, layout or master.
+    """
+    if isinstance(part, Slide):
+        return part.slide_layout.slide_master
+    if isinstance(part, SlideLayout):
+        return part.slide_master
+    if isinstance(part, SlideMaster):
+        return part
+    return None
+
+
+def _theme_fonts(slide_master):
+    """
+    Return a dict mapping the theme font references ``'+mj-lt'`` and
+    ``'+mn-lt'`` to the latin typefaces of the major and minor fonts of the
+    theme of *slide_master*. The dict is empty if it has no theme.
+    """
+    try:
+        theme = slide_master.part_related_by(RT.THEME)
+    except KeyError:
+        return {}
+    theme_elm = etree.fromstring(theme.blob)
+    theme_fonts = {}
+    for ref, tag in (('+mj-lt', 'a:majorFont'), ('+mn-lt', 'a:minorFont')):
+        latin = theme_elm.find('.//%s/%s' % (qn(tag), _latin_tag))
+        if latin is not None and latin.get('typeface'):
+            theme_fonts[ref] = latin.get('typeface')
+    return theme_fonts
@@ -0,0 +1,143 @@
+# encoding: utf-8
+
+"""
+Streaming rewrite of the text in a presentation, for example to redact it.
+
+The slides and notes slides of a package are each parsed with
+``lxml.etree.iterparse()`` as they are decompressed, the text of each
+``<a:t>`` element passing through a callback as it is parsed, and written
+back out before the next part is read. Parts are plain lxml trees, never
+objectified, and only one is held in memory at a time, so memory use
+depends on the size of the largest slide rather than of the presentation.
+The other members of the package are copied without being parsed.
+"""
+
+from __future__ import absolute_import
+
+import multiprocessing
+
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED
+
+from lxml import etree
+
+from .opc.constants import CONTENT_TYPE as CT
+from .opc.packuri import CONTENT_TYPES_URI, PackURI
+from .opc.phys_pkg import copy_zip_member, replace_file
+from .opc.pkgreader import _ContentTypeMap
+from .oxml.ns import qn
+from .oxml.shared import serialize_part_xml
+
+
+def rewrite_text(src, func, dst=None):
+    """
+    Write a copy of the presentation *src*, a path to a ``.pptx`` file or a
+    file-like object, to *dst* with the text of each run and field on its
+    slides and notes slides replaced by the string ``func(text)`` returns.
+    *func* is not called for empty text. *dst* may be a path or file-like
+    object. When it is |None|, *src* must be a path, and the file there is
+    replaced by the copy once the copy is complete. Formatting is unchanged.
+    """
+    if dst is None:
+        replace_file(src, lambda tmp_path: rewrite_text(src, func, tmp_path))
+        return
+    zin = ZipFile(src, 'r')
+    try:
+        content_types = _ContentTypeMap.from_xml(
+            zin.read(CONTENT_TYPES_URI.membername)
+        )
+        zout = ZipFile(dst, 'w', compression=ZIP_DEFLATED)
+        try:
+            for zinfo in zin.infolist():
+                if not _has_text(zinfo.filename, content_types):
+                    copy_zip_member(zin, zout, zinfo)
+                    continue
+                stream = zin.open(zinfo)
+                try:
+                    blob = _rewrite_xml(stream, func)
+                finally:
+                    stream.close()
+                zout.writestr(_new_zinfo(zinfo), blob)
+        finally:
+            zout.close()
+    finally:
+        zin.close()
+
+
+def rewrite_text_files(jobs, func, processes=None):
+    """
+    Rewrite the presentations in *jobs*, a sequence of ``(src, dst)`` path
+    pairs, as :func:`rewrite_text` does, spreading the files over
+    *processes* worker processes, by default one per CPU. *dst* may be
+    |None| to rewrite *src* in place. *func* must be picklable, a function
+    defined at the top level of a module for example. Generate a ``(src,
+    error)`` 2-tuple for each job, in order, where *error* is |None|, or a
+    message if the presentation could not be rewritten.
+    """
+    jobs = [(src, dst, func) for src, dst in jobs]
+    if processes == 1:
+        for job in jobs:
+            yield _rewrite_job(job)
+        return
+    pool = multiprocessing.Pool(processes)
+    try:
+        for result in pool.imap(_rewrite_job, jobs, chunksize=4):
+            yield result
+    finally:
+        pool.close()
+        pool.join()
+
+
+_text_content_types = frozenset((CT.PML_SLIDE, CT.PML_NOTES_SLIDE))
+_t = qn('a:t')
+
+
+def _has_text(membername, content_types):
+    """
+    Return |True| if the package member *membername* is a part whose text
+    is rewritten.
+    """
+    if membername.endswith('/'):
+        return False
+    try:
+        content_type = content_types[PackURI('/' + membername)]
+    except KeyError:
+        return False
+    return content_type in _text_content_types
+
+
+def _new_zinfo(zinfo):
+    """
+    Return a |ZipInfo| for writing a new version of the member *zinfo*
+    describes, compressed and having the same name and timestamp.
+    """
+    new_zinfo = ZipInfo(zinfo.filename, zinfo.date_time)
+    new_zinfo.compress_type = ZIP_DEFLATED
+    new_zinfo.external_attr = zinfo.external_attr
+    return new_zinfo
+
+
+def _rewrite_job(job):
+    """
+    Return a ``(src, error)`` 2-tuple for rewriting presentation *src* as
+    given by *job*, a ``(src, dst, func)`` 3-tuple, where *error* is |None|,
+    or a message if it failed. Runs in a worker process.
+    """
+    src, dst, func = job
+    try:
+        rewrite_text(src, func, dst)
+    except Exception as e:
+        return src, '%s: %s' % (type(e).__name__, e)
+    return src, None
+
+
+def _rewrite_xml(stream, func):
+    """
+    Return the XML read from *stream*, serialized as UTF-8 bytes, with the
+    text of each ``<a:t>`` element replaced by ``func(text)``. The text is
+    replaced as each ``<a:t>`` element is parsed.
+    """
+    events = etree.iterparse(stream, tag=_t)
+    for event, t in events:
+        if t.text:
+            t.text = func(t.text)
+    return serialize_part_xml(events.root)
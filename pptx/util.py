@@ -6,6 +6,8 @@ and Open XML.
 """
 
 import platform
+import threading
+import weakref
 
 
 class BaseLength(int):
@@ -183,11 +185,91 @@ class Collection(object):
         return self._values_.index(item)
 
 
+def cached_proxy(proxy_cls, element, *args):
+    """
+    Return the live *proxy_cls* instance for *element* and *args*,
+    constructing one as ``proxy_cls(element, *args)`` only when there is
+    none. Navigating to the same element again from the same parent, like
+    ``textframe.paragraphs`` in a loop, returns the same proxy as long as a
+    reference to it is held somewhere. *proxy_cls* instances must be
+    weak-referenceable and hold a reference to *element* and each of
+    *args*. Safe to call from several threads.
+    """
+    # keyed on identity; an objectify leaf like <a:gridCol/> compares equal
+    # to any other by value. The proxy keeps *element* and *args* alive
+    # while the entry exists, so their ids can't be reused by other objects.
+    key = (proxy_cls, id(element)) + tuple([id(arg) for arg in args])
+    return _cached_proxy(key, proxy_cls, element, args)
+
+
+def cached_element_proxy(proxy_cls, element, *args):
+    """
+    Return the live *proxy_cls* instance for *element*, like
+    :func:`cached_proxy` but keyed on *element* alone. For a proxy whose
+    *args* are built afresh on each access, like the shape proxy a text
+    frame belongs to, so an equivalent parent still finds the proxy. The
+    proxy returned keeps the *args* it was constructed with.
+    """
+    key = (proxy_cls, id(element))
+    return _cached_proxy(key, proxy_cls, element, args)
+
+
+def _cached_proxy(key, proxy_cls, element, args):
+    """
+    Return the live proxy stored under *key*, or a new
+    ``proxy_cls(element, *args)`` stored under it when there is none.
+    """
+    proxy_ref = _proxy_refs.get(key)
+    if proxy_ref is not None:
+        proxy = proxy_ref()
+        if proxy is not None:
+            return proxy
+    proxy = proxy_cls(element, *args)
+    if len(_proxy_refs) >= _purge_size:
+        _purge_proxy_refs()
+    _proxy_refs[key] = weakref.ref(proxy)
+    return proxy
+
+
+def _purge_proxy_refs():
+    """
+    Drop the `_proxy_refs` entries whose proxy has been garbage collected,
+    and raise the size at which this is done again if most are still live.
+    Only one thread purges at a time; another arriving meanwhile skips it.
+    """
+    global _purge_size
+    if not _purge_lock.acquire(False):
+        return
+    try:
+        for key, proxy_ref in list(_proxy_refs.items()):
+            if proxy_ref() is None:
+                _proxy_refs.pop(key, None)
+        _purge_size = max(_PURGE_SIZE, 2 * len(_proxy_refs))
+    finally:
+        _purge_lock.release()
+
+
+#: Weak references to proxies by (proxy class, element id, arg ids...).
+#: Entries for proxies that have gone away are dropped in bulk rather than
+#: by a weakref callback, which keeps constructing a proxy nearly as cheap
+#: as before. A dead entry is harmless: a live proxy keeps its element and
+#: args alive, so a live entry's ids can't have been reused. Lookups and
+#: inserts are single dict operations, atomic under the GIL; two threads
+#: building a proxy for the same element at once each get a usable proxy.
+_proxy_refs = {}
+_purge_lock = threading.Lock()
+_PURGE_SIZE = 4096
+_purge_size = _PURGE_SIZE
+
+
 def lazyproperty(f):
     """
     @lazyprop decorator. Decorated method will be called only on first access
     to calculate a cached property value. After that, the cached value is
-    returned.
+    returned. While any object passed to :func:`lock_lazyproperties` is
+    alive, the method is called under a lock of the instance, so threads
+    racing on first access call it once between them. Otherwise no lock is
+    taken.
     """
     cache_attr_name = '_%s' % f.__name__  # like '_foobar' for prop 'foobar'
     docstring = f.__doc__
@@ -196,6 +278,16 @@ def lazyproperty(f):
         try:
             return getattr(obj, cache_attr_name)
         except AttributeError:
+            pass
+        if not _lazyproperty_lock_owners:
+            value = f(obj)
+            setattr(obj, cache_attr_name, value)
+            return value
+        with _instance_lock(obj):
+            try:
+                return getattr(obj, cache_attr_name)
+            except AttributeError:
+                pass
             value = f(obj)
             setattr(obj, cache_attr_name, value)
             return value
@@ -203,6 +295,35 @@ def lazyproperty(f):
     return property(get_prop_value, doc=docstring)
 
 
+def lock_lazyproperties(owner, lock=None):
+    """
+    Make |lazyproperty| compute values under a lock for as long as *owner*,
+    normally a package opened in thread-safe mode, is alive. If *lock* is
+    given it's used as the lock of *owner* itself, so lazy properties of
+    *owner* share the lock its other methods take. It must be reentrant.
+    """
+    if lock is not None:
+        owner.__dict__[_INSTANCE_LOCK_ATTR] = lock
+    _lazyproperty_lock_owners[owner] = True
+
+
+def _instance_lock(obj):
+    """
+    Return the reentrant lock |lazyproperty| takes for *obj*, creating it on
+    first use. When two threads create one at once, ``setdefault()`` makes
+    sure they both get the one stored first.
+    """
+    try:
+        return obj.__dict__[_INSTANCE_LOCK_ATTR]
+    except KeyError:
+        return obj.__dict__.setdefault(_INSTANCE_LOCK_ATTR, threading.RLock())
+
+
+#: Objects while alive make |lazyproperty| lock, see lock_lazyproperties()
+_lazyproperty_lock_owners = weakref.WeakKeyDictionary()
+_INSTANCE_LOCK_ATTR = '_lazyproperty_lock'
+
+
 def to_unicode(text):
     """
     Return *text* as a unicode string.
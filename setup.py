@@ -25,7 +25,7 @@ LICENSE = open(license).read()
 PACKAGES = find_packages(exclude=['tests', 'tests.*'])
 PACKAGE_DATA = {'pptx': ['templates/*']}
 
-INSTALL_REQUIRES = ['lxml>=2.3.2', 'Pillow>=2.0']
+INSTALL_REQUIRES = ['lxml>=3.0', 'Pillow>=2.0']
 TEST_SUITE = 'tests'
 TESTS_REQUIRE = ['behave', 'mock', 'PyHamcrest', 'pytest', 'unittest2']
 
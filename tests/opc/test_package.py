@@ -13,10 +13,10 @@ from mock import call, Mock, patch, PropertyMock
 from pptx.opc.oxml import CT_Relationships
 from pptx.opc.packuri import PACKAGE_URI, PackURI
 from pptx.opc.package import (
-    OpcPackage, Part, PartFactory, _Relationship, RelationshipCollection,
-    Unmarshaller
+    OpcPackage, Part, PartFactory, PassthroughPart, _Relationship,
+    RelationshipCollection, Unmarshaller
 )
-from pptx.opc.pkgreader import PackageReader
+from pptx.opc.pkgreader import DeferredBlob, PackageReader
 from pptx.package import Package
 
 from ..oxml.unitdata.text import an_hlinkClick, an_rPr
@@ -35,7 +35,7 @@ class DescribeOpcPackage(object):
         # exercise ---------------------
         pkg = OpcPackage.open(pkg_file)
         # verify -----------------------
-        PackageReader_.from_file.assert_called_once_with(pkg_file)
+        PackageReader_.from_file.assert_called_once_with(pkg_file, None)
         Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg,
                                                         PartFactory_)
         assert isinstance(pkg, OpcPackage)
@@ -111,7 +111,7 @@ class DescribeOpcPackage(object):
         for part in parts_:
             part.before_marshal.assert_called_once_with()
         PackageWriter_.write.assert_called_once_with(
-            pkg_file_, pkg._rels, parts_
+            pkg_file_, pkg._rels, parts_, pkg._content_types_cache
         )
 
     # fixtures ---------------------------------------------
@@ -381,6 +381,27 @@ class DescribePartRelsProxyInterface(object):
         return part, rId, url
 
 
+class DescribePassthroughPart(object):
+
+    def it_reads_its_deferred_blob_once(self):
+        deferred_blob_ = Mock(spec=DeferredBlob, name='deferred_blob_')
+        deferred_blob_.read.return_value = b'blob'
+        part = PassthroughPart.load(
+            PackURI('/foo/bar.bin'), 'foo/bar', deferred_blob_, None
+        )
+        assert part.blob == b'blob'
+        assert part.blob == b'blob'
+        deferred_blob_.read.assert_called_once_with()
+
+    def it_reads_its_blob_before_marshalling(self):
+        deferred_blob_ = Mock(spec=DeferredBlob, name='deferred_blob_')
+        part = PassthroughPart.load(
+            PackURI('/foo/bar.bin'), 'foo/bar', deferred_blob_, None
+        )
+        part.before_marshal()
+        deferred_blob_.read.assert_called_once_with()
+
+
 class DescribePartFactory(object):
 
     def it_constructs_custom_part_type_for_registered_content_types(
@@ -500,6 +521,14 @@ class DescribeRelationshipCollection(object):
         with pytest.raises(KeyError):
             rels['barfoo']
 
+    def it_can_remove_a_relationship(self):
+        rels = RelationshipCollection(None)
+        target = Mock(name='target')
+        rels.add_relationship('reltype', target, 'rId1')
+        del rels['rId1']
+        assert 'rId1' not in rels
+        assert 'rId1' not in rels.related_parts
+
     def it_can_add_a_relationship(self, _Relationship_):
         baseURI, rId, reltype, target, external = (
             'baseURI', 'rId9', 'reltype', 'target', False
@@ -544,6 +573,25 @@ class DescribeRelationshipCollection(object):
             any_order=True
         )
 
+    def it_composes_rels_xml_again_only_when_the_rels_change(
+            self, rels, rels_elm):
+        xml = rels.xml
+        assert rels.xml is xml
+        assert CT_Relationships.new.call_count == 1
+        rels.add_relationship('http://rt-image', Mock(name='part'), 'rId3')
+        rels.xml
+        assert CT_Relationships.new.call_count == 2
+        rels['rId2'].target_part.partname = PackURI('/ppt/media/image2.png')
+        rels.xml
+        assert CT_Relationships.new.call_count == 3
+
+    def it_saves_the_loaded_rels_xml_until_the_rels_change(
+            self, rels, rels_elm):
+        rels.load_xml('<loaded/>')
+        assert rels.xml == '<loaded/>'
+        del rels['rId1']
+        assert rels.xml is rels_elm.xml
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -644,6 +692,22 @@ class DescribeUnmarshaller(object):
         )
         assert parts == parts_dict_
 
+    def it_unmarshals_a_deferred_part_as_a_passthrough_part(
+            self, pkg_reader_, pkg_, part_factory_):
+        deferred_blob_ = Mock(spec=DeferredBlob, name='deferred_blob_')
+        partname = PackURI('/ppt/media/image1.png')
+        pkg_reader_.iter_sparts.return_value = (
+            (partname, 'image/png', deferred_blob_),
+        )
+        parts = Unmarshaller._unmarshal_parts(
+            pkg_reader_, pkg_, part_factory_
+        )
+        part = parts[partname]
+        assert part_factory_.call_count == 0
+        assert isinstance(part, PassthroughPart)
+        assert part.content_type == 'image/png'
+        assert part.package is pkg_
+
     def it_can_unmarshal_relationships(self):
         # test data --------------------
         reltype = 'http://reltype'
@@ -659,6 +723,7 @@ class DescribeUnmarshaller(object):
             ('partname2', Mock(name='srel4', rId='rId4', reltype=reltype,
              target_ref='target_ref_2',   is_external=True)),
         )
+        pkg_reader.iter_rels_xml.return_value = ()
         pkg = Mock(name='pkg')
         parts = {}
         for num in range(1, 3):
@@ -677,6 +742,19 @@ class DescribeUnmarshaller(object):
         ]
         assert pkg.mock_calls == expected_pkg_calls
 
+    def it_keeps_the_rels_xml_read_for_each_source(self):
+        pkg_reader = Mock(name='pkg_reader')
+        pkg_reader.iter_srels.return_value = ()
+        pkg_reader.iter_rels_xml.return_value = (
+            ('/', '<pkg_rels/>'), ('partname1', '<part_rels/>'),
+        )
+        pkg, part = Mock(name='pkg'), Mock(name='part')
+        Unmarshaller._unmarshal_relationships(
+            pkg_reader, pkg, {'partname1': part}
+        )
+        pkg.rels.load_xml.assert_called_once_with('<pkg_rels/>')
+        part.rels.load_xml.assert_called_once_with('<part_rels/>')
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -33,6 +33,22 @@ class DescribePackURI(object):
         pack_uri = PackURI.from_rel_ref(baseURI, relative_ref)
         assert pack_uri == '/ppt/slideLayouts/slideLayout1.xml'
 
+    def it_resolves_each_relative_ref_once(self):
+        pack_uri = PackURI.from_rel_ref('/ppt/slides', '../media/image9.png')
+        assert PackURI.from_rel_ref(
+            '/ppt/slides', '../media/image9.png'
+        ) is pack_uri
+        assert PackURI.from_rel_ref('/ppt', 'media/image9.png') is pack_uri
+
+    def it_computes_each_component_once(self):
+        pack_uri = PackURI('/ppt/slides/slide1.xml')
+        rels_uri = pack_uri.rels_uri
+        assert pack_uri.__dict__ == {
+            'baseURI': '/ppt/slides', 'filename': 'slide1.xml',
+            'rels_uri': rels_uri,
+        }
+        assert pack_uri.rels_uri is rels_uri
+
     def it_should_raise_on_construct_with_bad_pack_uri_str(self):
         with pytest.raises(ValueError):
             PackURI('foobar')
@@ -13,6 +13,7 @@ except ImportError:
 
 import hashlib
 import pytest
+import shutil
 
 from mock import Mock
 from zipfile import ZIP_DEFLATED, ZipFile
@@ -20,7 +21,8 @@ from zipfile import ZIP_DEFLATED, ZipFile
 from pptx.exceptions import PackageNotFoundError
 from pptx.opc.packuri import PACKAGE_URI, PackURI
 from pptx.opc.phys_pkg import (
-    _DirPkgReader, PhysPkgReader, PhysPkgWriter, _ZipPkgReader, _ZipPkgWriter
+    copy_zip_member, _DirPkgReader, PhysPkgReader, PhysPkgWriter,
+    rewrite_zip_package, _ZipPkgReader, _ZipPkgWriter
 )
 
 from ..unitutil import absjoin, class_mock, loose_mock, test_file_dir
@@ -31,6 +33,23 @@ dir_pkg_path = absjoin(test_file_dir, 'expanded_pptx')
 zip_pkg_path = test_pptx_path
 
 
+class DescribeCopyZipMember(object):
+
+    def it_copies_a_member_with_its_name_date_and_compression(
+            self, tmp_pptx_path):
+        src = ZipFile(zip_pkg_path)
+        zinfo = src.getinfo('ppt/presentation.xml')
+        zout = ZipFile(tmp_pptx_path, 'w')
+        copy_zip_member(src, zout, zinfo)
+        zout.close()
+        zipf = ZipFile(tmp_pptx_path)
+        assert zipf.testzip() is None
+        assert zipf.read(zinfo.filename) == src.read(zinfo.filename)
+        new_zinfo = zipf.getinfo(zinfo.filename)
+        assert new_zinfo.compress_type == zinfo.compress_type
+        assert new_zinfo.date_time == zinfo.date_time
+
+
 class DescribeDirPkgReader(object):
 
     def it_is_used_by_PhysPkgReader_when_pkg_is_a_dir(self):
@@ -61,6 +80,14 @@ class DescribeDirPkgReader(object):
         rels_xml = dir_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_can_open_a_stream_on_a_pack_uri(self, dir_reader):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        stream = dir_reader.stream_for(pack_uri)
+        try:
+            assert stream.read() == dir_reader.blob_for(pack_uri)
+        finally:
+            stream.close()
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -123,6 +150,14 @@ class DescribeZipPkgReader(object):
         rels_xml = phys_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_can_open_a_stream_on_a_pack_uri(self, phys_reader):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        stream = phys_reader.stream_for(pack_uri)
+        try:
+            assert stream.read() == phys_reader.blob_for(pack_uri)
+        finally:
+            stream.close()
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(scope='class')
@@ -183,6 +218,30 @@ class DescribeZipPkgWriter(object):
         return pkg_file
 
 
+class DescribeRewriteZipPackage(object):
+
+    def it_replaces_and_adds_members_in_place(self, tmp_pptx_path):
+        shutil.copy(zip_pkg_path, tmp_pptx_path)
+        rewrite_zip_package(tmp_pptx_path, {
+            PackURI('/docProps/core.xml'): b'<foo/>',
+            PackURI('/foo/bar.xml'): b'<bar/>',
+        })
+        src, zipf = ZipFile(zip_pkg_path), ZipFile(tmp_pptx_path)
+        assert zipf.testzip() is None
+        assert zipf.read('docProps/core.xml') == b'<foo/>'
+        assert zipf.read('foo/bar.xml') == b'<bar/>'
+        for name in src.namelist():
+            if name == 'docProps/core.xml':
+                continue
+            assert zipf.read(name) == src.read(name)
+            assert zipf.getinfo(name).compress_type == (
+                src.getinfo(name).compress_type
+            )
+            assert zipf.getinfo(name).date_time == (
+                src.getinfo(name).date_time
+            )
+
+
 # fixtures -------------------------------------------------
 
 @pytest.fixture
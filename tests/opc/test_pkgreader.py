@@ -11,17 +11,24 @@ import pytest
 from mock import call, Mock, patch
 
 from pptx.opc.constants import (
-    CONTENT_TYPE as CT, RELATIONSHIP_TARGET_MODE as RTM
+    CONTENT_TYPE as CT, RELATIONSHIP_TARGET_MODE as RTM,
+    RELATIONSHIP_TYPE as RT
 )
-from pptx.opc.packuri import PackURI
-from pptx.opc.phys_pkg import _ZipPkgReader
+from pptx.opc.packuri import PACKAGE_URI, PackURI
+from pptx.opc.phys_pkg import PhysPkgReader, _ZipPkgReader
 from pptx.opc.pkgreader import (
-    _ContentTypeMap, PackageReader, _SerializedPart, _SerializedRelationship,
-    _SerializedRelationshipCollection
+    _ContentTypeMap, DeferredBlob, PackageReader, _SerializedPart,
+    _SerializedRelationship, _SerializedRelationshipCollection
 )
 
 from .unitdata.types import a_Default, a_Types, an_Override
-from ..unitutil import class_mock, initializer_mock, method_mock
+from ..unitutil import (
+    absjoin, class_mock, initializer_mock, method_mock, test_file_dir
+)
+
+
+images_pptx_path = absjoin(test_file_dir, 'with_images.pptx')
+no_core_props_pptx_path = absjoin(test_file_dir, 'no-core-props.pptx')
 
 
 class DescribePackageReader(object):
@@ -79,11 +86,56 @@ class DescribePackageReader(object):
         from_xml.assert_called_once_with(phys_reader.content_types_xml)
         _srels_for.assert_called_once_with(phys_reader, '/')
         _load_serialized_parts.assert_called_once_with(phys_reader, pkg_srels,
-                                                       content_types)
+                                                       content_types, None)
         phys_reader.close.assert_called_once_with()
         init.assert_called_once_with(content_types, pkg_srels, sparts)
         assert isinstance(pkg_reader, PackageReader)
 
+    def it_defers_reading_the_parts_excluded_from_loading(self):
+        def load(partname, content_type):
+            return not partname.startswith('/ppt/media/')
+        pkg_reader = PackageReader.from_file(images_pptx_path, load)
+        sparts = dict(
+            (partname, blob)
+            for partname, content_type, blob in pkg_reader.iter_sparts()
+        )
+        deferred = [
+            partname for partname, blob in sparts.items()
+            if isinstance(blob, DeferredBlob)
+        ]
+        assert deferred
+        assert all(partname.startswith('/ppt/media/') for partname in deferred)
+        full_reader = PackageReader.from_file(images_pptx_path)
+        for partname, content_type, blob in full_reader.iter_sparts():
+            if partname in deferred:
+                assert sparts[partname].read() == blob
+            else:
+                assert sparts[partname] == blob
+
+    def it_reads_all_the_deferred_blobs_at_once(
+            self, PhysPkgReader_, from_xml, _srels_for):
+        # mockery ----------------------
+        def load(partname, content_type):
+            return False
+        phys_reader = PhysPkgReader_.return_value
+        phys_reader.blob_for.side_effect = lambda partname: partname
+        from_xml.return_value = {'/foo.bin': 'foo/bin', '/bar.bin': 'bar/bin'}
+        _srels_for.side_effect = [
+            [Mock(name='rId1', is_external=False, target_partname='/foo.bin'),
+             Mock(name='rId2', is_external=False, target_partname='/bar.bin')],
+            [], []
+        ]
+        # exercise ---------------------
+        pkg_reader = PackageReader.from_file('foobar.pptx', load)
+        foo_blob, bar_blob = [t[2] for t in pkg_reader.iter_sparts()]
+        assert phys_reader.blob_for.call_count == 0
+        foo = foo_blob.read()
+        bar = bar_blob.read()
+        # verify -----------------------
+        assert (foo, bar) == ('/foo.bin', '/bar.bin')
+        assert PhysPkgReader_.call_count == 2
+        assert phys_reader.blob_for.call_count == 2
+
     def it_can_iterate_over_the_serialized_parts(self):
         # mockery ----------------------
         partname, content_type, blob = ('part/name.xml', 'app/vnd.type',
@@ -120,6 +172,17 @@ class DescribePackageReader(object):
         ]
         assert generated_tuples == expected_tuples
 
+    def it_can_iterate_over_the_rels_xml_read(self):
+        pkg_srels = Mock(name='pkg_srels', xml='<pkg_rels/>')
+        sparts = [
+            Mock(name='spart1', partname='pn1', srels=Mock(xml=None)),
+            Mock(name='spart2', partname='pn2', srels=Mock(xml='<rels/>')),
+        ]
+        pkg_reader = PackageReader(None, pkg_srels, sparts)
+        assert list(pkg_reader.iter_rels_xml()) == [
+            ('/', '<pkg_rels/>'), ('pn2', '<rels/>')
+        ]
+
     def it_can_load_serialized_parts(self, _SerializedPart_, _walk_phys_parts):
         # test data --------------------
         test_data = (
@@ -205,6 +268,28 @@ class DescribePackageReader(object):
         load_from_xml.assert_called_once_with(source_uri.baseURI, rels_xml)
         assert retval == srels
 
+    def it_can_read_the_part_a_source_is_related_to(self):
+        phys_reader = PhysPkgReader(images_pptx_path)
+        try:
+            partname, content_type, blob = PackageReader.read_related_part(
+                phys_reader, PACKAGE_URI, RT.CORE_PROPERTIES
+            )
+        finally:
+            phys_reader.close()
+        assert partname == '/docProps/core.xml'
+        assert content_type == CT.OPC_CORE_PROPERTIES
+        assert b'coreProperties' in blob
+
+    def it_returns_None_when_the_source_has_no_such_relationship(self):
+        phys_reader = PhysPkgReader(no_core_props_pptx_path)
+        try:
+            retval = PackageReader.read_related_part(
+                phys_reader, PACKAGE_URI, RT.CORE_PROPERTIES
+            )
+        finally:
+            phys_reader.close()
+        assert retval is None
+
 
 class Describe_ContentTypeMap(object):
 
@@ -409,6 +494,7 @@ class Describe_SerializedRelationshipCollection(object):
         oxml_fromstring.assert_called_once_with(rels_item_xml)
         assert _SerializedRelationship_.call_args_list == expected_calls
         assert isinstance(srels, _SerializedRelationshipCollection)
+        assert srels.xml is rels_item_xml
 
     def it_should_be_iterable(self):
         srels = _SerializedRelationshipCollection()
@@ -11,7 +11,9 @@ from mock import call, MagicMock, Mock, patch
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.package import Part
 from pptx.opc.packuri import PackURI
-from pptx.opc.pkgwriter import _ContentTypesItem, PackageWriter
+from pptx.opc.pkgwriter import (
+    _ContentTypesItem, ContentTypesCache, PackageWriter
+)
 
 from .unitdata.types import a_Default, a_Types, an_Override
 from ..unitutil import function_mock, instance_mock, method_mock
@@ -29,7 +31,7 @@ class DescribePackageWriter(object):
         PackageWriter.write(pkg_file, pkg_rels, parts)
         # verify -----------------------
         expected_calls = [
-            call._write_content_types_stream(phys_writer, parts),
+            call._write_content_types_stream(phys_writer, parts, None),
             call._write_pkg_rels(phys_writer, pkg_rels),
             call._write_parts(phys_writer, parts),
         ]
@@ -41,7 +43,7 @@ class DescribePackageWriter(object):
             self, xml_for, serialize_part_xml_):
         # mockery ----------------------
         phys_writer = Mock(name='phys_writer')
-        parts = Mock(name='parts')
+        parts = [Mock(name='part')]
         # exercise ---------------------
         PackageWriter._write_content_types_stream(phys_writer, parts)
         # verify -----------------------
@@ -116,6 +118,36 @@ class DescribePackageWriter(object):
         return method_mock(request, _ContentTypesItem, 'xml_for')
 
 
+class DescribeContentTypesCache(object):
+
+    def it_composes_the_content_types_again_only_when_parts_change(
+            self, xml_for, serialize_part_xml_):
+        cache = ContentTypesCache()
+        part = Mock(name='part', partname='/pn1', content_type='app/foo')
+        parts = [part]
+        blob = cache.blob_for(parts)
+        assert blob is serialize_part_xml_.return_value
+        assert cache.blob_for(parts) is blob
+        assert xml_for.call_count == 1
+        part.content_type = 'app/bar'
+        cache.blob_for(parts)
+        parts.append(Mock(name='part2', partname='/pn2', content_type='x'))
+        cache.blob_for(parts)
+        assert xml_for.call_count == 3
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def serialize_part_xml_(self, request):
+        return function_mock(
+            request, 'pptx.opc.pkgwriter.serialize_part_xml'
+        )
+
+    @pytest.fixture
+    def xml_for(self, request):
+        return method_mock(request, _ContentTypesItem, 'xml_for')
+
+
 class Describe_ContentTypesItem(object):
 
     def it_can_compose_content_types_xml(self, xml_for_fixture):
@@ -23,108 +23,107 @@ class DescribeCT_GroupShape(object):
             self, add_table_fixt):
         spTree, id_, name, rows, cols, x, y, cx, cy = add_table_fixt[:9]
         CT_GraphicalObjectFrame_ = add_table_fixt[9]
-        insert_element_before_, graphicFrame_ = add_table_fixt[10:]
+        insert_element_in_sequence_, graphicFrame_ = add_table_fixt[10:]
         graphicFrame = spTree.add_table(id_, name, rows, cols, x, y, cx, cy)
         CT_GraphicalObjectFrame_.new_table.assert_called_once_with(
             id_, name, rows, cols, x, y, cx, cy
         )
-        insert_element_before_.assert_called_once_with(
-            graphicFrame_, 'p:extLst'
-        )
+        insert_element_in_sequence_.assert_called_once_with(graphicFrame_)
         assert graphicFrame is graphicFrame_
 
     def it_can_add_a_pic_element_representing_a_picture(self, add_pic_fixt):
         spTree, id_, name, desc, rId, x, y, cx, cy = add_pic_fixt[:9]
-        CT_Picture_, insert_element_before_, pic_ = add_pic_fixt[9:]
+        CT_Picture_, insert_element_in_sequence_, pic_ = add_pic_fixt[9:]
         pic = spTree.add_pic(id_, name, desc, rId, x, y, cx, cy)
         CT_Picture_.new_pic.assert_called_once_with(
             id_, name, desc, rId, x, y, cx, cy
         )
-        insert_element_before_.assert_called_once_with(pic_, 'p:extLst')
+        insert_element_in_sequence_.assert_called_once_with(pic_)
         assert pic is pic_
 
     def it_can_add_an_sp_element_for_a_placeholder(
             self, add_placeholder_fixt):
         spTree, id_, name, ph_type, orient, sz, idx = add_placeholder_fixt[:7]
-        CT_Shape_, insert_element_before_, sp_ = add_placeholder_fixt[7:]
+        CT_Shape_, insert_element_in_sequence_, sp_ = add_placeholder_fixt[7:]
         sp = spTree.add_placeholder(id_, name, ph_type, orient, sz, idx)
         CT_Shape_.new_placeholder_sp.assert_called_once_with(
             id_, name, ph_type, orient, sz, idx
         )
-        insert_element_before_.assert_called_once_with(sp_, 'p:extLst')
+        insert_element_in_sequence_.assert_called_once_with(sp_)
         assert sp is sp_
 
     def it_can_add_an_sp_element_for_an_autoshape(self, add_autoshape_fixt):
         spTree, id_, name, prst, x, y, cx, cy = add_autoshape_fixt[:8]
-        CT_Shape_, insert_element_before_, sp_ = add_autoshape_fixt[8:]
+        CT_Shape_, insert_element_in_sequence_, sp_ = add_autoshape_fixt[8:]
         sp = spTree.add_autoshape(id_, name, prst, x, y, cx, cy)
         CT_Shape_.new_autoshape_sp.assert_called_once_with(
             id_, name, prst, x, y, cx, cy
         )
-        insert_element_before_.assert_called_once_with(sp_, 'p:extLst')
+        insert_element_in_sequence_.assert_called_once_with(sp_)
         assert sp is sp_
 
     def it_can_add_a_textbox_sp_element(self, add_textbox_fixt):
         spTree, id_, name, x, y, cx, cy, CT_Shape_ = add_textbox_fixt[:8]
-        insert_element_before_, sp_ = add_textbox_fixt[8:]
+        insert_element_in_sequence_, sp_ = add_textbox_fixt[8:]
         sp = spTree.add_textbox(id_, name, x, y, cx, cy)
         CT_Shape_.new_textbox_sp.assert_called_once_with(
             id_, name, x, y, cx, cy
         )
-        insert_element_before_.assert_called_once_with(sp_, 'p:extLst')
+        insert_element_in_sequence_.assert_called_once_with(sp_)
         assert sp is sp_
 
     # fixtures ---------------------------------------------
 
     @pytest.fixture
     def add_autoshape_fixt(
-            self, spTree, CT_Shape_, insert_element_before_, sp_):
+            self, spTree, CT_Shape_, insert_element_in_sequence_, sp_):
         id_, name, prst = 42, 'name', 'prst'
         x, y, cx, cy = 9, 8, 7, 6
         return (
             spTree, id_, name, prst, x, y, cx, cy, CT_Shape_,
-            insert_element_before_, sp_
+            insert_element_in_sequence_, sp_
         )
 
     @pytest.fixture
     def add_pic_fixt(
-            self, spTree, CT_Picture_, insert_element_before_, pic_):
+            self, spTree, CT_Picture_, insert_element_in_sequence_, pic_):
         id_, name, desc, rId = 42, 'name', 'desc', 'rId6'
         x, y, cx, cy = 6, 7, 8, 9
         return (
             spTree, id_, name, desc, rId, x, y, cx, cy, CT_Picture_,
-            insert_element_before_, pic_
+            insert_element_in_sequence_, pic_
         )
 
     @pytest.fixture
     def add_placeholder_fixt(
-            self, spTree, CT_Shape_, insert_element_before_, sp_):
+            self, spTree, CT_Shape_, insert_element_in_sequence_, sp_):
         id_, name, ph_type = 42, 'name', 'type'
         orient, sz, idx = 'orient', 'sz', 24
         return (
             spTree, id_, name, ph_type, orient, sz, idx, CT_Shape_,
-            insert_element_before_, sp_
+            insert_element_in_sequence_, sp_
         )
 
     @pytest.fixture
     def add_table_fixt(
             self, spTree, CT_GraphicalObjectFrame_,
-            insert_element_before_, graphicFrame_):
+            insert_element_in_sequence_, graphicFrame_):
         id_, name, rows, cols = 42, 'name', 12, 23
         x, y, cx, cy = 5, 4, 3, 2
         return (
             spTree, id_, name, rows, cols, x, y, cx, cy,
-            CT_GraphicalObjectFrame_, insert_element_before_, graphicFrame_
+            CT_GraphicalObjectFrame_, insert_element_in_sequence_,
+            graphicFrame_
         )
 
     @pytest.fixture
     def add_textbox_fixt(
-            self, spTree, CT_Shape_, insert_element_before_, sp_):
+            self, spTree, CT_Shape_, insert_element_in_sequence_, sp_):
         id_, name = 42, 'name'
         x, y, cx, cy = 3, 4, 5, 6
         return (
             spTree, id_, name, x, y, cx, cy, CT_Shape_,
-            insert_element_before_, sp_
+            insert_element_in_sequence_, sp_
         )
 
     # fixture components -----------------------------------
@@ -160,8 +159,10 @@ class DescribeCT_GroupShape(object):
         return instance_mock(request, CT_GraphicalObjectFrame)
 
     @pytest.fixture
-    def insert_element_before_(self, request):
-        return method_mock(request, CT_GroupShape, 'insert_element_before')
+    def insert_element_in_sequence_(self, request):
+        return method_mock(
+            request, CT_GroupShape, 'insert_element_in_sequence'
+        )
 
     @pytest.fixture
     def pic_(self, request):
@@ -8,7 +8,7 @@ from datetime import datetime
 
 from hamcrest import assert_that, equal_to, is_
 
-from pptx.oxml.coreprops import CT_CoreProperties
+from pptx.oxml.simpletypes import ST_W3CDTF
 
 from .unitdata.coreprops import a_coreProperties
 from ..unitutil import TestCase
@@ -89,7 +89,7 @@ class TestCT_CoreProperties(TestCase):
         )
         for dt_str, expected_datetime in cases:
             # exercise -----------------
-            dt = CT_CoreProperties._parse_W3CDTF_to_datetime(dt_str)
+            dt = ST_W3CDTF.from_xml(dt_str)
             # verify -------------------
             assert_that(dt, is_(expected_datetime))
 
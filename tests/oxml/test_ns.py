@@ -8,7 +8,11 @@ from __future__ import print_function, unicode_literals
 
 import pytest
 
-from pptx.oxml.ns import NamespacePrefixedTag, namespaces, nsdecls, nsuri, qn
+from lxml import etree
+
+from pptx.oxml.ns import (
+    compiled_xpath, NamespacePrefixedTag, namespaces, nsdecls, nsuri, qn
+)
 
 
 class DescribeNamespacePrefixedTag(object):
@@ -35,6 +39,29 @@ class DescribeNamespacePrefixedTag(object):
         assert nsptag.nsuri == namespace_uri_a
 
 
+class DescribeCompiledXpath(object):
+
+    def it_compiles_an_xpath_expression_using_the_known_prefixes(self):
+        sld = etree.fromstring(
+            '<p:sld %s><p:cSld><p:spTree/></p:cSld></p:sld>' % nsdecls('p')
+        )
+        spTree = compiled_xpath('./p:cSld/p:spTree')(sld)[0]
+        assert spTree.tag == qn('p:spTree')
+
+    def it_reuses_the_compiled_form_of_an_expression(self):
+        xpath = compiled_xpath('./p:cSld/p:spTree')
+        assert isinstance(xpath, etree.XPath)
+        assert compiled_xpath('./p:cSld/p:spTree') is xpath
+
+    def it_accepts_xpath_variables(self):
+        elm = etree.fromstring(
+            '<p:sld %s p:foo="bar"/>' % nsdecls('p')
+        )
+        xpath = compiled_xpath('//*[@p:foo=$value]')
+        assert xpath(elm, value='bar') == [elm]
+        assert xpath(elm, value='baz') == []
+
+
 class DescribeNamespaces(object):
 
     def it_composes_a_dict_of_ns_uris_keyed_by_ns_pfx(self, nsmap):
@@ -61,6 +88,9 @@ class DescribeQn(object):
             self, nsptag_str, clark_name):
         assert qn(nsptag_str) == clark_name
 
+    def it_returns_the_same_clark_name_object_each_time(self, nsptag_str):
+        assert qn(nsptag_str) is qn(nsptag_str)
+
 
 # ===========================================================================
 # fixtures
@@ -8,7 +8,7 @@ from __future__ import print_function, unicode_literals
 
 import pytest
 
-from lxml import objectify
+from lxml import etree, objectify
 
 from pptx.oxml import oxml_parser
 from pptx.oxml.shared import (
@@ -18,6 +18,8 @@ from pptx.oxml.shared import (
 from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.text import CT_TextBody
 
+from ..unitutil import function_mock
+
 
 class DescribeBaseOxmlElement(object):
 
@@ -26,8 +28,84 @@ class DescribeBaseOxmlElement(object):
         ElementClass, tagname, tagnames_after = child_tagnames_fixture
         assert ElementClass.child_tagnames_after(tagname) == tagnames_after
 
+    def it_can_insert_a_child_in_schema_sequence(self, insert_fixture):
+        parent, tagname, expected_tags = insert_fixture
+        child = parent.insert_element_in_sequence(Element(tagname))
+        assert child.tag == qn(tagname)
+        child_tags = [c.tag for c in parent.iterchildren()]
+        assert child_tags == [qn(t) for t in expected_tags]
+
+    def it_can_insert_a_child_before_its_successors(self, insert_fixture):
+        parent, tagname, expected_tags = insert_fixture
+        successors = parent.child_tagnames_after(tagname)
+        parent.insert_element_before(Element(tagname), *successors)
+        child_tags = [c.tag for c in parent.iterchildren()]
+        assert child_tags == [qn(t) for t in expected_tags]
+
+    def it_inserts_after_the_last_non_successor_when_out_of_order(self):
+        parent = Element('p:spTree')
+        for tagname in ('p:nvGrpSpPr', 'p:extLst', 'p:pic'):
+            parent.append(Element(tagname))
+        parent.insert_element_before(Element('p:sp'), 'p:extLst')
+        parent.insert_element_in_sequence(Element('p:cxnSp'))
+        child_tags = [c.tag for c in parent.iterchildren()]
+        assert child_tags == [
+            qn(t) for t in (
+                'p:nvGrpSpPr', 'p:extLst', 'p:pic', 'p:sp', 'p:cxnSp'
+            )
+        ]
+
+    def it_skips_comments_when_finding_the_successors(self):
+        parent = Element('p:spTree')
+        parent.append(Element('p:nvGrpSpPr'))
+        parent.append(Element('p:extLst'))
+        parent.append(etree.Comment('trailing comment'))
+        parent.insert_element_before(Element('p:sp'), 'p:extLst')
+        parent.insert_element_in_sequence(Element('p:pic'))
+        child_tags = [c.tag for c in parent.iterchildren(etree.Element)]
+        assert child_tags == [
+            qn(t) for t in ('p:nvGrpSpPr', 'p:sp', 'p:pic', 'p:extLst')
+        ]
+
+    def it_finds_the_first_child_having_one_of_several_tags(self):
+        parent = Element('p:spTree')
+        parent.append(Element('p:nvGrpSpPr'))
+        pic = Element('p:pic')
+        parent.append(pic)
+        assert parent.first_child_found_in('p:sp', 'p:pic') is pic
+        assert parent.first_child_found_in('p:sp', 'p:extLst') is None
+
+    def it_compiles_the_position_of_each_child_tag_once(self):
+        child_tagnames = ChildTagnames.from_nested_sequence(
+            'a:foo', ('a:bar', 'a:baz'), 'a:extLst'
+        )
+        positions = child_tagnames.positions
+        assert positions == {
+            qn('a:foo'): 0, qn('a:bar'): 1, qn('a:baz'): 1,
+            qn('a:extLst'): 2,
+        }
+        assert child_tagnames.positions is positions
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        ((), 'p:sp', ('p:sp',)),
+        (('p:nvGrpSpPr', 'p:grpSpPr'), 'p:sp',
+         ('p:nvGrpSpPr', 'p:grpSpPr', 'p:sp')),
+        (('p:nvGrpSpPr', 'p:pic', 'p:extLst'), 'p:sp',
+         ('p:nvGrpSpPr', 'p:pic', 'p:sp', 'p:extLst')),
+        (('p:nvGrpSpPr', 'p:extLst'), 'p:grpSpPr',
+         ('p:nvGrpSpPr', 'p:grpSpPr', 'p:extLst')),
+        (('p:sp', 'p:extLst'), 'p:nvGrpSpPr',
+         ('p:nvGrpSpPr', 'p:sp', 'p:extLst')),
+    ])
+    def insert_fixture(self, request):
+        child_tagnames, tagname, expected_tags = request.param
+        parent = Element('p:spTree')
+        for child_tagname in child_tagnames:
+            parent.append(Element(child_tagname))
+        return parent, tagname, expected_tags
+
     @pytest.fixture(params=[
         (('foo', 'bar', 'baz'), 'foo', ('bar', 'baz')),
         ((('foo', 'bar'), 'baz'), 'foo', ('baz',)),
@@ -102,8 +180,41 @@ class DescribeSerializePartXml(object):
         # len of 188 if it's unicode and 191 if it's bytes
         assert len(xml) == 191
 
+    def it_serializes_in_one_pass_when_there_are_no_annotations(
+            self, deannotate_):
+        part_elm = objectify.fromstring(
+            '<f:foo xmlns:f="http://foo"><f:bar>baz</f:bar></f:foo>'
+        )
+        xml = serialize_part_xml(part_elm)
+        assert xml == (
+            b'<?xml version=\'1.0\' encoding=\'UTF-8\' standalone=\'yes\'?>\n'
+            b'<f:foo xmlns:f="http://foo"><f:bar>baz</f:bar></f:foo>'
+        )
+        assert deannotate_.call_count == 0
+
+    def it_serializes_in_one_pass_when_only_the_namespace_remains(
+            self, deannotate_):
+        part_elm = objectify.fromstring(
+            '<f:foo xmlns:f="http://foo" xmlns:py="http://codespeak.net/lxml/'
+            'objectify/pytype"><f:bar>baz</f:bar></f:foo>'
+        )
+        serialize_part_xml(part_elm)
+        assert deannotate_.call_count == 0
+
+    def it_deannotates_a_pytype_attribute_having_any_prefix(self):
+        part_elm = objectify.fromstring(
+            '<f:foo xmlns:f="http://foo" xmlns:t="http://codespeak.net/lxml/'
+            'objectify/pytype"><f:bar t:pytype="str">baz</f:bar></f:foo>'
+        )
+        xml = serialize_part_xml(part_elm)
+        assert b'pytype=' not in xml
+
     # fixtures -----------------------------------
 
+    @pytest.fixture
+    def deannotate_(self, request):
+        return function_mock(request, 'pptx.oxml.shared.objectify.deannotate')
+
     @pytest.fixture
     def part_elm(self, xml_bytes):
         return objectify.fromstring(xml_bytes)
@@ -11,13 +11,15 @@ import pytest
 from pptx.oxml.ns import qn
 from pptx.oxml.text import (
     CT_RegularTextRun, CT_TextBody, CT_TextBodyProperties,
-    CT_TextCharacterProperties, CT_TextParagraph, CT_TextParagraphProperties
+    CT_TextCharacterProperties, CT_TextParagraph, CT_TextParagraphProperties,
+    CT_TextRunText
 )
+from pptx.util import Pt
 
 from ..oxml.unitdata.dml import a_gradFill, a_noFill, a_solidFill
 from ..oxml.unitdata.text import (
-    a_bodyPr, a_defRPr, a_p, a_pPr, a_t, a_txBody, an_endParaRPr, an_extLst,
-    an_r, an_rPr
+    a_bodyPr, a_defRPr, a_latin, a_p, a_pPr, a_t, a_txBody, an_endParaRPr,
+    an_extLst, an_r, an_rPr
 )
 from ..unitutil import actual_xml
 
@@ -36,6 +38,14 @@ class DescribeCT_RegularTextRun(object):
         r.get_or_add_rPr()
         assert actual_xml(r) == r_with_rPr_xml
 
+    def it_has_a_t_child_with_writable_text(self, r):
+        assert isinstance(r.t, CT_TextRunText)
+        r.t.text = u'foobar'
+        expected_xml = (
+            an_r().with_nsdecls().with_child(a_t().with_text('foobar')).xml()
+        )
+        assert actual_xml(r) == expected_xml
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -66,6 +76,18 @@ class DescribeCT_TextBody(object):
     def it_is_used_by_the_parser_for_a_txBody_element(self, txBody):
         assert isinstance(txBody, CT_TextBody)
 
+    def it_can_replace_its_p_elements(self):
+        txBody = (
+            a_txBody().with_nsdecls()
+                      .with_child(a_bodyPr())
+                      .with_child(a_p().with_child(an_r()))
+                      .with_child(a_p())
+                      .element
+        )
+        p = a_p().with_nsdecls().element
+        txBody.replace_p_elms([p])
+        assert txBody.getchildren() == [txBody.bodyPr, p]
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -314,6 +336,28 @@ class DescribeCT_TextParagraph(object):
         p = p_with_r_children.remove_child_r_elms()
         assert actual_xml(p) == p_xml
 
+    def it_can_construct_a_new_p_element_with_its_runs(self):
+        runs = (
+            (u'foo', {}),
+            (u'bar', {'bold': True, 'size': Pt(12), 'name': 'Arial'}),
+        )
+        p = CT_TextParagraph.new_p(runs, level=2)
+        rPr_bldr = (
+            an_rPr().with_b('1').with_sz('1200')
+                    .with_child(a_latin().with_typeface('Arial'))
+        )
+        expected_xml = (
+            a_p().with_nsdecls()
+                 .with_child(a_pPr().with_lvl(2))
+                 .with_child(an_r().with_child(a_t().with_text('foo')))
+                 .with_child(
+                     an_r().with_child(rPr_bldr)
+                           .with_child(a_t().with_text('bar')))
+                 .xml()
+        )
+        assert isinstance(p, CT_TextParagraph)
+        assert actual_xml(p) == expected_xml
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -0,0 +1,123 @@
+# encoding: utf-8
+
+"""
+Test suite for the pptx.oxml.xmlchemy module, using element classes that
+declare their properties with it.
+"""
+
+from __future__ import absolute_import
+
+from datetime import datetime
+
+import pytest
+
+from lxml import objectify
+
+from pptx.oxml.shapes.shared import CT_LineProperties, CT_Transform2D
+from pptx.oxml.simpletypes import ST_Coordinate32
+from pptx.oxml.slide import CT_Slide
+from pptx.oxml.xmlchemy import OptionalAttribute, ZeroOrOne
+
+from .unitdata.coreprops import a_coreProperties
+from .unitdata.dml import an_ln
+from .unitdata.shape import an_ext, an_off, an_xfrm
+
+
+class DescribeOptionalAttribute(object):
+
+    def it_is_a_property_of_the_element_class(self):
+        assert isinstance(CT_LineProperties.w, OptionalAttribute)
+
+    def it_reads_the_attribute_value_or_the_default(self):
+        assert an_ln().with_nsdecls().with_w(12700).element.w == 12700
+        assert an_ln().with_nsdecls().element.w is None
+
+    def it_can_change_the_attribute_value(self):
+        ln = an_ln().with_nsdecls().element
+        ln.w = 25400
+        assert ln.get('w') == '25400'
+
+    def it_removes_the_attribute_when_None_is_assigned(self):
+        ln = an_ln().with_nsdecls().with_w(12700).element
+        ln.w = None
+        assert 'w' not in ln.attrib
+
+
+    def it_accepts_a_long_where_an_int_is_required(self):
+        assert ST_Coordinate32.to_xml(long(914400)) == '914400'
+
+
+class DescribeRequiredAttribute(object):
+
+    def it_reads_and_writes_the_attribute_value(self):
+        off = an_off().with_nsdecls().with_x(42).with_y(24).element
+        assert (off.x, off.y) == (42, 24)
+        off.x = 914400
+        assert off.get('x') == '914400'
+
+
+class DescribeZeroOrOne(object):
+
+    def it_is_read_only(self):
+        assert isinstance(CT_Transform2D.off, ZeroOrOne)
+        assert CT_Transform2D.off.fset is None
+
+    def it_returns_the_child_or_None_if_not_present(self, xfrm):
+        assert xfrm.ext.tag.endswith('}ext')
+        assert xfrm.off is None
+
+
+class DescribeDelegated(object):
+
+    def it_reads_the_default_when_the_child_is_not_present(self, xfrm):
+        assert xfrm.x is None
+        assert xfrm.cx == 10
+
+    def it_adds_the_child_when_a_value_is_assigned(self, xfrm):
+        xfrm.x = 914400
+        assert xfrm.off.get('x') == '914400'
+        assert 'x' not in xfrm.attrib
+
+    def it_leaves_the_xml_alone_when_the_default_is_assigned(self, xfrm):
+        xfrm.y = None
+        assert xfrm.off is None
+
+
+class DescribeZeroOrOneText(object):
+
+    def it_reads_the_child_text_or_the_default(self):
+        coreProperties = a_coreProperties().with_child(
+            'title', 'Foo'
+        ).element
+        assert coreProperties.title == 'Foo'
+        assert coreProperties.subject == ''
+
+    def it_converts_the_assigned_value_to_the_child_text(self):
+        coreProperties = a_coreProperties().element
+        coreProperties.last_printed = datetime(2014, 1, 2, 3, 4, 5)
+        assert coreProperties.getchildren()[0].text == '2014-01-02T03:04:05Z'
+        assert coreProperties.last_printed == datetime(2014, 1, 2, 3, 4, 5)
+
+
+class DescribePropertySetterMixin(object):
+
+    def it_routes_assignment_to_a_property_setter(self, xfrm):
+        xfrm.x = 914400
+        assert xfrm.off.get('x') == '914400'
+        assert 'x' not in xfrm.attrib
+
+    def it_leaves_other_assignments_to_objectify(self, xfrm):
+        xfrm.foobar = 'baz'
+        assert xfrm.foobar == 'baz'
+
+    def it_is_left_out_of_classes_without_a_writable_property(self):
+        assert CT_Slide.__setattr__ is objectify.ObjectifiedElement.__setattr__
+
+
+# fixtures -------------------------------------------------
+
+@pytest.fixture
+def xfrm():
+    return an_xfrm().with_nsdecls().with_child(
+        an_ext().with_cx(10).with_cy(20)
+    ).element
@@ -127,3 +127,28 @@ class TestImageCollection(TestCase):
         actual = (image.partname, len(pkg._images), image._sha1)
         msg = "\nExpected: %s\n     Got: %s" % (expected, actual)
         self.assertEqual(expected, actual, msg)
+
+    def test_add_image_part_returns_matching_image(self):
+        pkg = Package.open(images_pptx_path)
+        other_pkg = Package.open(images_pptx_path)
+        other_image = other_pkg._images[4]
+        image = pkg._images.add_image_part(other_image)
+        assert image is pkg._images[4]
+
+    def test_add_image_part_adds_copy_on_no_match(self):
+        pkg = Package.open(images_pptx_path)
+        partname = PackURI('/ppt/media/image1.png')
+        other_image = Image.new(partname, new_image_path)
+        expected_len = len(pkg._images) + 1
+        image = pkg._images.add_image_part(other_image)
+        assert image is not other_image
+        assert len(pkg._images) == expected_len
+        assert image.partname == '/ppt/media/image8.png'
+        assert image.blob == other_image.blob
+        assert image.content_type == 'image/png'
+
+    def test_loaded_images_keep_their_extension_on_rename(self):
+        pkg = Package.open(images_pptx_path)
+        pkg._images.add_image(new_image_path)
+        for image in pkg._images:
+            assert '..' not in image.partname
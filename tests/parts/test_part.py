@@ -36,3 +36,37 @@ class TestPartCollection(TestCase):
         actual = [part.partname for part in parts]
         msg = "expected %s, got %s" % (expected, actual)
         self.assertEqual(expected, actual, msg)
+
+    def test_add_part_inserts_after_parts_with_same_idx(self):
+        parts = PartCollection()
+        part1, part2, part3, part4 = [
+            Mock(name=name, partname=PackURI(partname)) for name, partname in (
+                ('part1', '/ppt/slides/slide2.xml'),
+                ('part2', '/ppt/presentation.xml'),
+                ('part3', '/ppt/notesSlides/notesSlide2.xml'),
+                ('part4', '/ppt/slides/slide10.xml'),
+            )
+        ]
+        # exercise ---------------------
+        for part in (part4, part1, part2, part3):
+            parts.add_part(part)
+        # verify -----------------------
+        self.assertEqual([part2, part1, part3, part4], list(parts))
+
+    def test_add_parts_matches_add_part_order(self):
+        partnames = (
+            '/ppt/media/image10.png', '/ppt/media/image2.png',
+            '/ppt/media/image.png', '/ppt/media/image1.jpeg',
+            '/ppt/media/image2.gif', '/ppt/media/image9.png',
+        )
+        new_parts = [Mock(name=pn, partname=PackURI(pn)) for pn in partnames]
+        one_by_one, in_bulk = PartCollection(), PartCollection()
+        for part in new_parts[:2]:
+            one_by_one.add_part(part)
+            in_bulk.add_part(part)
+        # exercise ---------------------
+        for part in new_parts[2:]:
+            one_by_one.add_part(part)
+        in_bulk.add_parts(iter(new_parts[2:]))
+        # verify -----------------------
+        self.assertEqual(list(one_by_one), list(in_bulk))
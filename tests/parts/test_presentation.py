@@ -65,6 +65,11 @@ class DescribePresentationPart(object):
         slides_2 = prs.slides
         assert slides_2 is slides_1
 
+    def it_renames_its_slides_before_it_is_saved(self, prs, slides_):
+        prs._slides = slides_
+        prs.before_marshal()
+        slides_.rename_slides.assert_called_once_with()
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -13,7 +13,7 @@ from mock import ANY, call, MagicMock
 
 from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from pptx.opc.packuri import PackURI
-from pptx.opc.package import Part, _Relationship
+from pptx.opc.package import Part, RelationshipCollection, _Relationship
 from pptx.oxml.presentation import CT_SlideId, CT_SlideIdList
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
@@ -26,7 +26,7 @@ from pptx.parts.image import Image as ImagePart
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import (
     BaseSlide, Slide, SlideCollection, _SlidePlaceholder, _SlidePlaceholders,
-    _SlideShapeFactory, _SlideShapeTree
+    _SlideShapeFactory, _SlideShapeTree, _unused_partname
 )
 from pptx.parts.slidelayout import _LayoutPlaceholder, SlideLayout
 from pptx.shapes.autoshape import AutoShapeType, Shape
@@ -39,6 +39,7 @@ from ..oxml.unitdata.shape import (
     a_cNvPr, a_ph, a_pic, an_ext, an_nvPr, an_nvSpPr, an_sp, an_spPr,
     an_spTree, an_xfrm
 )
+from ..oxml.unitdata.presentation import a_sldIdLst
 from ..oxml.unitdata.slides import a_sld, a_cSld
 from ..unitutil import (
     absjoin, class_mock, function_mock, initializer_mock, instance_mock,
@@ -92,6 +93,7 @@ class DescribeBaseSlide(object):
         # verify -----------------------
         base_slide._package._images.add_image.assert_called_once_with(
             img_file_)
+        base_slide._package.lock.__enter__.assert_called_once_with()
         base_slide.relate_to.assert_called_once_with(image, RT.IMAGE)
         assert image is image_
         assert rId is rId_
@@ -109,6 +111,7 @@ class DescribeBaseSlide(object):
         image_ = loose_mock(request, name='image_')
         pkg_ = loose_mock(request, name='_package', spec=Package)
         pkg_._images.add_image.return_value = image_
+        pkg_.lock = MagicMock(name='lock')
         base_slide._package = pkg_
         # mock BaseSlide.relate_to()
         rId_ = loose_mock(request, name='rId_')
@@ -331,6 +334,123 @@ class DescribeSlideCollection(object):
         assert slide_.partname == '/ppt/slides/slide1.xml'
         assert slide_2_.partname == '/ppt/slides/slide2.xml'
 
+    def it_knows_the_index_of_a_slide(self, real_slides_fixture):
+        slides, prs_, slide_parts = real_slides_fixture
+        assert slides.index(slide_parts[1]) == 1
+        with pytest.raises(ValueError):
+            slides.index(object())
+
+    def it_can_move_a_slide(self, real_slides_fixture):
+        slides, prs_, slide_parts = real_slides_fixture
+        slide_1, slide_2, slide_3 = slide_parts
+        slides.move(slide_3, 0)
+        assert list(slides) == [slide_3, slide_1, slide_2]
+        slides.move(slide_3, -1)
+        assert list(slides) == [slide_1, slide_3, slide_2]
+
+    def it_can_reorder_its_slides(self, real_slides_fixture):
+        slides, prs_, slide_parts = real_slides_fixture
+        slide_1, slide_2, slide_3 = slide_parts
+        slides.reorder([slide_2, slide_3, slide_1])
+        assert list(slides) == [slide_2, slide_3, slide_1]
+
+    def it_raises_on_reorder_with_missing_slides(self, real_slides_fixture):
+        slides, prs_, slide_parts = real_slides_fixture
+        slide_1, slide_2, slide_3 = slide_parts
+        with pytest.raises(ValueError):
+            slides.reorder([slide_2, slide_2, slide_1])
+        assert list(slides) == [slide_1, slide_2, slide_3]
+
+    def it_can_remove_a_slide(self, real_slides_fixture):
+        slides, prs_, slide_parts = real_slides_fixture
+        slide_1, slide_2, slide_3 = slide_parts
+        slides.remove(slide_2)
+        assert list(slides) == [slide_1, slide_3]
+        assert 'rId2' not in prs_.rels
+        assert 'rId2' not in prs_.related_parts
+        prs_.package.drop_unreachable_parts.assert_called_once_with()
+
+    def it_can_remove_several_slides_at_once(self, real_slides_fixture):
+        slides, prs_, slide_parts = real_slides_fixture
+        slide_1, slide_2, slide_3 = slide_parts
+        slides.remove_slides([slide_3, slide_1])
+        assert list(slides) == [slide_2]
+        assert sorted(prs_.rels.keys()) == ['rId2']
+        prs_.package.drop_unreachable_parts.assert_called_once_with()
+
+    def it_leaves_slides_alone_when_a_removal_is_invalid(
+            self, real_slides_fixture):
+        slides, prs_, slide_parts = real_slides_fixture
+        with pytest.raises(ValueError):
+            slides.remove_slides([slide_parts[0], object()])
+        assert list(slides) == list(slide_parts)
+        assert len(prs_.rels) == 3
+
+    def it_skips_partnames_still_in_use_after_a_removal(
+            self, real_slides_fixture):
+        slides, prs_, slide_parts = real_slides_fixture
+        slides.remove(slide_parts[0])
+        assert slides._next_partname == PackURI('/ppt/slides/slide4.xml')
+
+    def it_can_import_slides_from_another_presentation(self, import_fixture):
+        prs, src_prs = import_fixture
+        src_slide = src_prs.slides[1]
+        slides = prs.slides.import_from(src_prs, slides=[1, src_prs.slides[3]])
+        assert len(prs.slides) == 3
+        assert list(prs.slides)[1:] == slides
+        slide = slides[0]
+        assert slide is not src_slide
+        assert slide.package is prs.package
+        assert slide.partname == '/ppt/slides/slide2.xml'
+        assert slide.blob == src_slide.blob
+        assert sorted(slide.rels.keys()) == sorted(src_slide.rels.keys())
+
+    def it_maps_imported_slides_to_layouts_by_name(self, import_fixture):
+        prs, src_prs = import_fixture
+        slide = prs.slides.import_from(src_prs, slides=[2])[0]
+        assert slide.slide_layout.package is prs.package
+        assert slide.slide_layout.name == 'Title Only'
+
+    def it_uses_the_layout_mapping_when_provided(self, import_fixture):
+        prs, src_prs = import_fixture
+        slide_layout = prs.slide_masters[0].slide_layouts[3]
+        slide = prs.slides.import_from(
+            src_prs, slides=[2], layout_mapping={'Title Only': slide_layout}
+        )[0]
+        assert slide.slide_layout is slide_layout
+
+    def it_raises_when_no_layout_matches(self, import_fixture):
+        prs, src_prs = import_fixture
+        src_prs.slides[0].slide_layout._element.cSld.set('name', 'Foo')
+        with pytest.raises(ValueError):
+            prs.slides.import_from(src_prs, slides=[0])
+        assert len(prs.slides) == 1
+
+    def it_shares_imported_images_having_the_same_content(
+            self, import_fixture):
+        prs, src_prs = import_fixture
+        prs.slides.import_from(src_prs)
+        image_count = len(prs.package._images)
+        prs.slides.import_from(src_prs)
+        assert image_count == 6
+        assert len(prs.package._images) == image_count
+        image_parts = [
+            part for part in prs.package.parts
+            if part.partname.startswith('/ppt/media/')
+        ]
+        assert len(image_parts) == image_count
+
+    def it_finds_an_unused_partname_for_a_copied_part(self):
+        used_partnames = set([
+            PackURI('/ppt/charts/chart1.xml'),
+            PackURI('/ppt/charts/chart2.xml'),
+        ])
+        partname = _unused_partname(
+            PackURI('/ppt/charts/chart1.xml'), used_partnames
+        )
+        assert partname == PackURI('/ppt/charts/chart3.xml')
+        assert partname in used_partnames
+
     # fixtures -------------------------------------------------------
     #
     #   slides
@@ -346,6 +466,12 @@ class DescribeSlideCollection(object):
     #
     # ----------------------------------------------------------------
 
+    @pytest.fixture
+    def import_fixture(self):
+        prs = Package.open(absjoin(test_file_dir, 'test.pptx')).presentation
+        src_pkg = Package.open(absjoin(test_file_dir, 'with_images.pptx'))
+        return prs, src_pkg.presentation
+
     @pytest.fixture
     def prs_(self, request, rel_, related_parts_):
         prs_ = instance_mock(request, PresentationPart)
@@ -374,6 +500,23 @@ class DescribeSlideCollection(object):
         related_parts_.__getitem__.side_effect = getitem
         return related_parts_
 
+    @pytest.fixture
+    def real_slides_fixture(self, request):
+        prs_ = instance_mock(request, PresentationPart)
+        prs_.rels = RelationshipCollection('/ppt')
+        sldIdLst = a_sldIdLst().with_nsdecls().element
+        slide_parts = []
+        for n in range(1, 4):
+            partname = PackURI('/ppt/slides/slide%d.xml' % n)
+            slide = Slide(partname, CT.PML_SLIDE, None, None)
+            rId = 'rId%d' % n
+            prs_.rels.add_relationship(RT.SLIDE, slide, rId)
+            sldIdLst.add_sldId(rId)
+            slide_parts.append(slide)
+        prs_.related_parts = prs_.rels.related_parts
+        slides = SlideCollection(sldIdLst, prs_)
+        return slides, prs_, tuple(slide_parts)
+
     @pytest.fixture
     def rename_slides_(self, request):
         return method_mock(request, SlideCollection, 'rename_slides')
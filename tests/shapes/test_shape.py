@@ -8,6 +8,7 @@ from __future__ import absolute_import
 
 import pytest
 
+from pptx.api import Presentation
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.text import CT_TextBody
 from pptx.parts.slide import _SlideShapeTree
@@ -73,6 +74,12 @@ class DescribeBaseShape(object):
         TextFrame_.assert_called_once_with(txBody_, shape)
         assert textframe is textframe_
 
+    def it_provides_the_same_textframe_each_time_it_is_navigated_to(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_textbox(0, 0, 100, 100)
+        assert slide.shapes[0].textframe is slide.shapes[0].textframe
+
     def it_raises_when_no_textframe(self, no_textframe_fixture):
         shape = no_textframe_fixture
         with pytest.raises(ValueError):
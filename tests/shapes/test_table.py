@@ -29,6 +29,10 @@ class Describe_Cell(object):
     def it_has_a_fill(self, cell):
         assert isinstance(cell.fill, FillFormat)
 
+    def it_shares_its_textframe_with_other_proxies_of_its_tc(self):
+        tc = a_tc().with_nsdecls().element
+        assert _Cell(tc, None).textframe is _Cell(tc, None).textframe
+
     def it_knows_its_margin_settings(self, margin_get_fixture):
         cell, margin_left, margin_right, margin_top, margin_bottom = (
             margin_get_fixture
@@ -0,0 +1,103 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.aio module
+"""
+
+from __future__ import absolute_import, print_function
+
+from StringIO import StringIO
+
+import pytest
+
+from pptx.api import Presentation
+
+from .unitutil import absjoin, test_file_dir
+
+try:
+    import asyncio
+except ImportError:
+    try:
+        import trollius as asyncio
+    except ImportError:
+        asyncio = None
+
+pytestmark = pytest.mark.skipif(
+    asyncio is None, reason='requires asyncio or trollius'
+)
+
+images_pptx_path = absjoin(test_file_dir, 'with_images.pptx')
+
+
+class DescribeOpenAsync(object):
+
+    def it_opens_a_presentation_off_the_event_loop(self, loop):
+        future = Presentation.open_async(images_pptx_path, loop=loop)
+        prs = loop.run_until_complete(future)
+        assert isinstance(prs, Presentation)
+        assert len(prs.slides) == 4
+
+    def it_can_open_from_an_asyncio_stream(self, loop):
+        with open(images_pptx_path, 'rb') as f:
+            reader = _FakeStreamReader(f.read())
+        future = Presentation.open_async(reader, loop=loop)
+        prs = loop.run_until_complete(future)
+        assert len(prs.slides) == 4
+
+    def it_reports_a_failure_to_open(self, loop):
+        future = Presentation.open_async('foobar.pptx', loop=loop)
+        with pytest.raises(Exception):
+            loop.run_until_complete(future)
+
+
+class DescribeSaveAsync(object):
+
+    def it_saves_a_presentation_off_the_event_loop(self, loop):
+        prs = Presentation(images_pptx_path)
+        stream = StringIO()
+        loop.run_until_complete(prs.save_async(stream, loop=loop))
+        assert len(Presentation(StringIO(stream.getvalue())).slides) == 4
+
+    def it_writes_to_an_asyncio_stream_in_chunks(self, loop):
+        prs = Presentation(images_pptx_path)
+        writer = _FakeStreamWriter()
+        future = prs.save_async(writer, loop=loop, chunk_size=4096)
+        loop.run_until_complete(future)
+        assert len(writer.chunks) > 1
+        assert all(len(chunk) <= 4096 for chunk in writer.chunks)
+        assert writer.drain_count == len(writer.chunks)
+        blob = b''.join(writer.chunks)
+        assert len(Presentation(StringIO(blob)).slides) == 4
+
+
+# fixtures -----------------------------------------------------------
+
+@pytest.fixture
+def loop(request):
+    loop = asyncio.new_event_loop()
+    request.addfinalizer(loop.close)
+    return loop
+
+
+class _FakeStreamReader(object):
+    def __init__(self, blob):
+        self._blob = blob
+
+    if asyncio is not None:
+        @asyncio.coroutine
+        def read(self):
+            return self._blob
+
+
+class _FakeStreamWriter(object):
+    def __init__(self):
+        self.chunks = []
+        self.drain_count = 0
+
+    def write(self, data):
+        self.chunks.append(data)
+
+    if asyncio is not None:
+        @asyncio.coroutine
+        def drain(self):
+            self.drain_count += 1
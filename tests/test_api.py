@@ -6,12 +6,25 @@ Test suite for pptx.api module
 
 from __future__ import absolute_import, print_function
 
+import shutil
+
 import pytest
 
-from pptx.api import Presentation
+from zipfile import ZipFile
+
+from pptx.api import (
+    Presentation, read_core_properties, update_core_properties
+)
 from pptx.parts.presentation import PresentationPart
 
-from .unitutil import call, property_mock
+from .unitutil import absjoin, call, property_mock, test_file_dir
+
+
+test_pptx_path = absjoin(test_file_dir, 'test.pptx')
+no_core_props_pptx_path = absjoin(test_file_dir, 'no-core-props.pptx')
+images_pptx_path = absjoin(test_file_dir, 'with_images.pptx')
+monty_truth_path = absjoin(test_file_dir, 'monty-truth.png')
+python_powered_path = absjoin(test_file_dir, 'python-powered.png')
 
 
 class DescribePresentation(object):
@@ -36,6 +49,47 @@ class DescribePresentation(object):
         prs.slide_height = slide_height
         assert part_slide_height_.mock_calls == [call(slide_height)]
 
+    def it_can_leave_parts_unloaded_until_saved(self, tmpdir):
+        path = str(tmpdir.join('with_images.pptx'))
+        shutil.copy(images_pptx_path, path)
+        prs = Presentation(
+            path, load=lambda partname, ct: not ct.startswith('image/')
+        )
+        prs.slides.add_slide(prs.slide_layouts[6])
+        prs.save(path)
+        src, zipf = ZipFile(images_pptx_path), ZipFile(path)
+        media = [n for n in src.namelist() if n.startswith('ppt/media/')]
+        assert media
+        assert all(zipf.read(n) == src.read(n) for n in media)
+        assert len(Presentation(path).slides) == 5
+
+    def it_names_added_images_apart_from_unloaded_ones(self, tmpdir):
+        path = str(tmpdir.join('with_images.pptx'))
+        prs = Presentation(
+            images_pptx_path, load=lambda pn, ct: not ct.startswith('image/')
+        )
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_picture(python_powered_path, 0, 0)
+        slide.shapes.add_picture(monty_truth_path, 0, 0)
+        prs.save(path)
+        names = ZipFile(path).namelist()
+        assert len(names) == len(set(names))
+        assert len(
+            [n for n in names if n.startswith('ppt/media/')]
+        ) == 9
+        assert len(Presentation(path).slides) == 5
+
+    def it_can_find_and_replace_text_on_its_slides(self):
+        prs = Presentation(test_pptx_path)
+        matches = prs.find('Title')
+        assert [(m.slide_index, m.shape_name) for m in matches] == [
+            (0, 'Title 1')
+        ]
+        assert prs.replace('Title Text', 'Heading') == 1
+        assert [m.paragraph_text for m in prs.find('Heading')] == [
+            'Presentation Heading'
+        ]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -77,3 +131,52 @@ class DescribePresentation(object):
     @pytest.fixture
     def slide_width(self):
         return 9876543
+
+
+class DescribeReadCoreProperties(object):
+
+    def it_reads_the_core_properties_of_a_package(self):
+        core_props = read_core_properties(test_pptx_path)
+        expected = Presentation(test_pptx_path).core_properties
+        assert core_props.title == expected.title == 'Presentation'
+        assert core_props.modified == expected.modified
+
+    def it_provides_default_properties_when_the_part_is_missing(self):
+        core_props = read_core_properties(no_core_props_pptx_path)
+        assert core_props.title == ''
+
+
+class DescribeUpdateCoreProperties(object):
+
+    def it_rewrites_only_the_core_properties_member(self, pptx_copy):
+        src_path, path = pptx_copy
+        update_core_properties(path, title=u'Foobar', revision=42)
+        core_props = Presentation(path).core_properties
+        assert core_props.title == u'Foobar'
+        assert core_props.revision == 42
+        src, zipf = ZipFile(src_path), ZipFile(path)
+        changed = [
+            name for name in src.namelist()
+            if src.read(name) != zipf.read(name)
+        ]
+        assert changed in ([], ['docProps/core.xml'])
+        assert zipf.testzip() is None
+
+    def it_adds_a_core_properties_part_when_missing(self, tmpdir):
+        path = str(tmpdir.join('no-core-props.pptx'))
+        shutil.copy(no_core_props_pptx_path, path)
+        update_core_properties(path, title=u'Foobar')
+        assert Presentation(path).core_properties.title == u'Foobar'
+
+    def it_raises_on_an_unknown_property_name(self, pptx_copy):
+        src_path, path = pptx_copy
+        with pytest.raises(TypeError):
+            update_core_properties(path, foobar=u'baz')
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def pptx_copy(self, tmpdir):
+        path = str(tmpdir.join('test.pptx'))
+        shutil.copy(test_pptx_path, path)
+        return test_pptx_path, path
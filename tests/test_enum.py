@@ -75,6 +75,13 @@ class DescribeEnumeration(object):
     def it_can_be_referred_to_by_a_convenience_alias_if_defined(self):
         assert BARFOO is FOOBAR  # noqa
 
+    def it_generates_its_docs_page_when_asked_for_it(self):
+        assert '__docs_rst__' not in FOOBAR.__dict__
+        docs_rst = FOOBAR.__docs_rst__
+        assert docs_rst.startswith('.. _MsoFoobar:\n\n``FOOBAR``\n')
+        assert 'Enumeration docstring' in docs_rst
+        assert 'READ_WRITE\n    Readable and settable\n' in docs_rst
+
 
 class DescribeEnumValue(object):
 
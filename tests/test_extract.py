@@ -0,0 +1,147 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.extract module
+"""
+
+from __future__ import absolute_import, print_function
+
+import json
+
+from StringIO import StringIO
+
+from pptx.api import Presentation
+from pptx.extract import (
+    iter_text, main, _paragraph_text, slide_partnames, summarize, TextRecord
+)
+from pptx.opc.phys_pkg import PhysPkgReader
+from pptx.oxml.ns import nsdecls
+from pptx.oxml import parse_xml_bytes
+
+from .unitutil import absjoin, test_file_dir
+
+
+test_pptx_path = absjoin(test_file_dir, 'test.pptx')
+test_slides_path = absjoin(test_file_dir, 'test_slides.pptx')
+dir_pkg_path = absjoin(test_file_dir, 'expanded_pptx')
+images_pptx_path = absjoin(test_file_dir, 'with_images.pptx')
+no_core_props_path = absjoin(test_file_dir, 'no-core-props.pptx')
+
+
+class DescribeIterText(object):
+
+    def it_generates_a_record_for_each_paragraph(self):
+        records = list(iter_text(test_pptx_path))
+        assert records == [
+            TextRecord(0, 2, 'Title 1', 'Presentation Title Text'),
+            TextRecord(0, 3, 'Subtitle 2', 'Subtitle Text'),
+        ]
+
+    def it_can_read_an_expanded_package_directory(self):
+        records = list(iter_text(dir_pkg_path))
+        assert [r.paragraph_text for r in records] == [
+            'Presentation Title Text', 'Subtitle Text'
+        ]
+
+    def it_includes_text_in_groups_and_tables(self):
+        records = list(iter_text(test_slides_path))
+        texts = [(r.shape_name, r.paragraph_text) for r in records]
+        assert ('TextBox 9', 'Group test text') in texts
+        assert ('Table 15', 'Cell text 2') in texts
+
+    def it_visits_slides_in_presentation_order(self):
+        prs = Presentation(test_pptx_path)
+        layout = prs.slide_layouts[5]
+        for title in ('Second', 'Third'):
+            slide = prs.slides.add_slide(layout)
+            slide.shapes.title.textframe.text = title
+            paragraph = slide.shapes.title.textframe.add_paragraph()
+            paragraph.text = 'line'
+        prs.slides.move(prs.slides[2], 0)
+        stream = StringIO()
+        prs.save(stream)
+
+        records = list(iter_text(stream))
+        assert [(r.slide_index, r.paragraph_text) for r in records] == [
+            (0, 'Third'), (0, 'line'),
+            (1, 'Presentation Title Text'), (1, 'Subtitle Text'),
+            (2, 'Second'), (2, 'line'),
+        ]
+
+
+class DescribeSummarize(object):
+
+    def it_summarizes_a_presentation(self):
+        summary = summarize(images_pptx_path)
+        assert summary['slide_count'] == 4
+        assert summary['slides'][0] == [
+            'with_images.pptx',
+            'containing multiple images, some placed multiple times',
+        ]
+        assert len(summary['images']) == 6
+        assert len(set(summary['images'])) == 6
+        core_properties = summary['core_properties']
+        assert core_properties['author'] == 'Steve Canny'
+        assert core_properties['created'] == '2013-01-16T02:11:32'
+        assert core_properties['revision'] == 4
+
+    def it_has_no_core_properties_when_the_part_is_missing(self):
+        summary = summarize(no_core_props_path)
+        assert summary['core_properties'] == {}
+        assert summary['slide_count'] == 1
+
+
+class DescribeMain(object):
+
+    def it_writes_a_json_line_for_each_file(self, capsys, tmpdir):
+        bad_path = str(tmpdir.join('bad.pptx'))
+        with open(bad_path, 'w') as f:
+            f.write('not a zip file')
+        paths = [test_pptx_path, bad_path, images_pptx_path]
+
+        status = main(['-j', '1'] + paths)
+
+        out, err = capsys.readouterr()
+        summaries = [json.loads(line) for line in out.splitlines()]
+        assert [s['path'] for s in summaries] == [
+            test_pptx_path, images_pptx_path
+        ]
+        assert 'skipped %s' % bad_path in err
+        assert '3 files (1 skipped)' in err
+        assert status == 1
+
+    def it_searches_directories_for_pptx_files(self, capsys, tmpdir):
+        sub_dir = tmpdir.mkdir('sub')
+        with open(test_pptx_path, 'rb') as f:
+            sub_dir.join('deck.pptx').write(f.read(), mode='wb')
+        tmpdir.join('notes.txt').write('foo')
+
+        status = main(['-j', '2', str(tmpdir)])
+
+        out, err = capsys.readouterr()
+        summaries = [json.loads(line) for line in out.splitlines()]
+        assert [s['path'] for s in summaries] == [
+            str(sub_dir.join('deck.pptx'))
+        ]
+        assert status == 0
+
+
+class DescribeParagraphText(object):
+
+    def it_joins_runs_and_fields_and_breaks_lines(self):
+        p = parse_xml_bytes(
+            '<a:p %s><a:r><a:t>foo</a:t></a:r><a:br/><a:fld><a:t>2</a:t>'
+            '</a:fld><a:r><a:t>bar</a:t></a:r></a:p>' % nsdecls('a')
+        )
+        assert _paragraph_text(p) == 'foo\n2bar'
+
+
+class DescribeSlidePartnames(object):
+
+    def it_lists_the_slide_partnames_in_presentation_order(self):
+        phys_reader = PhysPkgReader(test_slides_path)
+        try:
+            partnames = slide_partnames(phys_reader)
+        finally:
+            phys_reader.close()
+        assert partnames == ['/ppt/slides/slide1.xml']
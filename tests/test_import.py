@@ -0,0 +1,31 @@
+# encoding: utf-8
+
+"""
+Test suite for the modules loaded by ``import pptx``
+"""
+
+from __future__ import absolute_import
+
+import os
+import subprocess
+import sys
+
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class DescribeImportPptx(object):
+
+    def it_defers_modules_only_some_programs_need(self):
+        script = (
+            'import sys; import pptx; '
+            'print(" ".join(sorted(m for m in sys.modules if m in %r)))'
+            % (('PIL', 'PIL.Image', 'Image', 'pptx.spec', 'pptx.aio',
+                'pptx.search', 'pptx.textlayout'),)
+        )
+        process = subprocess.Popen(
+            [sys.executable, '-c', script], cwd=repo_dir,
+            stdout=subprocess.PIPE
+        )
+        output = process.communicate()[0]
+        assert process.returncode == 0
+        assert output.strip() == b''
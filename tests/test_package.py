@@ -6,6 +6,8 @@ Test suite for pptx.package module
 
 from __future__ import absolute_import, print_function
 
+import threading
+
 import pytest
 
 from pptx.package import Package
@@ -35,6 +37,51 @@ class DescribePackage(object):
         pkg = Package.open(images_pptx_path)
         assert len(pkg._images) == 7
 
+    def it_drops_images_no_longer_reachable_from_the_package(self):
+        pkg = Package.open(images_pptx_path)
+        slides = pkg.presentation.slides
+        slides.remove_slides([slides[1], slides[2], slides[3]])
+        assert len(pkg._images) == 1
+        assert pkg._images[0] in pkg.parts
+
+    def it_has_a_lock_that_does_nothing_by_default(self):
+        pkg = Package.open()
+        assert pkg.thread_safe is False
+        with pkg.lock:
+            pass
+
+    def it_has_a_real_lock_in_thread_safe_mode(self):
+        pkg = Package.open(thread_safe=True)
+        assert pkg.thread_safe is True
+        assert isinstance(pkg.lock, type(threading.RLock()))
+        # its lazy properties are computed under the same lock
+        assert pkg.__dict__['_lazyproperty_lock'] is pkg.lock
+
+    def it_allows_slides_to_be_built_from_several_threads(self):
+        pkg = Package.open(images_pptx_path, thread_safe=True)
+        prs = pkg.presentation
+        slide_layout = prs.slide_masters[0].slide_layouts[6]
+        image_path = absjoin(test_file_dir, 'monty-truth.png')
+        image_count = len(pkg._images)
+
+        def build_slides():
+            for _ in range(10):
+                slide = prs.slides.add_slide(slide_layout)
+                slide.shapes.add_picture(image_path, 0, 0)
+                slide.shapes.add_textbox(0, 0, 100, 100)
+
+        threads = [threading.Thread(target=build_slides) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        slides = list(prs.slides)
+        assert len(slides) == 44
+        assert len(set(slide.partname for slide in slides)) == 44
+        assert len(set(sldId.rId for sldId in prs.slides._sldIdLst)) == 44
+        assert len(pkg._images) == image_count + 1
+
     def it_provides_ref_to_package_presentation_part(self):
         pkg = Package.open()
         assert isinstance(pkg.presentation, PresentationPart)
@@ -0,0 +1,125 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.parallel module
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+
+from StringIO import StringIO
+
+import pytest
+
+from pptx.api import Presentation
+from pptx.parallel import build_deck, build_decks, BuildReport
+
+from .unitutil import absjoin, test_file_dir
+
+
+template_path = absjoin(test_file_dir, 'no-slides.pptx')
+image_path = absjoin(test_file_dir, 'python-icon.jpeg')
+
+
+def _text_of(shape):
+    return shape.textframe.paragraphs[0].runs[0].text
+
+
+def _title_only_builder(prs, spec):
+    slide = prs.slides.add_slide(prs.slide_layouts[5])
+    slide.shapes.title.textframe.text = spec['slides'][0]['title']
+
+
+class DescribeBuildDecks(object):
+
+    def it_builds_a_deck_for_each_spec(self, specs):
+        report = build_decks(template_path, specs, processes=1)
+        assert report.deck_count == 2
+        titles = [
+            _text_of(Presentation(StringIO(blob)).slides[0].shapes.title)
+            for blob in report.results
+        ]
+        assert titles == ['Deck 1', 'Deck 2']
+
+    def it_can_spread_the_work_over_worker_processes(self, specs):
+        report = build_decks(
+            template_path, specs, processes=2, builder=_title_only_builder
+        )
+        titles = [
+            _text_of(Presentation(StringIO(blob)).slides[0].shapes.title)
+            for blob in report.results
+        ]
+        assert titles == ['Deck 1', 'Deck 2']
+        assert report.processes == 2
+
+    def it_can_save_the_decks_to_a_directory(self, specs, tmpdir):
+        out_dir = str(tmpdir)
+        report = build_decks(template_path, specs, out_dir, processes=1)
+        assert report.results == [
+            os.path.join(out_dir, 'deck1.pptx'),
+            os.path.join(out_dir, 'second.pptx'),
+        ]
+        assert all(os.path.isfile(path) for path in report.results)
+
+    def it_reports_the_error_of_a_deck_that_fails(self, specs):
+        specs.insert(1, {'slides': [{'layout': 'No Such Layout'}]})
+        for processes in (1, 2):
+            report = build_decks(template_path, specs, processes=processes)
+            assert report.errors[0] is None
+            assert report.errors[1].startswith('KeyError')
+            assert report.errors[2] is None
+            assert report.results[1] is None
+            assert report.deck_count == 2
+
+
+class DescribeBuildDeck(object):
+
+    def it_adds_the_slides_described_by_the_spec(self):
+        prs = Presentation(template_path)
+        spec = {'slides': [
+            {'layout': 'Title Slide', 'title': 'Hello',
+             'placeholders': {1: 'World'}},
+            {'layout': 6,
+             'textboxes': [{'left': 0, 'top': 0, 'width': 100,
+                            'height': 100, 'text': 'box'}],
+             'tables': [{'left': 0, 'top': 0, 'width': 100, 'height': 100,
+                         'rows': [['a', 'b'], ['c']]}],
+             'pictures': [{'image': image_path, 'left': 0, 'top': 0}]},
+        ]}
+        build_deck(prs, spec)
+        slide_1, slide_2 = prs.slides
+        assert _text_of(slide_1.shapes.title) == 'Hello'
+        assert _text_of(slide_1.placeholders[1]) == 'World'
+        assert len(slide_2.shapes) == 3
+        textbox, table, picture = slide_2.shapes
+        assert _text_of(textbox) == 'box'
+        assert _text_of(table.cell(1, 0)) == 'c'
+        assert picture.shape_type is not None
+
+
+class DescribeBuildReport(object):
+
+    def it_provides_throughput_figures(self):
+        report = BuildReport(
+            [('a', 0.5, None), ('b', 1.5, None), (None, 0.1, 'KeyError: x')],
+            2.0, 2
+        )
+        assert report.results == ['a', 'b', None]
+        assert report.build_times == [0.5, 1.5, 0.1]
+        assert report.errors == [None, None, 'KeyError: x']
+        assert report.deck_count == 2
+        assert report.decks_per_second == 1.0
+        assert report.elapsed == 2.0
+        assert report.processes == 2
+
+
+# fixtures -----------------------------------------------------------
+
+@pytest.fixture
+def specs():
+    return [
+        {'slides': [{'layout': 'Title Only', 'title': 'Deck 1'}]},
+        {'filename': 'second.pptx',
+         'slides': [{'layout': 5, 'title': 'Deck 2'}]},
+    ]
@@ -0,0 +1,102 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.search module
+"""
+
+from __future__ import absolute_import, print_function
+
+import re
+
+import pytest
+
+from pptx.api import Presentation
+from pptx.oxml.shared import SubElement
+from pptx.search import TextIndex, TextMatch
+from pptx.util import Inches
+
+
+class DescribeTextIndex(object):
+
+    def it_finds_matches_on_each_slide(self, prs):
+        index = TextIndex(prs._presentation)
+        matches = index.find(r'fo+')
+        assert [(m.slide_index, m.shape_name, m.start, m.end)
+                for m in matches] == [
+            (0, 'TextBox 1', 0, 3), (0, 'TextBox 1', 8, 11),
+            (1, 'TextBox 1', 2, 4),
+        ]
+        assert isinstance(matches[0], TextMatch)
+        assert matches[0].slide is prs.slides[0]
+        assert matches[0].paragraph_text == 'foo bar foo baz'
+
+    def it_finds_a_match_that_spans_runs(self, prs):
+        matches = TextIndex(prs._presentation).find('Hello World')
+        assert [(m.slide_index, m.start, m.end) for m in matches] == [
+            (1, 5, 16)
+        ]
+
+    def it_replaces_matches_and_counts_them(self, prs):
+        index = TextIndex(prs._presentation)
+        count = index.replace(re.compile('fo+'), 'qux')
+        assert count == 3
+        assert texts(prs) == [
+            [[['qux bar qux baz']]],
+            [[['a qux', 'bar']], [['Say: Hel', 'lo', ' World', '!']]],
+        ]
+
+    def it_replaces_a_match_that_spans_runs(self, prs):
+        index = TextIndex(prs._presentation)
+        count = index.replace(r'Hello (\w+)', lambda m: m.group(1).upper())
+        assert count == 1
+        assert texts(prs)[1][1] == [['Say: WORLD', '!']]
+
+    def it_leaves_a_match_including_a_line_break(self, prs):
+        index = TextIndex(prs._presentation)
+        assert index.find('fo\nbar')
+        assert index.replace('fo\nbar', 'x') == 0
+
+    def it_reindexes_a_slide_whose_text_changed(self, prs):
+        index = TextIndex(prs._presentation)
+        assert len(index.find('fo+')) == 3
+        slide_text = index._slide_texts[prs.slides[1]]
+        prs.slides[0].shapes[0].textframe.text = 'no match'
+        assert len(index.find('fo+')) == 1
+        assert index._slide_texts[prs.slides[1]] is slide_text
+
+    def it_drops_slides_no_longer_in_the_presentation(self, prs):
+        index = TextIndex(prs._presentation)
+        index.find('x')
+        prs.slides.remove(prs.slides[0])
+        assert len(index.find('fo+')) == 1
+        assert list(index._slide_texts) == [prs.slides[0]]
+
+
+# fixtures -------------------------------------------------
+
+def texts(prs):
+    return [
+        [[[r.text for r in p.runs] for p in shape.textframe.paragraphs]
+         for shape in slide.shapes]
+        for slide in prs.slides
+    ]
+
+
+@pytest.fixture
+def prs():
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+    slide = prs.slides.add_slide(layout)
+    textbox = slide.shapes.add_textbox(0, 0, Inches(4), Inches(1))
+    textbox.textframe.text = 'foo bar foo baz'
+    slide = prs.slides.add_slide(layout)
+    textbox = slide.shapes.add_textbox(0, 0, Inches(4), Inches(1))
+    paragraph = textbox.textframe.paragraphs[0]
+    paragraph.text = 'a fo'
+    SubElement(paragraph._p, 'a:br')
+    paragraph.add_run().text = 'bar'
+    textbox = slide.shapes.add_textbox(0, 0, Inches(4), Inches(1))
+    textbox.textframe.set_paragraphs([
+        (['Say: Hel', ('lo', {'bold': True}), ' World', '!'], 0)
+    ])
+    return prs
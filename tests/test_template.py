@@ -0,0 +1,145 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.template module
+"""
+
+from __future__ import absolute_import, print_function
+
+import pytest
+
+from StringIO import StringIO
+
+from pptx.api import Presentation
+from pptx.oxml.ns import nsdecls
+from pptx.oxml import parse_xml_bytes
+from pptx.template import _normalize_runs, _resolve, Template
+from pptx.util import Inches
+
+
+class DescribeTemplate(object):
+
+    def it_replaces_tokens_with_context_values(self, template):
+        prs = template.render(context)
+        assert slide_texts(prs.slides[0]) == [
+            [['Dear Ada Lovelace', ',']], [['Total: 42']]
+        ]
+
+    def it_can_render_more_than_once(self, template):
+        template.render(context)
+        prs = template.render(dict(context, name='Grace Hopper'))
+        assert slide_texts(prs.slides[0])[0] == [['Dear Grace Hopper', ',']]
+
+    def it_repeats_a_slide_for_each_loop_item(self, template):
+        prs = template.render(context)
+        assert len(prs.slides) == 3
+        assert slide_texts(prs.slides[1])[0] == [['apple for Ada Lovelace']]
+        assert slide_texts(prs.slides[2])[0] == [['pear for Ada Lovelace']]
+
+    def it_repeats_a_table_row_for_each_loop_item(self, template):
+        prs = template.render(context)
+        table = prs.slides[1].shapes[1]
+        assert [row_texts(row) for row in table.rows] == [
+            ['Qty', 'Price'], ['1', '0.5'], ['3', '']
+        ]
+
+    def it_renders_no_slide_for_an_empty_loop(self, template):
+        prs = template.render(dict(context, fruits=[]))
+        assert len(prs.slides) == 1
+
+    def it_relates_the_slides_to_the_template_layouts(self, template):
+        prs = template.render(context)
+        stream = StringIO()
+        prs.save(stream)
+        prs = Presentation(stream)
+        assert [s.slide_layout.name for s in prs.slides] == ['Blank'] * 3
+
+    def it_raises_on_a_missing_name(self, template):
+        with pytest.raises(KeyError):
+            template.render({'fruits': []})
+
+    def it_raises_on_a_second_loop_on_a_slide(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        textbox = slide.shapes.add_textbox(0, 0, Inches(4), Inches(1))
+        textbox.textframe.text = '{{#each a}}{{#each b}}'
+        with pytest.raises(ValueError):
+            Template(saved(prs))
+
+
+class DescribeNormalizeRuns(object):
+
+    def it_joins_a_token_split_across_runs(self):
+        p = parse_xml_bytes(
+            '<a:p %s><a:r><a:t>x {{na</a:t></a:r><a:r><a:t>m</a:t></a:r><a:r>'
+            '<a:t>e}} y</a:t></a:r><a:br/><a:r><a:t>{{z}}</a:t></a:r></a:p>'
+            % nsdecls('a')
+        )
+        _normalize_runs(p)
+        assert [t.text for t in p.iter('{*}t')] == [
+            'x {{name}}', ' y', '{{z}}'
+        ]
+
+
+class DescribeResolve(object):
+
+    def it_looks_up_names_in_the_innermost_scope_first(self):
+        scopes = ({'a': 1}, {'a': 2, 'b': {'c': 3}})
+        assert _resolve('a', scopes) == 1
+        assert _resolve('b.c', scopes) == 3
+        assert _resolve('.', scopes) == {'a': 1}
+
+
+# fixtures -------------------------------------------------
+
+context = {
+    'name': 'Ada Lovelace',
+    'total': 42,
+    'fruits': ['apple', 'pear'],
+    'rows': [{'qty': 1, 'price': 0.5}, {'qty': 3, 'price': None}],
+}
+
+
+def row_texts(row):
+    return [
+        u''.join(r.text for p in cell.textframe.paragraphs for r in p.runs)
+        for cell in row.cells
+    ]
+
+
+def saved(prs):
+    stream = StringIO()
+    prs.save(stream)
+    stream.seek(0)
+    return stream
+
+
+def slide_texts(slide):
+    return [
+        [[r.text for r in p.runs] for p in shape.textframe.paragraphs]
+        for shape in slide.shapes if shape.has_textframe
+    ]
+
+
+@pytest.fixture
+def template():
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+    slide = prs.slides.add_slide(layout)
+    textbox = slide.shapes.add_textbox(0, 0, Inches(4), Inches(1))
+    textbox.textframe.set_paragraphs([
+        (['Dear {{na', ('me}}', {'bold': True}), ','], 0)
+    ])
+    textbox = slide.shapes.add_textbox(0, 0, Inches(4), Inches(1))
+    textbox.textframe.text = 'Total: {{ total }}'
+    slide = prs.slides.add_slide(layout)
+    textbox = slide.shapes.add_textbox(0, 0, Inches(4), Inches(1))
+    textbox.textframe.set_paragraphs(
+        ['{{#each fruits}}', '{{.}} for {{name}}']
+    )
+    table = slide.shapes.add_table(2, 2, 0, 0, Inches(4), Inches(1))
+    table.cell(0, 0).text = 'Qty'
+    table.cell(0, 1).text = 'Price'
+    table.cell(1, 0).text = '{{#each rows}}{{qty}}'
+    table.cell(1, 1).text = '{{price}}'
+    return Template(saved(prs))
@@ -8,13 +8,14 @@ from __future__ import absolute_import, print_function
 
 import pytest
 
+from pptx.api import Presentation
 from pptx.dml.color import ColorFormat
 from pptx.dml.fill import FillFormat
 from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE, PP_ALIGN
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import Part
 from pptx.oxml import parse_xml_bytes
-from pptx.oxml.ns import nsdecls, _nsmap as nsmap
+from pptx.oxml.ns import nsdecls, _nsmap as nsmap, qn
 from pptx.oxml.text import (
     CT_RegularTextRun, CT_TextCharacterProperties, CT_TextParagraph
 )
@@ -47,6 +48,13 @@ class DescribeTextFrame(object):
         assert len(TextFrame(txBody, None).paragraphs) == 1
         assert len(TextFrame(txBody_with_2_paras, None).paragraphs) == 2
 
+    def it_reuses_its_paragraph_proxies_while_they_are_alive(
+            self, txBody_with_2_paras):
+        textframe = TextFrame(txBody_with_2_paras, None)
+        paragraphs = textframe.paragraphs
+        assert textframe.paragraphs == paragraphs
+        assert paragraphs[0] is not paragraphs[1]
+
     def it_can_add_a_paragraph_to_the_text_it_contains(
             self, txBody, txBody_with_2_paras_xml):
         textframe = TextFrame(txBody, None)
@@ -59,6 +67,75 @@ class DescribeTextFrame(object):
         textframe.text = 'foobar'
         assert actual_xml(txBody) == txBody_with_text_xml
 
+    def it_can_replace_its_text_with_several_paragraphs(
+            self, set_paragraphs_fixture):
+        textframe, paragraphs, expected_xml = set_paragraphs_fixture
+        textframe.set_paragraphs(paragraphs)
+        assert actual_xml(textframe._txBody) == expected_xml
+
+    def it_leaves_its_text_unchanged_when_a_paragraph_is_bad(
+            self, txBody_with_2_paras, txBody_with_2_paras_xml):
+        textframe = TextFrame(txBody_with_2_paras, None)
+        with pytest.raises(ValueError):
+            textframe.set_paragraphs(['foo', ('bar', 9)])
+        with pytest.raises(ValueError):
+            textframe.set_paragraphs(['foo', ('bar', 0, {'color': 'red'})])
+        with pytest.raises(ValueError):
+            textframe.set_paragraphs([('foo', 0, {('bold', 'italic'): 1})])
+        assert actual_xml(textframe._txBody) == txBody_with_2_paras_xml
+
+    def it_can_fit_its_text_to_its_shape(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        textframe = slide.placeholders[1].textframe
+        textframe.set_paragraphs(
+            ['Lorem ipsum dolor sit amet consectetur adipiscing elit'] * 8
+        )
+        size = textframe.fit_text()
+        assert size == Pt(26)
+        assert [p.runs[0].font.size for p in textframe.paragraphs] == (
+            [Pt(26)] * 8
+        )
+        assert textframe.auto_size == MSO_AUTO_SIZE.NONE
+        textframe.text = 'Foo'
+        assert textframe.fit_text() == Pt(32)
+        assert textframe.fit_text(Pt(40)) == Pt(40)
+
+    def it_can_fit_text_to_a_table_cell(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        table = slide.shapes.add_table(
+            2, 2, Inches(1), Inches(1), Inches(4), Inches(1)
+        )
+        narrow, merged = table.cell(0, 0), table.cell(1, 0)
+        merged._tc.set('gridSpan', '2')
+        text = 'Lorem ipsum dolor sit amet consectetur adipiscing elit'
+        narrow.text = merged.text = text
+        assert narrow.textframe.fit_text(Pt(40)) < (
+            merged.textframe.fit_text(Pt(40))
+        )
+
+    def it_sizes_fields_line_breaks_and_empty_paragraphs_too(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        textframe = slide.shapes.add_textbox(
+            0, 0, Inches(3), Inches(2)
+        ).textframe
+        p = textframe.paragraphs[0]._p
+        p.append(parse_xml_bytes(
+            '<a:fld %s id="{1}" type="slidenum"><a:t>1</a:t></a:fld>'
+            % nsdecls('a')
+        ))
+        p.append(parse_xml_bytes('<a:br %s/>' % nsdecls('a')))
+        textframe.add_paragraph()
+        size = textframe.fit_text(Pt(30))
+        txBody = textframe._txBody
+        assert [rPr.get('sz') for rPr in txBody.iter(qn('a:rPr'))] == (
+            [str(size.centipoints)] * 2
+        )
+        endParaRPr = txBody.find('.//' + qn('a:endParaRPr'))
+        assert endParaRPr.get('sz') == str(size.centipoints)
+
     def it_can_get_its_margin_settings(
             self, txBody, txBody_with_lIns, txBody_with_tIns,
             txBody_with_rIns, txBody_with_bIns):
@@ -179,6 +256,33 @@ class DescribeTextFrame(object):
             bodyPr_bldr.with_child(a_normAutofit())
         return bodyPr_bldr
 
+    @pytest.fixture(params=[
+        ([], [(0, [])]),
+        (['foo'], [(0, [('foo', None)])]),
+        (['foo', ('bar', 1)], [(0, [('foo', None)]), (1, [('bar', None)])]),
+        ([('foo', long(2))], [(2, [('foo', None)])]),
+        ([('foo', 0, {'bold': True})], [(0, [('foo', an_rPr().with_b(1))])]),
+        ([(['foo', ('bar', {'italic': True})], 0,
+           {'size': Pt(12)})],
+         [(0, [('foo', an_rPr().with_sz(1200)),
+               ('bar', an_rPr().with_i(1).with_sz(1200))])]),
+    ])
+    def set_paragraphs_fixture(self, request, txBody_with_2_paras):
+        paragraphs, expected_paragraphs = request.param
+        textframe = TextFrame(txBody_with_2_paras, None)
+        txBody_bldr = a_txBody().with_nsdecls().with_child(a_bodyPr())
+        for level, runs in expected_paragraphs:
+            p_bldr = a_p()
+            if level:
+                p_bldr.with_child(a_pPr().with_lvl(level))
+            for text, rPr_bldr in runs:
+                r_bldr = an_r()
+                if rPr_bldr is not None:
+                    r_bldr.with_child(rPr_bldr)
+                p_bldr.with_child(r_bldr.with_child(a_t().with_text(text)))
+            txBody_bldr.with_child(p_bldr)
+        return textframe, paragraphs, txBody_bldr.xml()
+
     @pytest.fixture
     def textframe(self, txBody):
         return TextFrame(txBody, None)
@@ -807,6 +911,13 @@ class Describe_Run(object):
         _Font_.assert_called_once_with(rPr_)
         assert font == font_
 
+    def it_resolves_the_effective_font_of_the_run(self, request, run):
+        part_ = property_mock(request, _Run, 'part').return_value
+        effective_font_ = part_.package.text_styles.effective_font
+        effective_font = run.effective_font
+        effective_font_.assert_called_once_with(part_, None, None)
+        assert effective_font is effective_font_.return_value
+
     def it_provides_access_to_the_hyperlink_of_the_run(self, run):
         hlink = run.hyperlink
         assert isinstance(hlink, _Hyperlink)
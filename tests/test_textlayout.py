@@ -0,0 +1,130 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.textlayout module
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import struct
+
+import pytest
+
+from StringIO import StringIO
+
+from pptx.textlayout import (
+    FontMetrics, fit_font_size, font_metrics, register_font, text_height
+)
+from pptx.util import Inches, Pt
+
+
+class DescribeFontMetrics(object):
+
+    def it_measures_text_in_ems(self):
+        arial = font_metrics('Arial')
+        assert arial.width(u'Hello') == 2.278
+        assert font_metrics('Arial', bold=True).width(u'Hello') == 2.445
+
+    def it_falls_back_to_arial_for_an_unknown_typeface(self):
+        assert font_metrics('Foobar', italic=True) is font_metrics('Arial')
+
+    def it_can_load_metrics_from_a_font_file(self, ttf):
+        metrics = FontMetrics.from_file(StringIO(ttf))
+        assert metrics.width(u'ab') == 1.5
+        assert metrics.width(u'b\u2603') == 1.25
+        assert metrics.line_height == 1.25
+
+    def it_raises_on_a_file_that_is_not_a_font(self):
+        with pytest.raises(ValueError):
+            FontMetrics.from_file(StringIO(b'PK\x03\x04' + b'\x00' * 20))
+
+    def it_uses_a_registered_font_for_its_typeface(self, ttf):
+        register_font('Test Sans', StringIO(ttf))
+        metrics = font_metrics('test sans', bold=True)
+        assert metrics.width(u'a') == 1.0
+
+
+class DescribeTextHeight(object):
+
+    def it_measures_wrapped_lines(self, metrics):
+        paragraphs = [[(u'aa aa ', metrics), (u'aaaa', metrics)]]
+        # a line 1 inch wide is 2.5 ems at 0.4 inches, holding one 'aa',
+        # and 'aaaa' is broken across two lines
+        assert text_height(paragraphs, Inches(1), Inches(0.4)) == (
+            Inches(0.4) * 1.25 * 4
+        )
+        assert text_height(paragraphs, Inches(1), Inches(0.4), False) == (
+            Inches(0.4) * 1.25
+        )
+
+    def it_counts_line_breaks_and_empty_paragraphs(self, metrics):
+        paragraphs = [
+            [(u'a', metrics), (u'\n', metrics), (u'a', metrics)],
+            [(u'', metrics)],
+        ]
+        assert text_height(paragraphs, Inches(1), Pt(10)) == (
+            Pt(10) * 1.25 * 3
+        )
+
+
+class DescribeFitFontSize(object):
+
+    def it_finds_the_largest_size_that_fits(self, metrics):
+        paragraphs = [[(u'a a a a', metrics)]]
+        # a 3-inch line is 6 ems at 36pt, taking 'a a a', and two lines
+        # are 2.5 ems high, which is 1.25 inches at 36pt
+        size = fit_font_size(paragraphs, Inches(3), Inches(1.25), Pt(72))
+        assert size == Pt(36)
+
+    def it_wont_exceed_the_max_size(self, metrics):
+        paragraphs = [[(u'a', metrics)]]
+        assert fit_font_size(paragraphs, Inches(9), Inches(9), Pt(20)) == (
+            Pt(20)
+        )
+
+    def it_keeps_unwrapped_lines_within_the_width(self, metrics):
+        paragraphs = [[(u'a a a a', metrics)]]
+        # the line is 6.25 ems wide, 3 inches is 6.25 ems at 34.56pt
+        size = fit_font_size(
+            paragraphs, Inches(3), Inches(9), Pt(72), wrap=False
+        )
+        assert size == Pt(34)
+
+
+# fixtures -------------------------------------------------
+
+@pytest.fixture
+def metrics(ttf):
+    return FontMetrics.from_file(StringIO(ttf))
+
+
+@pytest.fixture
+def ttf():
+    """
+    A font file having the tables FontMetrics reads, 1000 units per em,
+    with 'a' 1000 units wide, 'b' 500 wide and the notdef glyph 750.
+    """
+    head = b'\x00' * 18 + struct.pack('>H', 1000) + b'\x00' * 34
+    hhea = (
+        b'\x00' * 4 + struct.pack('>hhh', 900, -250, 100) + b'\x00' * 24 +
+        struct.pack('>H', 3)
+    )
+    hmtx = struct.pack('>HhHhHh', 750, 0, 1000, 0, 500, 0)
+    # one segment mapping 'a'-'b' to glyphs 1-2, and the end segment
+    segments = struct.pack(
+        '>9H', 0x62, 0xFFFF, 0, 0x61, 0xFFFF, (1 - 0x61) & 0xFFFF, 1, 0, 0
+    )
+    subtable = struct.pack(
+        '>7H', 4, 14 + len(segments), 0, 4, 4, 1, 0
+    ) + segments
+    cmap = struct.pack('>HHHHL', 0, 1, 3, 1, 12) + subtable
+    tables = [(b'cmap', cmap), (b'head', head), (b'hhea', hhea),
+              (b'hmtx', hmtx)]
+    offset = 12 + 16 * len(tables)
+    directory, data = b'', b''
+    for tag, table in tables:
+        directory += struct.pack('>4sLLL', tag, 0, offset + len(data),
+                                 len(table))
+        data += table
+    return struct.pack('>4sHHHH', b'\x00\x01\x00\x00', len(tables), 0, 0,
+                       0) + directory + data
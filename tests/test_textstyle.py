@@ -0,0 +1,84 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.textstyle module
+"""
+
+from __future__ import absolute_import, print_function
+
+import pytest
+
+from pptx.api import Presentation
+from pptx.oxml.ns import qn
+from pptx.oxml.shared import SubElement
+from pptx.textstyle import EffectiveFont
+from pptx.util import Inches, Pt
+
+
+class DescribeTextStyles(object):
+
+    def it_resolves_a_title_from_the_master_title_style(self, slide):
+        run = slide.shapes.title.textframe.paragraphs[0].runs[0]
+        assert run.effective_font == EffectiveFont(
+            False, False, Pt(44), 'Calibri'
+        )
+
+    def it_resolves_each_body_level_from_the_master_body_style(self, slide):
+        paragraphs = slide.placeholders[1].textframe.paragraphs
+        assert [p.runs[0].effective_font.size for p in paragraphs] == [
+            Pt(32), Pt(28)
+        ]
+
+    def it_prefers_the_run_then_paragraph_then_shape_values(self, slide):
+        textframe = slide.placeholders[1].textframe
+        paragraph = textframe.paragraphs[0]
+        run = paragraph.runs[0]
+        lvl1pPr = SubElement(
+            textframe._txBody.find(qn('a:lstStyle')), 'a:lvl1pPr'
+        )
+        SubElement(lvl1pPr, 'a:defRPr', i='1', sz='2000')
+        paragraph.font.size = Pt(24)
+        run.font.name = 'Arial'
+        assert run.effective_font == EffectiveFont(
+            False, True, Pt(24), 'Arial'
+        )
+        run.font.size = Pt(12)
+        assert run.effective_font.size == Pt(12)
+
+    def it_inherits_from_the_layout_placeholder(self, prs, slide):
+        layout_ph = prs.slide_layouts[1].placeholders[1]
+        lstStyle = layout_ph.textframe._txBody.find(qn('a:lstStyle'))
+        SubElement(SubElement(lstStyle, 'a:lvl2pPr'), 'a:defRPr', b='1')
+        prs._package.text_styles.clear()
+        paragraphs = slide.placeholders[1].textframe.paragraphs
+        assert [p.effective_font.bold for p in paragraphs] == [False, True]
+
+    def it_resolves_a_textbox_from_the_default_text_style(self, slide):
+        textbox = slide.shapes.add_textbox(0, 0, Inches(1), Inches(1))
+        textbox.textframe.text = 'foo'
+        run = textbox.textframe.paragraphs[0].runs[0]
+        assert run.effective_font == EffectiveFont(
+            False, False, Pt(18), 'Calibri'
+        )
+
+    def it_caches_the_inherited_style_per_placeholder_and_level(
+            self, prs, slide):
+        text_styles = prs._package.text_styles
+        for paragraph in slide.placeholders[1].textframe.paragraphs:
+            paragraph.effective_font
+        assert sorted(
+            key[1:] for key in text_styles._inherited_cache
+        ) == [('obj', 1, 0), ('obj', 1, 1)]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def prs(self):
+        return Presentation()
+
+    @pytest.fixture
+    def slide(self, prs):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.textframe.text = 'Title'
+        slide.placeholders[1].textframe.set_paragraphs(['foo', ('bar', 1)])
+        return slide
@@ -0,0 +1,97 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.transform module
+"""
+
+from __future__ import absolute_import, print_function
+
+import shutil
+
+from StringIO import StringIO
+from zipfile import ZipFile
+
+from lxml import etree
+
+from pptx.api import Presentation
+from pptx.oxml.ns import nsdecls
+from pptx.transform import rewrite_text, rewrite_text_files, _rewrite_xml
+
+from .unitutil import absjoin, test_file_dir
+
+
+test_pptx_path = absjoin(test_file_dir, 'test.pptx')
+images_pptx_path = absjoin(test_file_dir, 'with_images.pptx')
+
+
+class DescribeRewriteText(object):
+
+    def it_rewrites_the_text_on_each_slide(self):
+        stream = StringIO()
+        rewrite_text(test_pptx_path, lambda text: text.upper(), stream)
+        prs = Presentation(stream)
+        assert slide_texts(prs) == ['PRESENTATION TITLE TEXT', 'SUBTITLE TEXT']
+
+    def it_copies_the_other_members_unchanged(self):
+        stream = StringIO()
+        rewrite_text(images_pptx_path, lambda text: text, stream)
+        src, dst = ZipFile(images_pptx_path), ZipFile(stream)
+        assert dst.namelist() == src.namelist()
+        for name in src.namelist():
+            if name.startswith('ppt/slides/slide'):
+                assert c14n(dst.read(name)) == c14n(src.read(name))
+            else:
+                assert dst.read(name) == src.read(name)
+
+    def it_can_rewrite_a_file_in_place(self, tmpdir):
+        path = str(tmpdir.join('test.pptx'))
+        shutil.copy(test_pptx_path, path)
+        rewrite_text(path, lambda text: u'x')
+        assert slide_texts(Presentation(path)) == ['x', 'x']
+
+
+class DescribeRewriteTextFiles(object):
+
+    def it_rewrites_each_file_and_reports_errors(self, tmpdir):
+        dst = str(tmpdir.join('out.pptx'))
+        missing = str(tmpdir.join('missing.pptx'))
+        results = list(rewrite_text_files(
+            [(test_pptx_path, dst), (missing, None)], redact, processes=1
+        ))
+        assert results[0] == (test_pptx_path, None)
+        assert results[1][0] == missing
+        assert results[1][1].startswith('IOError')
+        assert slide_texts(Presentation(dst))[0] == u'*' * 23
+
+
+class DescribeRewriteXml(object):
+
+    def it_replaces_the_text_of_each_t_element(self):
+        xml = (
+            b'<p:sld %s><p:x r:id="&quot;1"/><a:t>a &lt; b</a:t><a:p><a:t/>'
+            b'<q xmlns="urn:q"><a:t>c</a:t></q><!-- d --></a:p></p:sld>' %
+            nsdecls('a', 'p', 'r')
+        )
+        blob = _rewrite_xml(StringIO(xml), lambda text: text + u'!')
+        assert blob.startswith(b"<?xml version='1.0' encoding='UTF-8' stan")
+        assert c14n(blob) == c14n(
+            xml.replace(b'a &lt; b', b'a &lt; b!').replace(b'>c<', b'>c!<')
+        )
+
+
+# fixtures -------------------------------------------------
+
+def c14n(blob):
+    return etree.tostring(etree.fromstring(blob), method='c14n')
+
+
+def redact(text):
+    return u'*' * len(text)
+
+
+def slide_texts(prs):
+    return [
+        r.text for slide in prs.slides for shape in slide.shapes
+        if shape.has_textframe for p in shape.textframe.paragraphs
+        for r in p.runs
+    ]
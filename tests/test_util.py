@@ -4,11 +4,16 @@
 
 from __future__ import absolute_import
 
+import gc
 import platform
 import pytest
+import threading
+import time
+import weakref
 
 from pptx.util import (
-    BaseLength, Centipoints, Cm, Collection, Emu, Inches, Mm, Pt, Px,
+    BaseLength, cached_element_proxy, cached_proxy, Centipoints, Cm,
+    Collection, Emu, Inches, lazyproperty, lock_lazyproperties, Mm, Pt, Px,
     to_unicode
 )
 
@@ -21,6 +26,116 @@ def test_to_unicode_raises_on_non_string():
         to_unicode(999)
 
 
+class _Owner(object):
+    pass
+
+
+def test_lazyproperty_computes_once_when_threads_race():
+    calls = []
+    entered, release = threading.Event(), threading.Event()
+
+    class Foo(object):
+        @lazyproperty
+        def bar(self):
+            calls.append(None)
+            entered.set()
+            release.wait(5)
+            return object()
+
+    owner = _Owner()
+    lock_lazyproperties(owner)
+    foo = Foo()
+    values = []
+    threads = [
+        threading.Thread(target=lambda: values.append(foo.bar))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    entered.wait(5)
+    time.sleep(0.05)  # let the other threads reach the property
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert len(set(id(value) for value in values)) == 1
+    assert foo.bar is values[0]
+
+
+def test_lazyproperty_takes_no_lock_until_asked_to():
+    class Foo(object):
+        @lazyproperty
+        def bar(self):
+            return 42
+
+    gc.collect()  # drop thread-safe packages left over from other tests
+    foo = Foo()
+    assert foo.bar == 42
+    assert '_lazyproperty_lock' not in foo.__dict__
+    owner = _Owner()
+    lock = threading.RLock()
+    lock_lazyproperties(owner, lock)
+    assert Foo().bar == 42
+    assert owner.__dict__['_lazyproperty_lock'] is lock
+
+
+def test_cached_proxy_returns_the_live_proxy_for_an_element():
+    class Proxy(object):
+        def __init__(self, element, parent):
+            self.element, self.parent = element, parent
+
+    element, other = [], []
+    proxy = cached_proxy(Proxy, element, 'parent')
+    assert proxy.element is element and proxy.parent == 'parent'
+    assert cached_proxy(Proxy, element, 'parent') is proxy
+    # a proxy is never handed back attached to the wrong parent
+    other_parent = cached_proxy(Proxy, element, 'other parent')
+    assert other_parent is not proxy and other_parent.parent == 'other parent'
+    # equal but distinct elements get their own proxy
+    assert cached_proxy(Proxy, other, 'parent') is not proxy
+    # the cache doesn't keep a proxy alive
+    proxy_ref = weakref.ref(proxy)
+    del proxy
+    assert proxy_ref() is None
+
+
+def test_cached_element_proxy_is_keyed_on_the_element_alone():
+    class Proxy(object):
+        def __init__(self, element, parent):
+            self.element, self.parent = element, parent
+
+    element = []
+    proxy = cached_element_proxy(Proxy, element, 'parent')
+    assert cached_element_proxy(Proxy, element, 'other parent') is proxy
+    assert proxy.parent == 'parent'
+    assert cached_element_proxy(Proxy, [], 'parent') is not proxy
+
+
+def test_cached_proxy_can_be_used_from_several_threads(monkeypatch):
+    class Proxy(object):
+        def __init__(self, element):
+            self.element = element
+
+    monkeypatch.setattr('pptx.util._purge_size', 0)
+    elements = [[] for _ in range(200)]
+    errors = []
+
+    def navigate():
+        try:
+            for _ in range(20):
+                for element in elements:
+                    cached_proxy(Proxy, element)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=navigate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
 class TestCollection(TestCase):
     """Test Collection"""
     def setUp(self):